@@ -0,0 +1,259 @@
+"""서비스 간 호출용 API 키 인증.
+
+내부 배치 서비스처럼 초당 수천 번 호출하는 클라이언트는 JWT 발급/검증 대신
+고정 API 키를 사용합니다. 키 원문은 저장하지 않고 SHA-256 다이제스트만
+메모리 인덱스에 미리 로드하므로, 요청마다의 비용은 해시 한 번과 dict 조회
+한 번입니다 (bcrypt 없음).
+
+- 키 형식: ``ak_<key_id>.<secret>`` (``key_id``로 O(1) 조회, 다이제스트는
+  ``hmac.compare_digest``로 상수 시간 비교)
+- 역할: 키마다 ``UserRole`` 값 하나 (``require_role(..., source=get_api_key_payload)``)
+- 폐기: 키 파일에서 제거하거나 ``"disabled": true``로 표시한 뒤 재로드, 또는
+  ``api_key_store.revoke(key_id)``로 즉시 폐기 (프로세스 수명 동안 유지)
+- 재로드: 새 인덱스를 만든 뒤 참조만 교체 (요청 경로는 잠금 없음)
+
+키 파일 (JSON):
+    {
+      "keys": [
+        {"id": "batch-ingest", "sha256": "<키 전체의 SHA-256 hex>",
+         "role": "user", "name": "배치 적재 서비스"}
+      ]
+    }
+
+새 키 발급 (원문은 한 번만 출력되며 파일에는 다이제스트만 기록):
+    cd templates
+    python -m backend.auth.api_keys batch-ingest --role user
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import re
+import secrets
+import sys
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .jwt_handler import TokenPayload
+
+logger = logging.getLogger(__name__)
+
+API_KEY_PREFIX = "ak_"
+_KEY_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+# API 키 주체는 만료가 없으므로 exp는 표현 가능한 최대 시각
+_NEVER = datetime.max.replace(tzinfo=UTC)
+
+
+def digest_api_key(api_key: str) -> bytes:
+    """API 키 전체의 SHA-256 다이제스트를 반환합니다."""
+    return hashlib.sha256(api_key.encode()).digest()
+
+
+def generate_api_key(key_id: str) -> str:
+    """새 API 키를 생성합니다 (원문은 발급 시에만 확인 가능).
+
+    Raises:
+        ValueError: key_id 형식 오류 (영문, 숫자, ``_``, ``-``, 최대 64자)
+    """
+    if not _KEY_ID_PATTERN.fullmatch(key_id):
+        raise ValueError(f"Invalid API key id: {key_id!r}")
+    return f"{API_KEY_PREFIX}{key_id}.{secrets.token_urlsafe(32)}"
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeyEntry:
+    """인덱스에 보관되는 API 키 (원문 없음)."""
+
+    key_id: str
+    digest: bytes
+    role: str
+    name: str
+    # 의존성이 반환하는 주체 (로드 시 한 번 생성하여 요청마다 재사용)
+    payload: TokenPayload
+
+
+class ApiKeyIndex:
+    """key_id → ApiKeyEntry 불변 인덱스.
+
+    Args:
+        entries: API 키 목록
+    """
+
+    def __init__(self, entries: Iterable[ApiKeyEntry] = ()) -> None:
+        self._entries: dict[str, ApiKeyEntry] = {}
+        for entry in entries:
+            if entry.key_id in self._entries:
+                raise ValueError(f"Duplicate API key id: {entry.key_id}")
+            self._entries[entry.key_id] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key_id: str) -> bool:
+        return key_id in self._entries
+
+    def authenticate(self, api_key: str) -> Optional[ApiKeyEntry]:
+        """API 키를 확인하고 일치하는 항목을 반환합니다 (없으면 None)."""
+        if not api_key.startswith(API_KEY_PREFIX):
+            return None
+        key_id, sep, _ = api_key[len(API_KEY_PREFIX) :].partition(".")
+        entry = self._entries.get(key_id) if sep else None
+        if entry is None:
+            return None
+        if not hmac.compare_digest(digest_api_key(api_key), entry.digest):
+            return None
+        return entry
+
+    def without(self, key_ids: Collection[str]) -> "ApiKeyIndex":
+        """주어진 key_id를 제외한 새 인덱스를 반환합니다."""
+        return ApiKeyIndex(e for k, e in self._entries.items() if k not in key_ids)
+
+    @classmethod
+    def from_document(cls, document: Any, roles: Optional[Collection[str]] = None) -> "ApiKeyIndex":
+        """키 파일 JSON 문서로 인덱스를 생성합니다 (형식은 모듈 docstring 참고).
+
+        Args:
+            document: ``{"keys": [...]}``
+            roles: 허용할 역할 (None이면 검사 생략)
+
+        Raises:
+            ValueError: 형식 오류, 중복 key_id, 알 수 없는 역할
+            KeyError: 필수 필드(``id``, ``role``, ``sha256``) 누락
+        """
+        keys = document.get("keys", []) if isinstance(document, dict) else None
+        if not isinstance(keys, list):
+            raise ValueError('API key file must be an object with a "keys" list')
+        loaded_at = datetime.now(UTC)
+        entries = []
+        for raw in keys:
+            if not isinstance(raw, dict):
+                raise ValueError(f"API key entry must be an object: {raw!r}")
+            if raw.get("disabled"):
+                continue
+            key_id, role, sha256 = raw["id"], raw["role"], raw["sha256"]
+            name = raw.get("name", key_id)
+            if not all(isinstance(v, str) for v in (key_id, role, sha256, name)):
+                raise ValueError(f"API key fields must be strings: {key_id!r}")
+            if not _KEY_ID_PATTERN.fullmatch(key_id):
+                raise ValueError(f"Invalid API key id: {key_id!r}")
+            if roles is not None and role not in roles:
+                raise ValueError(f"Unknown role for API key {key_id}: {role}")
+            digest = bytes.fromhex(sha256)
+            if len(digest) != hashlib.sha256().digest_size:
+                raise ValueError(f"Invalid sha256 digest for API key {key_id}")
+            payload = TokenPayload(
+                sub=f"api_key:{key_id}",
+                exp=_NEVER,
+                iat=loaded_at,
+                jti=f"api_key:{key_id}",
+                role=role,
+                token_type="api_key",  # noqa: S106 - 토큰 종류, 비밀값 아님
+            )
+            entries.append(ApiKeyEntry(key_id, digest, role, name, payload))
+        return cls(entries)
+
+
+class ApiKeyStore:
+    """API 키 파일을 로드하여 인덱스를 공유하고, 변경 시 원자적으로 교체합니다.
+
+    Args:
+        path: 키 파일 경로
+        roles: 허용할 역할 (None이면 검사 생략)
+    """
+
+    def __init__(self, path: str | Path, roles: Optional[Collection[str]] = None) -> None:
+        self.path = Path(path)
+        self.roles = roles
+        # 요청 경로에서 읽는 현재 인덱스. 재로드/폐기 시 참조만 교체합니다.
+        self.current = ApiKeyIndex()
+        self._revoked: set[str] = set()
+        self._mtime: Optional[float] = None
+
+    def load(self) -> ApiKeyIndex:
+        """키 파일을 로드하여 현재 인덱스로 교체합니다.
+
+        Raises:
+            OSError: 파일을 읽을 수 없음
+            ValueError: 형식 오류 (JSON 오류 포함)
+        """
+        mtime = self.path.stat().st_mtime
+        try:
+            document = json.loads(self.path.read_text())
+            index = ApiKeyIndex.from_document(document, self.roles)
+        except KeyError as e:
+            raise ValueError(f"Missing field in API key file: {e.args[0]}") from None
+        self.current = index.without(self._revoked)
+        self._mtime = mtime
+        return self.current
+
+    def reload(self) -> bool:
+        """키 파일을 다시 로드합니다. 실패하면 기존 인덱스를 유지합니다.
+
+        Returns:
+            교체 성공 여부
+        """
+        try:
+            self.load()
+        except (ValueError, OSError):
+            logger.exception("API key reload failed; keeping previous keys")
+            return False
+        logger.info("API keys reloaded (%d keys)", len(self.current))
+        return True
+
+    def revoke(self, key_id: str) -> None:
+        """키를 즉시 폐기합니다 (재로드 후에도 프로세스 수명 동안 유지).
+
+        워커/인스턴스 간에 영구히 폐기하려면 키 파일에서도 제거하세요.
+        """
+        self._revoked.add(key_id)
+        self.current = self.current.without({key_id})
+
+    async def watch(self, interval: float = 2.0) -> None:
+        """키 파일의 변경을 주기적으로 확인하여 재로드합니다 (lifespan 태스크).
+
+        Args:
+            interval: 확인 주기 (초)
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError:
+                continue
+            if mtime != self._mtime:
+                self._mtime = mtime
+                self.reload()
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 상태를 딕셔너리로 반환합니다."""
+        return {"keys": len(self.current), "revoked": len(self._revoked)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="새 API 키를 발급합니다.")
+    parser.add_argument("key_id")
+    parser.add_argument("--role", default="user")
+    parser.add_argument("--name", default=None)
+    args = parser.parse_args()
+
+    api_key = generate_api_key(args.key_id)
+    entry = {
+        "id": args.key_id,
+        "sha256": digest_api_key(api_key).hex(),
+        "role": args.role,
+        "name": args.name or args.key_id,
+    }
+    sys.stdout.write(f"API key (store securely, shown once): {api_key}\n")
+    sys.stdout.write("Add to the API key file:\n")
+    sys.stdout.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
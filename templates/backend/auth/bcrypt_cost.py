@@ -0,0 +1,209 @@
+"""bcrypt cost 보정 (목표 지연 시간 기준).
+
+고정된 cost는 장비에 따라 너무 느리거나(작은 컨테이너) 예산보다 약합니다
+(큰 호스트). 이 모듈은 현재 장비에서 해싱 속도를 측정하여 목표 지연 시간(ms)
+안에 들어오는 가장 높은 cost를 고릅니다.
+
+- 측정: ``min_rounds``에서 해싱 시간을 재고, cost가 1 오를 때마다 시간이
+  두 배가 되는 것으로 외삽한 뒤 선택한 cost를 다시 측정하여 확인
+- 하한: ``min_rounds``(기본 10) 아래로는 내려가지 않음 (목표보다 느려도)
+- 재해싱: 설정한 cost보다 낮은 해시는 로그인 성공 시 새 cost로 재해싱
+  (``verify_password_async`` / ``verify_password``의 ``on_rehash``). cost를 낮춰도 기존의 더
+  강한 해시는 그대로 둡니다
+- 오프라인: ``python -m backend.auth.bcrypt_cost --target-ms 250``으로 측정하여
+  ``BCRYPT_ROUNDS``에 고정하면 시작 시 측정을 생략합니다
+
+사용 예시:
+    # main.py lifespan (해싱 풀 시작 전)
+    configure_bcrypt_cost(get_auth_settings())
+    await password_pool.start()
+
+    # 메트릭
+    bcrypt_metrics.snapshot()  # {"rounds": 11, "verify_ms_avg": 182.4, ...}
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import bcrypt
+
+from .jwt_handler import (
+    AuthSettings,
+    add_rehash_listener,
+    add_verify_listener,
+    configure_password_hashing,
+    get_bcrypt_rounds,
+)
+
+_SAMPLE_PASSWORD = b"calibration-password"
+
+
+def measure_bcrypt_ms(rounds: int, samples: int = 3) -> float:
+    """주어진 cost로 해싱하는 데 걸리는 시간의 중앙값(ms)을 반환합니다."""
+    durations = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(_SAMPLE_PASSWORD, salt)
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+@dataclass(frozen=True)
+class BcryptCalibration:
+    """보정 결과."""
+
+    rounds: int
+    target_ms: float
+    measured_ms: float
+    # cost별 측정 시간 (ms)
+    samples_ms: dict[int, float] = field(default_factory=dict)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float = 250.0,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3,
+) -> BcryptCalibration:
+    """목표 지연 시간 안에 들어오는 가장 높은 bcrypt cost를 찾습니다.
+
+    Args:
+        target_ms: 해싱 한 번의 목표 지연 시간 (ms)
+        min_rounds: cost 하한 (목표를 넘어도 이 값 이상)
+        max_rounds: cost 상한
+        samples: cost별 측정 횟수 (중앙값 사용)
+
+    Returns:
+        BcryptCalibration
+    """
+    if not 4 <= min_rounds <= max_rounds <= 31:
+        raise ValueError("require 4 <= min_rounds <= max_rounds <= 31")
+
+    measured = {min_rounds: measure_bcrypt_ms(min_rounds, samples)}
+    rounds = min_rounds
+    estimate = measured[min_rounds]
+    while rounds < max_rounds and estimate * 2 <= target_ms:
+        rounds += 1
+        estimate *= 2
+
+    # 외삽이 빗나간 경우(캐시, 터보 부스트 등) 실측으로 한 단계 보정
+    if rounds not in measured:
+        measured[rounds] = measure_bcrypt_ms(rounds, samples)
+    if measured[rounds] > target_ms and rounds > min_rounds:
+        rounds -= 1
+        if rounds not in measured:
+            measured[rounds] = measure_bcrypt_ms(rounds, samples)
+
+    return BcryptCalibration(
+        rounds=rounds,
+        target_ms=target_ms,
+        measured_ms=measured[rounds],
+        samples_ms=dict(sorted(measured.items())),
+    )
+
+
+@dataclass
+class BcryptCostMetrics:
+    """bcrypt 보정 결과 및 해싱/검증 지연 시간 통계 (시간 단위: 초)."""
+
+    target_ms: Optional[float] = None
+    calibrated_ms: Optional[float] = None
+    calibration_samples_ms: dict[int, float] = field(default_factory=dict)
+    hash_count: int = 0
+    hash_seconds_total: float = 0.0
+    hash_seconds_max: float = 0.0
+    verify_count: int = 0
+    verify_seconds_total: float = 0.0
+    verify_seconds_max: float = 0.0
+    rehashed: int = 0
+
+    def record_hash(self, seconds: float) -> None:
+        """해싱 한 번의 실행 시간을 기록합니다."""
+        self.hash_count += 1
+        self.hash_seconds_total += seconds
+        self.hash_seconds_max = max(self.hash_seconds_max, seconds)
+
+    def record_verify(self, seconds: float) -> None:
+        """검증 한 번의 실행 시간을 기록합니다."""
+        self.verify_count += 1
+        self.verify_seconds_total += seconds
+        self.verify_seconds_max = max(self.verify_seconds_max, seconds)
+
+    def record_rehash(self) -> None:
+        """로그인 성공 시 재해싱 한 번을 기록합니다."""
+        self.rehashed += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다 (시간은 ms)."""
+        return {
+            "rounds": get_bcrypt_rounds(),
+            "target_ms": self.target_ms,
+            "calibrated_ms": self.calibrated_ms,
+            "calibration_samples_ms": dict(self.calibration_samples_ms),
+            "hash_count": self.hash_count,
+            "hash_ms_avg": self.hash_seconds_total / (self.hash_count or 1) * 1000,
+            "hash_ms_max": self.hash_seconds_max * 1000,
+            "verify_count": self.verify_count,
+            "verify_ms_avg": (self.verify_seconds_total / (self.verify_count or 1) * 1000),
+            "verify_ms_max": self.verify_seconds_max * 1000,
+            "rehashed": self.rehashed,
+        }
+
+
+bcrypt_metrics = BcryptCostMetrics()
+# 동기 경로(jwt_handler.verify_password)의 검증 시간과 재해싱도 집계
+add_rehash_listener(bcrypt_metrics.record_rehash)
+add_verify_listener(bcrypt_metrics.record_verify)
+
+
+def apply_calibration(calibration: BcryptCalibration) -> None:
+    """보정 결과를 해싱 설정과 메트릭에 반영합니다."""
+    configure_password_hashing(calibration.rounds)
+    bcrypt_metrics.target_ms = calibration.target_ms
+    bcrypt_metrics.calibrated_ms = calibration.measured_ms
+    bcrypt_metrics.calibration_samples_ms = dict(calibration.samples_ms)
+
+
+def configure_bcrypt_cost(settings: AuthSettings) -> int:
+    """설정에 따라 bcrypt cost를 정합니다. 앱 시작 시 해싱 풀보다 먼저 호출하세요.
+
+    - ``BCRYPT_ROUNDS`` 지정: 그 값을 사용 (측정 없음)
+    - ``BCRYPT_TARGET_MS`` 지정: 현재 장비에서 측정하여 보정
+    - 둘 다 없음: 기본 cost(12) 유지
+
+    Returns:
+        적용된 cost
+    """
+    if settings.BCRYPT_ROUNDS is not None:
+        configure_password_hashing(settings.BCRYPT_ROUNDS)
+    elif settings.BCRYPT_TARGET_MS is not None:
+        apply_calibration(calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS))
+    return get_bcrypt_rounds()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="현재 장비에서 목표 지연 시간에 맞는 bcrypt cost를 측정합니다."
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    calibration = calibrate_bcrypt_rounds(
+        args.target_ms, args.min_rounds, args.max_rounds, args.samples
+    )
+    for rounds, ms in calibration.samples_ms.items():
+        sys.stdout.write(f"cost {rounds:>2}: {ms:8.1f} ms\n")
+    sys.stdout.write(f"BCRYPT_ROUNDS={calibration.rounds}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,536 @@
+"""인증 경로 벤치마크.
+
+그룹:
+    cache      get_token_payload 의존성의 호출 비용 (토큰 캐시, 폐기 목록 확인)
+    algorithms 알고리즘별(HS256 / ES256 / EdDSA) 토큰 발급·검증 비용
+    payload    TokenPayload(pydantic)와 LightTokenPayload의 생성/디코딩 시간,
+               객체당 메모리 블록 수와 바이트
+    asgi       동시 요청에서 의존성 체인(get_token_payload → get_current_user /
+               require_role / require_permission)의 요청당 오버헤드 (in-process ASGI,
+               AuthenticationMiddleware 적용 전후)
+    password   bcrypt 해싱/검증 지연 시간, 동시 로그인 시 이벤트 루프 정지 시간
+
+결과를 JSON 기준선으로 저장하고, 이후 실행에서 기준선과 비교할 수 있습니다.
+비교 시 ``--threshold``보다 느려진 시나리오가 있으면 종료 코드 1을 반환합니다.
+
+벤치마크 전용 의존성:
+    pip install httpx
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m backend.auth.benchmark_auth
+    python -m backend.auth.benchmark_auth --groups cache algorithms asgi
+    python -m backend.auth.benchmark_auth --save baseline.json
+    python -m backend.auth.benchmark_auth --compare baseline.json --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any
+
+import httpx
+import jwt
+from fastapi import Depends, FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+
+from ..error_templates import ErrorTemplateException, error_template_handler
+from . import dependencies
+from .jwt_handler import (
+    AuthSettings,
+    LightTokenPayload,
+    TokenPayload,
+    create_access_token,
+    create_tokens,
+    decode_access_token,
+    hash_password,
+    verify_password,
+)
+from .key_ring import KeyRing, SigningKey
+from .middleware import AuthenticationMiddleware
+from .password_pool import PasswordHasherPool, PasswordPoolBusyError
+from .settings_provider import auth_settings_provider
+
+BENCH_SETTINGS = AuthSettings(
+    SECRET_KEY="benchmark-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="benchmark-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+
+
+async def _time_dependency(settings: AuthSettings, token: str, iterations: int) -> float:
+    """get_token_payload 1회 호출의 평균 시간(µs)을 반환합니다."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    started = perf_counter()
+    for _ in range(iterations):
+        await dependencies.get_token_payload(credentials, settings)
+    return (perf_counter() - started) / iterations * 1e6
+
+
+async def bench_token_cache(iterations: int) -> list[dict[str, Any]]:
+    """토큰 캐시 비활성/활성 상태의 의존성 호출 비용을 측정합니다."""
+    token = create_access_token(BENCH_SETTINGS, "user_1", role="user")
+    results = []
+
+    dependencies.disable_token_cache()
+    results.append(
+        {
+            "scenario": "get_token_payload (cache off)",
+            "us_per_op": await _time_dependency(BENCH_SETTINGS, token, iterations),
+        }
+    )
+
+    cache = dependencies.enable_token_cache(max_size=1_000)
+    try:
+        results.append(
+            {
+                "scenario": "get_token_payload (cache on)",
+                "us_per_op": await _time_dependency(BENCH_SETTINGS, token, iterations),
+                "hit_rate": cache.stats.hit_rate,
+            }
+        )
+
+        # 폐기 항목 10,000개가 있는 상태에서 폐기되지 않은 토큰 확인
+        revocations = dependencies.enable_revocation(max_ttl_seconds=600)
+        for i in range(10_000):
+            revocations.add(f"revoked-{i}", time.time() + 600)
+        results.append(
+            {
+                "scenario": "get_token_payload (cache + revocation)",
+                "us_per_op": await _time_dependency(BENCH_SETTINGS, token, iterations),
+                "revoked": len(revocations),
+            }
+        )
+    finally:
+        dependencies.disable_token_cache()
+        dependencies.disable_revocation()
+    return results
+
+
+def bench_algorithms(iterations: int) -> list[dict[str, Any]]:
+    """알고리즘별 서명/검증 비용을 측정합니다 (키 링, 사전 파싱된 키)."""
+    claims = {"sub": "user_1", "role": "user", "exp": 4_102_444_800, "iat": 0}
+    results = []
+
+    # 기준: 키 링 도입 이전 방식 (요청마다 시크릿 문자열로 검증)
+    secret = BENCH_SETTINGS.SECRET_KEY
+    token = jwt.encode(claims, secret, algorithm="HS256")
+    started = perf_counter()
+    for _ in range(iterations):
+        jwt.decode(token, secret, algorithms=["HS256"])
+    results.append(
+        {
+            "scenario": "verify HS256 (raw secret)",
+            "us_per_op": (perf_counter() - started) / iterations * 1e6,
+        }
+    )
+
+    for algorithm in ("HS256", "ES256", "EdDSA"):
+        key = SigningKey.generate(algorithm, algorithm)
+        ring = KeyRing([key], active_kid=algorithm)
+        token = ring.sign(claims)
+
+        started = perf_counter()
+        for _ in range(iterations):
+            ring.sign(claims)
+        sign_us = (perf_counter() - started) / iterations * 1e6
+
+        started = perf_counter()
+        for _ in range(iterations):
+            ring.verify(token)
+        results.append(
+            {
+                "scenario": f"verify {algorithm} (key ring)",
+                "us_per_op": (perf_counter() - started) / iterations * 1e6,
+                "sign_us": sign_us,
+                "token_bytes": len(token),
+            }
+        )
+
+    # 로그인 응답 1건 = Access + Refresh Token 발급
+    started = perf_counter()
+    for _ in range(iterations):
+        create_tokens(BENCH_SETTINGS, "user_1", role="user")
+    results.append(
+        {
+            "scenario": "create_tokens (HS256)",
+            "us_per_op": (perf_counter() - started) / iterations * 1e6,
+        }
+    )
+    return results
+
+
+def _retained_per_object(factory: Any, count: int = 2_000) -> tuple[float, float]:
+    """객체를 count개 유지했을 때 객체당 (메모리 블록 수, 바이트)를 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        blocks_before = sys.getallocatedblocks()
+        bytes_before, _ = tracemalloc.get_traced_memory()
+        kept = [factory() for _ in range(count)]
+        bytes_after, _ = tracemalloc.get_traced_memory()
+        blocks_after = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (blocks_after - blocks_before) / count, (bytes_after - bytes_before) / count
+
+
+def bench_payload(iterations: int) -> list[dict[str, Any]]:
+    """pydantic TokenPayload와 LightTokenPayload의 생성/디코딩 비용을 비교합니다."""
+    token = create_access_token(BENCH_SETTINGS, "user_1", role="user")
+    claims = BENCH_SETTINGS.key_ring.verify(token)
+    light_settings = BENCH_SETTINGS.model_copy(update={"TOKEN_PAYLOAD_LIGHTWEIGHT": True})
+    results = []
+
+    def light_with_exp() -> LightTokenPayload:
+        payload = LightTokenPayload(claims)
+        payload.exp  # noqa: B018 - 지연 변환 비용 포함
+        return payload
+
+    factories = (
+        ("TokenPayload(**claims)", lambda: TokenPayload(**claims)),
+        ("LightTokenPayload(claims)", lambda: LightTokenPayload(claims)),
+        ("LightTokenPayload(claims) + exp", light_with_exp),
+    )
+    for name, factory in factories:
+        started = perf_counter()
+        for _ in range(iterations):
+            factory()
+        us_per_op = (perf_counter() - started) / iterations * 1e6
+        blocks, size = _retained_per_object(factory)
+        results.append(
+            {
+                "scenario": name,
+                "us_per_op": us_per_op,
+                "blocks_per_obj": blocks,
+                "bytes_per_obj": size,
+            }
+        )
+
+    for name, settings in (("pydantic", BENCH_SETTINGS), ("light", light_settings)):
+        started = perf_counter()
+        for _ in range(iterations):
+            decode_access_token(settings, token)
+        results.append(
+            {
+                "scenario": f"decode_access_token ({name})",
+                "us_per_op": (perf_counter() - started) / iterations * 1e6,
+            }
+        )
+    return results
+
+
+def build_bench_app(middleware: bool = False) -> FastAPI:
+    """의존성 체인별 라우트를 가진 벤치마크용 앱을 생성합니다.
+
+    Args:
+        middleware: AuthenticationMiddleware 적용 여부 (적용 시 라우트는 저장된
+            페이로드만 읽는 경량 의존성 사용)
+    """
+    app = FastAPI()
+    app.add_exception_handler(ErrorTemplateException, error_template_handler)
+    source = dependencies.get_token_payload
+    current_user = dependencies.get_current_user
+    if middleware:
+        app.add_middleware(AuthenticationMiddleware)
+        source = dependencies.get_authenticated_payload
+        current_user = dependencies.get_authenticated_user
+
+    @app.get("/public")
+    async def public() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/me")
+    async def me(
+        user: Annotated[TokenPayload, Depends(current_user)],
+    ) -> dict[str, str]:
+        return {"sub": user.sub}
+
+    @app.get("/admin")
+    async def admin(
+        user: Annotated[
+            TokenPayload,
+            Depends(dependencies.require_role(dependencies.UserRole.USER, source=source)),
+        ],
+    ) -> dict[str, str]:
+        return {"sub": user.sub}
+
+    @app.get("/perm")
+    async def perm(
+        user: Annotated[
+            TokenPayload,
+            Depends(dependencies.require_permission("read", "write", source=source)),
+        ],
+    ) -> dict[str, str]:
+        return {"sub": user.sub}
+
+    return app
+
+
+async def bench_dependency_chain(requests: int, concurrency: int) -> list[dict[str, Any]]:
+    """동시 요청에서 라우트별 요청당 시간과 /public 대비 인증 오버헤드를 측정합니다.
+
+    AuthenticationMiddleware 없이 한 번, 적용하여 한 번 측정합니다.
+    """
+    # dependency_overrides는 요청마다 의존성 트리를 다시 분석하여 측정을
+    # 왜곡하므로, 운영과 같이 프로세스 전역 설정을 교체합니다.
+    previous = auth_settings_provider.current
+    auth_settings_provider.current = BENCH_SETTINGS
+    try:
+        results = []
+        for middleware in (False, True):
+            results.extend(await _bench_routes(build_bench_app(middleware), requests, concurrency))
+        return results
+    finally:
+        auth_settings_provider.current = previous
+
+
+async def _bench_routes(app: FastAPI, requests: int, concurrency: int) -> list[dict[str, Any]]:
+    token = create_access_token(BENCH_SETTINGS, "user_1", role="user")
+    headers = {"Authorization": f"Bearer {token}"}
+    suffix = ", middleware" if app.user_middleware else ""
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(path: str) -> None:
+            async with semaphore:
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+
+        for path in ("/public", "/me", "/admin", "/perm"):
+            await asyncio.gather(*(call(path) for _ in range(min(requests, 100))))
+            started = perf_counter()
+            await asyncio.gather(*(call(path) for _ in range(requests)))
+            results.append(
+                {
+                    "scenario": f"GET {path} (c={concurrency}{suffix})",
+                    "us_per_op": (perf_counter() - started) / requests * 1e6,
+                }
+            )
+
+    baseline = results[0]["us_per_op"]
+    for r in results[1:]:
+        r["auth_overhead_us"] = r["us_per_op"] - baseline
+    return results
+
+
+def bench_hash_latency(samples: int) -> list[dict[str, Any]]:
+    """bcrypt 해싱/검증 1회의 지연 시간 분포를 측정합니다."""
+    hashed = hash_password("benchmark-password")
+    results = []
+    for scenario, fn in (
+        ("hash_password (bcrypt)", lambda: hash_password("benchmark-password")),
+        (
+            "verify_password (bcrypt)",
+            lambda: verify_password("benchmark-password", hashed),
+        ),
+    ):
+        timings = []
+        for _ in range(samples):
+            started = perf_counter()
+            fn()
+            timings.append((perf_counter() - started) * 1e6)
+        timings.sort()
+        results.append(
+            {
+                "scenario": scenario,
+                "us_per_op": statistics.median(timings),
+                "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))] / 1000,
+            }
+        )
+    return results
+
+
+async def _max_loop_lag(work: Any) -> tuple[float, float]:
+    """work 실행 중 이벤트 루프의 최대 지연(ms)과 총 소요 시간(ms)을 반환합니다."""
+    max_lag = 0.0
+    tick = 0.005
+
+    async def probe() -> None:
+        nonlocal max_lag
+        while True:
+            before = perf_counter()
+            await asyncio.sleep(tick)
+            max_lag = max(max_lag, perf_counter() - before - tick)
+
+    prober = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    started = perf_counter()
+    await work
+    elapsed = perf_counter() - started
+    prober.cancel()
+    return max_lag * 1000, elapsed * 1000
+
+
+async def bench_password_verify(logins: int) -> list[dict[str, Any]]:
+    """동시 로그인 N건의 비밀번호 검증 시 이벤트 루프 지연을 비교합니다."""
+    hashed = hash_password("benchmark-password")
+
+    async def verify_sync() -> None:
+        for _ in range(logins):
+            verify_password("benchmark-password", hashed)
+            await asyncio.sleep(0)
+
+    pool = PasswordHasherPool(max_pending=logins)
+    await pool.start()
+
+    async def verify_pooled() -> None:
+        await asyncio.gather(
+            *(pool.run(verify_password, "benchmark-password", hashed) for _ in range(logins))
+        )
+
+    results = []
+    try:
+        for scenario, work in (
+            ("verify_password (sync)", verify_sync()),
+            ("verify_password_async (pool)", verify_pooled()),
+        ):
+            max_lag_ms, elapsed_ms = await _max_loop_lag(work)
+            results.append(
+                {
+                    "scenario": f"{scenario} x{logins}",
+                    "us_per_op": elapsed_ms * 1000 / logins,
+                    "loop_lag_ms_max": max_lag_ms,
+                }
+            )
+        snapshot = pool.metrics.snapshot()
+        results[-1]["wait_ms_avg"] = snapshot["wait_ms_avg"]
+        results[-1]["exec_ms_avg"] = snapshot["exec_ms_avg"]
+
+        # 대기열 초과 요청은 해싱 없이 즉시 거절되어야 함
+        started = perf_counter()
+        with contextlib.suppress(PasswordPoolBusyError):
+            await asyncio.gather(
+                *(
+                    pool.run(verify_password, "benchmark-password", hashed)
+                    for _ in range(logins + 1)
+                )
+            )
+        results.append(
+            {
+                "scenario": "verify_password_async (rejected)",
+                "us_per_op": (perf_counter() - started) * 1e6 / (logins + 1),
+                "rejected": pool.metrics.rejected,
+            }
+        )
+    finally:
+        pool.shutdown()
+    return results
+
+
+def print_results(results: list[dict[str, Any]]) -> None:
+    """결과를 표 형태로 출력합니다."""
+    sys.stdout.write(f"{'scenario':<40}{'µs/op':>10}{'ops/s':>12}  extra\n")
+    for r in results:
+        extra = ", ".join(
+            f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}"
+            for k, v in r.items()
+            if k not in ("scenario", "us_per_op")
+        )
+        sys.stdout.write(
+            f"{r['scenario']:<40}{r['us_per_op']:>10.2f}{1e6 / r['us_per_op']:>12,.0f}  {extra}\n"
+        )
+
+
+def save_baseline(path: Path, results: list[dict[str, Any]], args: Any) -> None:
+    """결과를 JSON 기준선으로 저장합니다."""
+    document = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "args": vars(args),
+        "results": {r["scenario"]: r for r in results},
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False, default=str))
+
+
+def compare_baseline(
+    baseline: dict[str, Any], results: list[dict[str, Any]], threshold: float
+) -> list[str]:
+    """기준선과 비교한 표를 출력하고, threshold보다 느려진 시나리오를 반환합니다."""
+    previous = baseline["results"]
+    regressions = []
+    sys.stdout.write(f"{'scenario':<40}{'base µs':>12}{'now µs':>12}{'change':>9}\n")
+    for r in results:
+        before = previous.get(r["scenario"])
+        if before is None:
+            continue
+        change = r["us_per_op"] / before["us_per_op"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(r["scenario"])
+            flag = "  REGRESSION"
+        sys.stdout.write(
+            f"{r['scenario']:<40}{before['us_per_op']:>12.2f}"
+            f"{r['us_per_op']:>12.2f}{change:>+9.1%}{flag}\n"
+        )
+    return regressions
+
+
+GROUPS = ("cache", "algorithms", "payload", "asgi", "password")
+
+
+def run_groups(args: Any) -> list[dict[str, Any]]:
+    """선택한 그룹을 실행하고 그룹별 결과를 출력합니다."""
+    runners = {
+        "cache": lambda: asyncio.run(bench_token_cache(args.iterations)),
+        "algorithms": lambda: bench_algorithms(args.iterations),
+        "payload": lambda: bench_payload(args.iterations),
+        "asgi": lambda: asyncio.run(bench_dependency_chain(args.requests, args.concurrency)),
+        "password": lambda: (
+            bench_hash_latency(args.hash_samples) + asyncio.run(bench_password_verify(args.logins))
+        ),
+    }
+    results = []
+    for group in args.groups:
+        group_results = runners[group]()
+        sys.stdout.write(f"[{group}]\n")
+        print_results(group_results)
+        sys.stdout.write("\n")
+        results.extend(group_results)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Auth hot-path benchmark")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2_000, help="Requests per ASGI route")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--hash-samples", type=int, default=5)
+    parser.add_argument("--logins", type=int, default=8, help="Concurrent password verifications")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Compare with a JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%)"
+    )
+    args = parser.parse_args()
+
+    results = run_groups(args)
+
+    if args.save:
+        save_baseline(args.save, results, args)
+        sys.stdout.write(f"baseline saved: {args.save}\n")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_baseline(baseline, results, args.threshold)
+        if regressions:
+            sys.stdout.write(f"{len(regressions)} scenario(s) slower than {args.threshold:.0%}\n")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,17 +16,74 @@
         ...
 """
 
+from collections.abc import Callable
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any, Optional
 
 import jwt
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-
-from .jwt_handler import AuthSettings, TokenPayload, decode_access_token
+from fastapi import Depends, Request, status
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+
+from ..error_templates import ErrorTemplateException, PrerenderedError
+from ..request_context import server_timing
+from .api_keys import ApiKeyStore
+from .jwt_handler import (
+    AccessTokenPayload,
+    AuthSettings,
+    TokenPayload,
+    decode_access_token,
+)
+from .rbac import RBACPolicy
+from .revocation import RevocationList, RevocationSource
+from .settings_provider import auth_settings_provider
+from .token_cache import TokenCache, decode_access_token_cached
 
 # Bearer 토큰 스키마
 bearer_scheme = HTTPBearer(auto_error=False)
+# 서비스 간 호출용 API 키 스키마
+api_key_scheme = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+# 사전 렌더링된 인증/인가 에러 응답 (요청마다 pydantic 직렬화 없음)
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+TOKEN_REQUIRED_ERROR = PrerenderedError(
+    "UNAUTHORIZED",
+    "인증 토큰이 필요합니다",
+    status.HTTP_401_UNAUTHORIZED,
+    headers=_BEARER_HEADERS,
+)
+TOKEN_EXPIRED_ERROR = PrerenderedError(
+    "UNAUTHORIZED",
+    "토큰이 만료되었습니다",
+    status.HTTP_401_UNAUTHORIZED,
+    headers=_BEARER_HEADERS,
+)
+TOKEN_INVALID_ERROR = PrerenderedError(
+    "UNAUTHORIZED",
+    "유효하지 않은 토큰입니다",
+    status.HTTP_401_UNAUTHORIZED,
+    headers=_BEARER_HEADERS,
+)
+TOKEN_REVOKED_ERROR = PrerenderedError(
+    "UNAUTHORIZED",
+    "폐기된 토큰입니다",
+    status.HTTP_401_UNAUTHORIZED,
+    headers=_BEARER_HEADERS,
+)
+API_KEY_REQUIRED_ERROR = PrerenderedError(
+    "UNAUTHORIZED", "API 키가 필요합니다", status.HTTP_401_UNAUTHORIZED
+)
+API_KEY_INVALID_ERROR = PrerenderedError(
+    "UNAUTHORIZED", "유효하지 않은 API 키입니다", status.HTTP_401_UNAUTHORIZED
+)
+ROLE_FORBIDDEN_ERROR = PrerenderedError(
+    "FORBIDDEN", "이 작업에 대한 권한이 없습니다", status.HTTP_403_FORBIDDEN
+)
+ROLE_MISSING_ERROR = PrerenderedError(
+    "FORBIDDEN", "역할이 지정되지 않았습니다", status.HTTP_403_FORBIDDEN
+)
+ROLE_UNKNOWN_ERROR = PrerenderedError(
+    "FORBIDDEN", "알 수 없는 역할입니다", status.HTTP_403_FORBIDDEN
+)
 
 
 class UserRole(str, Enum):
@@ -44,21 +101,193 @@ ROLE_PERMISSIONS: dict[UserRole, set[str]] = {
     UserRole.USER: {"read", "write"},
 }
 
+# 역할 상속 (예: {UserRole.ADMIN: [UserRole.MANAGER]}이면 ADMIN은 MANAGER의
+# 권한을 모두 갖고 require_role(UserRole.MANAGER)도 통과합니다)
+ROLE_INHERITS: dict[UserRole, list[UserRole]] = {}
+
+# 시작 시 비트마스크로 컴파일된 정책 (권한 확인은 AND 한 번)
+rbac_policy = RBACPolicy(ROLE_PERMISSIONS, inherits=ROLE_INHERITS)
+
+
+# 검증된 토큰 캐시 (opt-in, enable_token_cache로 활성화)
+_token_cache: Optional[TokenCache] = None
+
+
+def enable_token_cache(
+    max_size: int = 10_000, max_ttl_seconds: Optional[float] = None
+) -> TokenCache:
+    """검증된 토큰 캐시를 활성화합니다. 앱 시작 시 한 번 호출하세요.
+
+    Args:
+        max_size: 최대 항목 수 (초과 시 LRU 제거)
+        max_ttl_seconds: 항목 최대 유지 시간 (None이면 토큰 exp까지)
+
+    Returns:
+        활성화된 TokenCache (통계 조회, jti 무효화에 사용)
+    """
+    global _token_cache
+    _token_cache = TokenCache(max_size=max_size, max_ttl_seconds=max_ttl_seconds)
+    # 시크릿 키가 교체되면 이전 키로 검증된 항목을 비웁니다.
+    auth_settings_provider.add_listener(_clear_token_cache)
+    return _token_cache
+
+
+def _clear_token_cache(_settings: AuthSettings) -> None:
+    if _token_cache is not None:
+        _token_cache.clear()
+
+
+def disable_token_cache() -> None:
+    """검증된 토큰 캐시를 비활성화합니다."""
+    global _token_cache
+    _token_cache = None
+
+
+def get_token_cache() -> Optional[TokenCache]:
+    """활성화된 토큰 캐시를 반환합니다 (비활성화 상태면 None)."""
+    return _token_cache
+
+
+# 토큰 폐기 목록 (opt-in, enable_revocation으로 활성화)
+_revocation_list: Optional[RevocationList] = None
+
+
+def enable_revocation(
+    source: Optional[RevocationSource] = None,
+    capacity: int = 10_000,
+    max_ttl_seconds: Optional[float] = None,
+) -> RevocationList:
+    """토큰 폐기(jti) 확인을 활성화합니다. 앱 시작 시 한 번 호출하세요.
+
+    Args:
+        source: 워커 간 폐기 목록 공유 저장소 (None이면 프로세스 로컬)
+        capacity: 예상 폐기 항목 수 (Bloom 필터 크기)
+        max_ttl_seconds: 항목 최대 유지 시간 (None이면 Access Token 수명)
+
+    Returns:
+        활성화된 RevocationList (revoke, run_sync에 사용)
+    """
+    global _revocation_list
+    if max_ttl_seconds is None:
+        max_ttl_seconds = get_auth_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    _revocation_list = RevocationList(
+        capacity=capacity, max_ttl_seconds=max_ttl_seconds, source=source
+    )
+    # 폐기된 jti의 캐시 항목은 만료를 기다리지 않고 바로 제거합니다.
+    _revocation_list.add_listener(_invalidate_cached_token)
+    return _revocation_list
+
+
+def _invalidate_cached_token(jti: str) -> None:
+    if _token_cache is not None:
+        _token_cache.invalidate_jti(jti)
+
+
+def disable_revocation() -> None:
+    """토큰 폐기 확인을 비활성화합니다."""
+    global _revocation_list
+    _revocation_list = None
+
+
+def get_revocation_list() -> Optional[RevocationList]:
+    """활성화된 폐기 목록을 반환합니다 (비활성화 상태면 None)."""
+    return _revocation_list
+
+
+# 서비스 간 API 키 (opt-in, enable_api_keys로 활성화)
+_api_key_store: Optional[ApiKeyStore] = None
+
+
+def enable_api_keys(path: Optional[str] = None) -> ApiKeyStore:
+    """API 키 인증을 활성화합니다. 앱 시작 시 한 번 호출하세요.
+
+    Args:
+        path: 키 파일 경로 (None이면 AuthSettings.API_KEYS_FILE)
+
+    Returns:
+        로드된 ApiKeyStore (watch, revoke에 사용)
+
+    Raises:
+        ValueError: 키 파일 경로가 없거나 형식 오류
+        OSError: 키 파일을 읽을 수 없음
+    """
+    global _api_key_store
+    path = path or get_auth_settings().API_KEYS_FILE
+    if not path:
+        raise ValueError("API_KEYS_FILE is not configured")
+    store = ApiKeyStore(path, roles={role.value for role in UserRole})
+    store.load()
+    _api_key_store = store
+    return store
+
+
+def disable_api_keys() -> None:
+    """API 키 인증을 비활성화합니다 (모든 API 키 요청은 401)."""
+    global _api_key_store
+    _api_key_store = None
+
+
+def get_api_key_store() -> Optional[ApiKeyStore]:
+    """활성화된 API 키 저장소를 반환합니다 (비활성화 상태면 None)."""
+    return _api_key_store
+
 
 def get_auth_settings() -> AuthSettings:
     """인증 설정을 반환합니다.
 
-    실제 프로젝트에서는 앱 시작 시 생성된 설정 인스턴스를 반환하도록 수정하세요.
+    앱 시작 시 ``auth_settings_provider.load()``로 로드된 프로세스 전역 설정을
+    반환합니다 (요청마다 환경변수/.env를 다시 읽지 않음). 로드 전이면 최초 호출
+    시 한 번 로드합니다.
+    """
+    settings = auth_settings_provider.current
+    if settings is None:
+        settings = auth_settings_provider.load()
+    return settings
+
+
+# AuthenticationMiddleware가 검증한 페이로드를 저장하는 scope["state"] 키
+TOKEN_PAYLOAD_STATE_KEY = "token_payload"
+
+
+def authenticate_token(settings: AuthSettings, token: str) -> AccessTokenPayload:
+    """Access Token을 검증합니다 (토큰 캐시, 폐기 목록 적용).
+
+    get_token_payload와 AuthenticationMiddleware가 공유하는 검증 경로입니다.
+
+    Args:
+        settings: 인증 설정
+        token: Bearer 토큰 문자열
+
+    Returns:
+        디코딩된 토큰 페이로드 (``TOKEN_PAYLOAD_LIGHTWEIGHT``이면 LightTokenPayload)
+
+    Raises:
+        ErrorTemplateException(401): 토큰 만료, 폐기, 또는 유효하지 않음
     """
-    return AuthSettings()
+    cache = _token_cache
+    try:
+        with server_timing("auth"):
+            if cache is not None:
+                payload = decode_access_token_cached(settings, token, cache)
+            else:
+                payload = decode_access_token(settings, token)
+    except jwt.ExpiredSignatureError:
+        raise ErrorTemplateException(TOKEN_EXPIRED_ERROR)
+    except jwt.InvalidTokenError:
+        raise ErrorTemplateException(TOKEN_INVALID_ERROR)
+
+    revocations = _revocation_list
+    if revocations is not None and revocations.is_revoked(payload.jti):
+        # 폐기 후 다시 제시된 토큰이 캐시에 남지 않도록 합니다.
+        _invalidate_cached_token(payload.jti)
+        raise ErrorTemplateException(TOKEN_REVOKED_ERROR)
+    return payload
 
 
 async def get_token_payload(
-    credentials: Annotated[
-        HTTPAuthorizationCredentials | None, Depends(bearer_scheme)
-    ],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
     settings: Annotated[AuthSettings, Depends(get_auth_settings)],
-) -> TokenPayload:
+) -> AccessTokenPayload:
     """Authorization 헤더에서 토큰을 추출하고 검증합니다.
 
     Args:
@@ -66,37 +295,60 @@ async def get_token_payload(
         settings: 인증 설정
 
     Returns:
-        TokenPayload: 디코딩된 토큰 페이로드
+        디코딩된 토큰 페이로드 (``TOKEN_PAYLOAD_LIGHTWEIGHT``이면 LightTokenPayload)
 
     Raises:
-        HTTPException(401): 토큰 없음, 만료, 또는 유효하지 않음
+        ErrorTemplateException(401): 토큰 없음, 만료, 폐기, 또는 유효하지 않음
     """
     if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="인증 토큰이 필요합니다",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise ErrorTemplateException(TOKEN_REQUIRED_ERROR)
+    return authenticate_token(settings, credentials.credentials)
 
-    try:
-        return decode_access_token(settings, credentials.credentials)
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="토큰이 만료되었습니다",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except jwt.InvalidTokenError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
+async def get_authenticated_payload(request: Request) -> AccessTokenPayload:
+    """AuthenticationMiddleware가 검증한 페이로드를 반환합니다.
 
-async def get_current_user(
-    token: Annotated[TokenPayload, Depends(get_token_payload)],
+    ``get_token_payload`` 대신 사용하는 경량 의존성입니다. 하위 의존성
+    (``bearer_scheme``, ``get_auth_settings``)이 없으므로 FastAPI가 요청마다
+    해석할 의존성 트리가 ``Request`` 주입 하나로 줄어듭니다.
+
+    미들웨어가 검증하지 않은 요청(미들웨어 미적용, 라우트 테이블에 없는 경로)은
+    헤더를 직접 검증하지 않고 401로 거부합니다.
+
+    Raises:
+        ErrorTemplateException(401): 미들웨어가 저장한 페이로드가 없음
+    """
+    state = request.scope.get("state")
+    payload = state.get(TOKEN_PAYLOAD_STATE_KEY) if state is not None else None
+    if payload is None:
+        raise ErrorTemplateException(TOKEN_REQUIRED_ERROR)
+    return payload
+
+
+async def get_api_key_payload(
+    api_key: Annotated[Optional[str], Depends(api_key_scheme)],
 ) -> TokenPayload:
+    """X-API-Key 헤더의 API 키를 확인합니다 (서비스 간 호출용).
+
+    키마다 로드 시 만들어 둔 TokenPayload(``sub="api_key:<id>"``, ``role``)를
+    반환하므로 ``require_role``/``require_permission``의 ``source``로 사용할 수
+    있습니다. 요청마다 SHA-256 한 번과 dict 조회 한 번만 수행합니다.
+
+    Raises:
+        ErrorTemplateException(401): API 키 없음, 또는 유효하지 않거나 폐기됨
+    """
+    if api_key is None:
+        raise ErrorTemplateException(API_KEY_REQUIRED_ERROR)
+    store = _api_key_store
+    entry = store.current.authenticate(api_key) if store is not None else None
+    if entry is None:
+        raise ErrorTemplateException(API_KEY_INVALID_ERROR)
+    return entry.payload
+
+
+async def get_current_user(
+    token: Annotated[AccessTokenPayload, Depends(get_token_payload)],
+) -> AccessTokenPayload:
     """현재 인증된 사용자를 반환합니다.
 
     실제 프로젝트에서는 token.sub로 DB에서 User 객체를 조회하여 반환하도록 수정하세요.
@@ -105,26 +357,57 @@ async def get_current_user(
         token: 검증된 토큰 페이로드
 
     Returns:
-        TokenPayload (실제 프로젝트에서는 User 모델)
+        TokenPayload 또는 LightTokenPayload (실제 프로젝트에서는 User 모델)
+
+    ``TOKEN_PAYLOAD_LIGHTWEIGHT``이면 ``LightTokenPayload``(``__slots__``)가
+    반환되며 ``jsonable_encoder``로 직렬화할 수 없습니다. 페이로드를 응답에
+    담을 때는 ``to_model()``로 변환하세요 (두 타입 모두 제공).
 
     사용 예시:
         @router.get("/me")
         async def get_me(current_user: User = Depends(get_current_user)):
             return success_response(current_user)
+
+        # 페이로드를 그대로 응답할 때
+        async def get_me(token: AccessTokenPayload = Depends(get_current_user)):
+            return success_response(token.to_model())
+    """
+    return await _load_user(token)
+
+
+async def get_authenticated_user(
+    token: Annotated[AccessTokenPayload, Depends(get_authenticated_payload)],
+) -> AccessTokenPayload:
+    """AuthenticationMiddleware 적용 시 사용하는 ``get_current_user``.
+
+    Args:
+        token: 미들웨어가 검증한 토큰 페이로드
+
+    Returns:
+        TokenPayload 또는 LightTokenPayload (실제 프로젝트에서는 User 모델)
     """
+    return await _load_user(token)
+
+
+async def _load_user(token: AccessTokenPayload) -> AccessTokenPayload:
     # TODO: DB에서 사용자 조회
     # user = await user_repository.find_by_id(token.sub)
     # if user is None:
-    #     raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다")
+    #     raise ErrorTemplateException(TOKEN_INVALID_ERROR)
     # return user
     return token
 
 
-def require_role(*roles: UserRole):
+def require_role(
+    *roles: UserRole,
+    source: Callable[..., Any] = get_token_payload,
+):
     """특정 역할을 가진 사용자만 접근을 허용하는 의존성을 반환합니다.
 
     Args:
         *roles: 허용할 역할 목록
+        source: 페이로드를 제공하는 의존성 (API 키: ``get_api_key_payload``,
+            AuthenticationMiddleware 적용 시: ``get_authenticated_payload``)
 
     Returns:
         FastAPI 의존성 함수
@@ -144,34 +427,51 @@ def require_role(*roles: UserRole):
             ),
         ):
             ...
+
+        @router.post("/internal/ingest")
+        async def ingest(
+            service: TokenPayload = Depends(
+                require_role(UserRole.USER, source=get_api_key_payload)
+            ),
+        ):
+            ...
     """
-    allowed_roles = set(roles)
+    allowed_mask = rbac_policy.roles_mask(*roles)
+    role_lineage = rbac_policy.role_lineage
 
     async def _check_role(
-        token: Annotated[TokenPayload, Depends(get_token_payload)],
-    ) -> TokenPayload:
-        if token.role is None or token.role not in {r.value for r in allowed_roles}:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="이 작업에 대한 권한이 없습니다",
-            )
+        token: Annotated[AccessTokenPayload, Depends(source)],
+    ) -> AccessTokenPayload:
+        if token.role is None or not role_lineage.get(token.role, 0) & allowed_mask:
+            raise ErrorTemplateException(ROLE_FORBIDDEN_ERROR)
         # TODO: DB에서 사용자 조회 후 반환
         return token
 
     return _check_role
 
 
-def require_permission(permission: str):
-    """특정 권한이 있는 사용자만 접근을 허용하는 의존성을 반환합니다.
+def require_permission(
+    permission: str,
+    *permissions: str,
+    source: Callable[..., Any] = get_token_payload,
+):
+    """특정 권한이 모두 있는 사용자만 접근을 허용하는 의존성을 반환합니다.
 
-    ROLE_PERMISSIONS 매핑에 따라 역할별 권한을 확인합니다.
+    ROLE_PERMISSIONS(와 ROLE_INHERITS)를 컴파일한 rbac_policy로 확인합니다.
+    토큰에 현재 정책 버전의 perm 클레임이 있으면 역할 조회도 생략합니다.
 
     Args:
         permission: 필요한 권한 (예: "delete", "manage_users")
+        *permissions: 함께 필요한 추가 권한
+        source: 페이로드를 제공하는 의존성 (API 키: ``get_api_key_payload``,
+            AuthenticationMiddleware 적용 시: ``get_authenticated_payload``)
 
     Returns:
         FastAPI 의존성 함수
 
+    Raises:
+        ValueError: 정의되지 않은 권한 (라우터 정의 시점)
+
     사용 예시:
         @router.delete("/posts/{post_id}")
         async def delete_post(
@@ -179,31 +479,33 @@ def require_permission(permission: str):
             current_user: User = Depends(require_permission("delete")),
         ):
             ...
+
+        @router.post("/users/{user_id}/ban")
+        async def ban_user(
+            current_user: User = Depends(
+                require_permission("write", "manage_users")
+            ),
+        ):
+            ...
     """
+    required = (permission, *permissions)
+    required_mask = rbac_policy.mask_of(*required)
+    permission_denied = PrerenderedError(
+        "FORBIDDEN",
+        f"'{', '.join(required)}' 권한이 없습니다",
+        status.HTTP_403_FORBIDDEN,
+    )
 
     async def _check_permission(
-        token: Annotated[TokenPayload, Depends(get_token_payload)],
-    ) -> TokenPayload:
-        if token.role is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="역할이 지정되지 않았습니다",
-            )
-
-        try:
-            user_role = UserRole(token.role)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="알 수 없는 역할입니다",
-            )
-
-        role_perms = ROLE_PERMISSIONS.get(user_role, set())
-        if permission not in role_perms:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"'{permission}' 권한이 없습니다",
+        token: Annotated[AccessTokenPayload, Depends(source)],
+    ) -> AccessTokenPayload:
+        mask = rbac_policy.effective_mask(token)
+        if mask is None:
+            raise ErrorTemplateException(
+                ROLE_MISSING_ERROR if token.role is None else ROLE_UNKNOWN_ERROR
             )
+        if mask & required_mask != required_mask:
+            raise ErrorTemplateException(permission_denied)
         return token
 
     return _check_permission
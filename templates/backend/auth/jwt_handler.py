@@ -9,15 +9,20 @@
     uv pip install pyjwt[crypto] passlib[bcrypt]
 """
 
+import time
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 
 import jwt
 from passlib.context import CryptContext
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
+from .key_ring import KeyRing
+from .rbac import RBACPolicy
+
 
 class AuthSettings(BaseSettings):
     """인증 관련 설정.
@@ -28,6 +33,11 @@ class AuthSettings(BaseSettings):
         REFRESH_SECRET_KEY=your-refresh-secret-key
         ACCESS_TOKEN_EXPIRE_MINUTES=30
         REFRESH_TOKEN_EXPIRE_DAYS=7
+        JWT_KEYS_FILE=/run/secrets/jwt-keys.json  # 선택: kid별 키 링 (EdDSA/ES256)
+        API_KEYS_FILE=/run/secrets/api-keys.json  # 선택: 서비스 간 API 키 (api_keys)
+        BCRYPT_ROUNDS=12           # 선택: 오프라인 보정 결과 (bcrypt_cost 참고)
+        BCRYPT_TARGET_MS=250       # 선택: 시작 시 보정할 해싱 목표 지연 시간
+        TOKEN_PAYLOAD_LIGHTWEIGHT=true  # 선택: __slots__ 경량 페이로드 (LightTokenPayload)
     """
 
     SECRET_KEY: str = Field(description="Access Token 서명 시크릿 키 (256비트 이상)")
@@ -35,9 +45,35 @@ class AuthSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7)
     ALGORITHM: str = Field(default="HS256")
+    JWT_KEYS_FILE: Optional[str] = Field(
+        default=None,
+        description="Access Token 키 링 JSON 경로 (미지정 시 SECRET_KEY 단일 키)",
+    )
+    API_KEYS_FILE: Optional[str] = Field(
+        default=None, description="서비스 간 API 키 다이제스트 JSON 경로"
+    )
+    TOKEN_PAYLOAD_LIGHTWEIGHT: bool = Field(
+        default=False,
+        description="Access Token을 pydantic 대신 LightTokenPayload로 디코딩",
+    )
+    BCRYPT_ROUNDS: Optional[int] = Field(
+        default=None, ge=4, le=31, description="bcrypt cost (지정 시 보정 생략)"
+    )
+    BCRYPT_TARGET_MS: Optional[float] = Field(
+        default=None, gt=0, description="시작 시 bcrypt cost를 보정할 목표 지연 시간"
+    )
 
     model_config = {"env_prefix": "", "env_file": ".env"}
 
+    _key_ring: Optional[KeyRing] = PrivateAttr(default=None)
+
+    @property
+    def key_ring(self) -> KeyRing:
+        """Access Token 서명/검증 키 링 (최초 접근 시 한 번 파싱)."""
+        if self._key_ring is None:
+            self._key_ring = KeyRing.from_settings(self)
+        return self._key_ring
+
 
 class TokenPayload(BaseModel):
     """디코딩된 JWT 토큰 페이로드."""
@@ -47,8 +83,99 @@ class TokenPayload(BaseModel):
     iat: datetime
     jti: str
     role: Optional[str] = None
+    perm: Optional[int] = None
+    pmv: Optional[str] = None
     token_type: str = "access"
 
+    @property
+    def exp_timestamp(self) -> float:
+        """만료 시각 (UNIX timestamp)."""
+        return self.exp.timestamp()
+
+    def to_model(self) -> "TokenPayload":
+        """자기 자신을 반환합니다 (``LightTokenPayload.to_model()``과 같은 호출 형태)."""
+        return self
+
+
+class LightTokenPayload:
+    """검증된 클레임 dict에서 바로 만드는 경량 페이로드 (``__slots__``).
+
+    TokenPayload와 같은 속성(sub, exp, iat, jti, role, perm, pmv, token_type)을
+    제공하지만 pydantic 검증을 거치지 않고, ``exp``/``iat``는 처음 접근할 때
+    datetime으로 변환합니다. 대부분의 핸들러처럼 ``sub``/``role``만 읽으면
+    datetime을 만들지 않습니다.
+
+    서명과 ``exp`` 검증은 PyJWT가 이미 수행했으므로 필수 클레임 존재만 확인합니다.
+    """
+
+    __slots__ = (
+        "_exp",
+        "_iat",
+        "exp_timestamp",
+        "iat_timestamp",
+        "jti",
+        "perm",
+        "pmv",
+        "role",
+        "sub",
+        "token_type",
+    )
+
+    def __init__(self, claims: dict[str, Any], token_type: str = "access") -> None:
+        try:
+            self.sub: str = claims["sub"]
+            self.jti: str = claims["jti"]
+            self.exp_timestamp: float = claims["exp"]
+            self.iat_timestamp: float = claims["iat"]
+        except KeyError as e:
+            raise jwt.MissingRequiredClaimError(e.args[0]) from None
+        self.role: Optional[str] = claims.get("role")
+        self.perm: Optional[int] = claims.get("perm")
+        self.pmv: Optional[str] = claims.get("pmv")
+        self.token_type = token_type
+        self._exp: Optional[datetime] = None
+        self._iat: Optional[datetime] = None
+
+    @property
+    def exp(self) -> datetime:
+        """만료 시각 (처음 접근 시 변환)."""
+        if self._exp is None:
+            self._exp = datetime.fromtimestamp(self.exp_timestamp, UTC)
+        return self._exp
+
+    @property
+    def iat(self) -> datetime:
+        """발급 시각 (처음 접근 시 변환)."""
+        if self._iat is None:
+            self._iat = datetime.fromtimestamp(self.iat_timestamp, UTC)
+        return self._iat
+
+    def model_dump(self) -> dict[str, Any]:
+        """TokenPayload.model_dump()와 같은 dict를 반환합니다."""
+        return {
+            "sub": self.sub,
+            "exp": self.exp,
+            "iat": self.iat,
+            "jti": self.jti,
+            "role": self.role,
+            "perm": self.perm,
+            "pmv": self.pmv,
+            "token_type": self.token_type,
+        }
+
+    def to_model(self) -> TokenPayload:
+        """pydantic TokenPayload로 변환합니다 (응답 스키마 등에 필요할 때)."""
+        return TokenPayload(**self.model_dump())
+
+    def __repr__(self) -> str:
+        return f"LightTokenPayload(sub={self.sub!r}, role={self.role!r})"
+
+
+# decode_access_token이 반환하는 페이로드 (TOKEN_PAYLOAD_LIGHTWEIGHT에 따라 결정).
+# LightTokenPayload는 jsonable_encoder로 직렬화할 수 없으므로 응답에 담기 전
+# to_model()로 변환하세요 (TokenPayload.to_model()은 자기 자신 반환).
+AccessTokenPayload = TokenPayload | LightTokenPayload
+
 
 class TokenResponse(BaseModel):
     """토큰 응답 스키마."""
@@ -58,13 +185,63 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
-# 비밀번호 해싱 컨텍스트 (bcrypt, cost factor 12)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+# 비밀번호 해싱 컨텍스트 (bcrypt, 기본 cost factor 12)
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+def _build_pwd_context(rounds: int) -> CryptContext:
+    # min_rounds: 이보다 낮은 cost의 해시만 needs_update (cost를 낮춰도 재해싱 안 함)
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+    )
+
+
+pwd_context = _build_pwd_context(DEFAULT_BCRYPT_ROUNDS)
+
+# verify_password가 재해싱할 때 호출할 함수 (bcrypt_cost 메트릭 등)
+_rehash_listeners: list[Callable[[], None]] = []
+
+
+def add_rehash_listener(listener: Callable[[], None]) -> None:
+    """``verify_password(..., on_rehash=...)``가 재해싱할 때마다 호출할 함수를 등록합니다."""
+    _rehash_listeners.append(listener)
+
+
+_verify_listeners: list[Callable[[float], None]] = []
+
+
+def add_verify_listener(listener: Callable[[float], None]) -> None:
+    """``verify_password``의 bcrypt 비교가 끝날 때마다 실행 시간(초)으로 호출할 함수를 등록합니다."""
+    _verify_listeners.append(listener)
+
+
+def configure_password_hashing(rounds: int) -> None:
+    """새 해시에 사용할 bcrypt cost를 설정합니다.
+
+    이보다 낮은 cost의 기존 해시는 로그인 성공 시 재해싱 대상이 됩니다.
+    해싱 프로세스 풀은 다음 작업부터 새 cost로 워커를 교체합니다.
+
+    Args:
+        rounds: bcrypt cost factor (4~31)
+    """
+    global pwd_context
+    pwd_context = _build_pwd_context(rounds)
+
+
+def get_bcrypt_rounds() -> int:
+    """현재 새 해시에 사용하는 bcrypt cost를 반환합니다."""
+    return pwd_context.to_dict()["bcrypt__default_rounds"]
 
 
 def hash_password(password: str) -> str:
     """비밀번호를 bcrypt로 해싱합니다.
 
+    호출 스레드를 수백 ms 동안 점유합니다. ``async def`` 엔드포인트에서는
+    ``password_pool.hash_password_async``를 사용하세요.
+
     Args:
         password: 평문 비밀번호
 
@@ -74,17 +251,54 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_and_rehash_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """비밀번호를 비교하고, 일치하며 해시의 cost가 낮으면 새 해시를 만듭니다.
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해싱된 비밀번호
+
+    Returns:
+        (일치 여부, 새 해시 또는 None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def verify_password(
+    plain_password: str,
+    hashed_password: str,
+    on_rehash: Optional[Callable[[str], None]] = None,
+) -> bool:
     """평문 비밀번호와 해시를 비교합니다.
 
+    ``async def`` 엔드포인트에서는 ``password_pool.verify_password_async``를
+    사용하세요.
+
     Args:
         plain_password: 평문 비밀번호
         hashed_password: 해싱된 비밀번호
+        on_rehash: 일치하고 해시의 cost가 현재 설정보다 낮을 때 새 해시로 호출
+            (예: DB의 password_hash 갱신)
 
     Returns:
         일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    started = time.perf_counter()
+    new_hash = None
+    if on_rehash is None:
+        verified = pwd_context.verify(plain_password, hashed_password)
+    else:
+        verified, new_hash = verify_and_rehash_password(plain_password, hashed_password)
+    elapsed = time.perf_counter() - started
+    for listener in _verify_listeners:
+        listener(elapsed)
+    if on_rehash is not None and new_hash is not None:
+        on_rehash(new_hash)
+        for listener in _rehash_listeners:
+            listener()
+    return verified
 
 
 def create_access_token(
@@ -92,6 +306,7 @@ def create_access_token(
     subject: str,
     role: Optional[str] = None,
     extra_claims: Optional[dict[str, Any]] = None,
+    policy: Optional[RBACPolicy] = None,
 ) -> str:
     """Access Token을 생성합니다.
 
@@ -100,6 +315,7 @@ def create_access_token(
         subject: 사용자 고유 ID (sub 클레임)
         role: 사용자 역할
         extra_claims: 추가 클레임
+        policy: 지정 시 역할의 권한 마스크(perm)와 정책 버전(pmv) 클레임 포함
 
     Returns:
         JWT 문자열
@@ -117,10 +333,12 @@ def create_access_token(
 
     if role:
         payload["role"] = role
+        if policy is not None:
+            payload.update(policy.claims_for(role))
     if extra_claims:
         payload.update(extra_claims)
 
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return settings.key_ring.sign(payload)
 
 
 def create_refresh_token(
@@ -147,15 +365,14 @@ def create_refresh_token(
         "type": "refresh",
     }
 
-    return jwt.encode(
-        payload, settings.REFRESH_SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    return jwt.encode(payload, settings.REFRESH_SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_tokens(
     settings: AuthSettings,
     subject: str,
     role: Optional[str] = None,
+    policy: Optional[RBACPolicy] = None,
 ) -> TokenResponse:
     """Access Token과 Refresh Token을 함께 생성합니다.
 
@@ -163,17 +380,18 @@ def create_tokens(
         settings: 인증 설정
         subject: 사용자 고유 ID
         role: 사용자 역할
+        policy: 지정 시 Access Token에 권한 마스크 클레임 포함
 
     Returns:
         TokenResponse (access_token, refresh_token, token_type)
     """
     return TokenResponse(
-        access_token=create_access_token(settings, subject, role),
+        access_token=create_access_token(settings, subject, role, policy=policy),
         refresh_token=create_refresh_token(settings, subject),
     )
 
 
-def decode_access_token(settings: AuthSettings, token: str) -> TokenPayload:
+def decode_access_token(settings: AuthSettings, token: str) -> AccessTokenPayload:
     """Access Token을 디코딩하고 검증합니다.
 
     Args:
@@ -181,17 +399,15 @@ def decode_access_token(settings: AuthSettings, token: str) -> TokenPayload:
         token: JWT 문자열
 
     Returns:
-        TokenPayload
+        TokenPayload (``TOKEN_PAYLOAD_LIGHTWEIGHT``이면 LightTokenPayload)
 
     Raises:
         jwt.ExpiredSignatureError: 토큰 만료
-        jwt.InvalidTokenError: 유효하지 않은 토큰
+        jwt.InvalidTokenError: 유효하지 않은 토큰 (알 수 없는 kid 포함)
     """
-    payload = jwt.decode(
-        token,
-        settings.SECRET_KEY,
-        algorithms=[settings.ALGORITHM],
-    )
+    payload = settings.key_ring.verify(token)
+    if settings.TOKEN_PAYLOAD_LIGHTWEIGHT:
+        return LightTokenPayload(payload)
     return TokenPayload(**payload, token_type="access")
 
 
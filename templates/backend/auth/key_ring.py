@@ -0,0 +1,368 @@
+"""kid로 색인된 JWT 서명 키 링과 JWKS.
+
+Access Token은 키 링의 활성 키로 서명하고 헤더에 ``kid``를 기록합니다. 검증 시
+``kid``로 키를 찾으므로 여러 키를 동시에 보유할 수 있어, 새 키로 교체해도
+이전 키로 서명된 토큰은 만료될 때까지 그대로 검증됩니다.
+
+- 키는 로드 시점에 한 번만 파싱됩니다 (요청마다 PEM/시크릿 문자열 처리 없음)
+- 알고리즘: HS256, ES256, EdDSA (Ed25519) 등 PyJWT 지원 알고리즘
+- 키마다 알고리즘이 고정되어 ``alg`` 헤더 조작이 통하지 않습니다
+- 비대칭 키의 공개 키는 JWKS 문서로 제공되어 다른 서비스가 로컬에서 검증합니다
+
+키 링 파일 (``JWT_KEYS_FILE``) 예시:
+    {
+      "active_kid": "2024-06",
+      "keys": [
+        {"kid": "2024-06", "alg": "EdDSA", "private_key": "-----BEGIN ..."},
+        {"kid": "2024-01", "alg": "ES256", "public_key": "-----BEGIN ..."}
+      ]
+    }
+
+    - ``private_key``: 서명 가능한 키 (공개 키는 자동으로 도출)
+    - ``public_key``: 검증 전용 키 (교체된 이전 키)
+    - ``secret``: HS256 등 대칭 키 (JWKS에 포함되지 않음)
+
+다운스트림 서비스 사용 예시:
+    jwks_cache = JWKSCache(fetch_jwks)  # fetch_jwks: JWKS dict를 반환하는 async 함수
+    claims = await jwks_cache.verify(token)
+"""
+
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt.algorithms import get_default_algorithms
+
+_ALGORITHMS = get_default_algorithms()
+_ALGORITHMS.pop("none", None)
+
+# 헤더 세그먼트 -> 키 LRU 캐시 상한 (서명이 검증된 헤더만 저장)
+_HEADER_CACHE_SIZE = 64
+
+
+def _get_algorithm(name: str) -> Any:
+    try:
+        return _ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported JWT algorithm: {name}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    """파싱이 끝난 서명/검증 키.
+
+    Attributes:
+        kid: 키 ID (JWT 헤더의 ``kid``)
+        algorithm: JWT 알고리즘 (HS256, ES256, EdDSA 등)
+        verify_key: 검증용 키 객체 (대칭 키는 bytes)
+        sign_key: 서명용 키 객체 (None이면 검증 전용)
+    """
+
+    kid: str
+    algorithm: str
+    verify_key: Any
+    sign_key: Any = None
+
+    @property
+    def is_symmetric(self) -> bool:
+        """대칭 키(HS*) 여부. 대칭 키는 JWKS로 공개하지 않습니다."""
+        return self.algorithm.startswith("HS")
+
+    @classmethod
+    def from_secret(cls, kid: str, secret: str, algorithm: str = "HS256") -> "SigningKey":
+        """대칭 시크릿으로 키를 생성합니다."""
+        key = _get_algorithm(algorithm).prepare_key(secret)
+        return cls(kid, algorithm, verify_key=key, sign_key=key)
+
+    @classmethod
+    def from_pem(
+        cls,
+        kid: str,
+        algorithm: str,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+    ) -> "SigningKey":
+        """PEM 문자열로 비대칭 키를 생성합니다.
+
+        Args:
+            kid: 키 ID
+            algorithm: ES256, EdDSA 등
+            private_key: 개인 키 PEM (서명 가능)
+            public_key: 공개 키 PEM (private_key가 없을 때 검증 전용)
+
+        Raises:
+            ValueError: 키가 지정되지 않았거나 알고리즘과 맞지 않음
+        """
+        algo = _get_algorithm(algorithm)
+        if private_key is not None:
+            sign_key = algo.prepare_key(private_key)
+            return cls(kid, algorithm, verify_key=sign_key.public_key(), sign_key=sign_key)
+        if public_key is not None:
+            return cls(kid, algorithm, verify_key=algo.prepare_key(public_key))
+        raise ValueError(f"Key {kid!r} has neither private_key nor public_key")
+
+    @classmethod
+    def from_jwk(cls, jwk: dict[str, Any]) -> "SigningKey":
+        """JWKS의 공개 키 항목으로 검증 전용 키를 생성합니다."""
+        parsed = jwt.PyJWK(jwk)
+        return cls(jwk["kid"], parsed.algorithm_name, verify_key=parsed.key)
+
+    @classmethod
+    def generate(cls, kid: str, algorithm: str = "EdDSA") -> "SigningKey":
+        """새 키를 생성합니다 (개발/테스트, 키 교체 준비용).
+
+        Args:
+            kid: 키 ID
+            algorithm: EdDSA, ES256 또는 HS256/HS384/HS512
+        """
+        if algorithm == "EdDSA":
+            sign_key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "ES256":
+            sign_key = ec.generate_private_key(ec.SECP256R1())
+        elif algorithm.startswith("HS"):
+            key = secrets.token_bytes(64)
+            return cls(kid, algorithm, verify_key=key, sign_key=key)
+        else:
+            raise ValueError(f"Cannot generate key for algorithm: {algorithm}")
+        return cls(kid, algorithm, verify_key=sign_key.public_key(), sign_key=sign_key)
+
+    def to_jwk(self) -> Optional[dict[str, Any]]:
+        """공개 키를 JWK dict로 반환합니다 (대칭 키는 None)."""
+        if self.is_symmetric:
+            return None
+        jwk = _get_algorithm(self.algorithm).to_jwk(self.verify_key, as_dict=True)
+        jwk.update(kid=self.kid, alg=self.algorithm, use="sig")
+        return jwk
+
+
+class KeyRing:
+    """kid로 색인된 키 모음.
+
+    변경 시 새 dict를 만들어 교체하므로 요청 경로의 조회는 잠금 없이
+    항상 일관된 상태를 봅니다.
+
+    Args:
+        keys: 초기 키 목록
+        active_kid: 서명에 사용할 키 ID (None이면 검증 전용 키 링)
+    """
+
+    def __init__(self, keys: Iterable[SigningKey] = (), active_kid: Optional[str] = None) -> None:
+        self._keys: dict[str, SigningKey] = {key.kid: key for key in keys}
+        self._active: Optional[SigningKey] = None
+        self._jwks_json: Optional[bytes] = None
+        # 인코딩된 헤더 세그먼트 → 키 LRU (같은 키의 토큰은 헤더가 동일하므로
+        # 반복되는 헤더 디코딩을 건너뜁니다). 서명 검증에 성공한 헤더만 저장합니다.
+        self._by_header: OrderedDict[str, SigningKey] = OrderedDict()
+        if active_kid is not None:
+            self.activate(active_kid)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, kid: object) -> bool:
+        return kid in self._keys
+
+    @property
+    def kids(self) -> list[str]:
+        """보유한 키 ID 목록."""
+        return list(self._keys)
+
+    @property
+    def active(self) -> SigningKey:
+        """현재 서명 키.
+
+        Raises:
+            RuntimeError: 활성 키가 없음 (검증 전용 키 링)
+        """
+        if self._active is None:
+            raise RuntimeError("Key ring has no active signing key")
+        return self._active
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        """kid에 해당하는 키를 반환합니다."""
+        return self._keys.get(kid)
+
+    def add(self, key: SigningKey) -> None:
+        """키를 추가하거나 같은 kid의 키를 교체합니다."""
+        self._keys = {**self._keys, key.kid: key}
+        if self._active is not None and self._active.kid == key.kid:
+            self._active = key
+        self._jwks_json = None
+        self._by_header = OrderedDict()
+
+    def remove(self, kid: str) -> None:
+        """키를 제거합니다 (해당 키로 서명된 토큰은 더 이상 검증되지 않음).
+
+        Raises:
+            ValueError: 활성 키는 제거할 수 없음
+        """
+        if self._active is not None and self._active.kid == kid:
+            raise ValueError("Cannot remove the active key")
+        self._keys = {k: v for k, v in self._keys.items() if k != kid}
+        self._jwks_json = None
+        self._by_header = OrderedDict()
+
+    def activate(self, kid: str) -> None:
+        """서명 키를 교체합니다. 이전 키는 검증용으로 남습니다.
+
+        Raises:
+            ValueError: 없는 kid이거나 서명할 수 없는 키
+        """
+        key = self._keys.get(kid)
+        if key is None or key.sign_key is None:
+            raise ValueError(f"Key {kid!r} is not a signing key in this ring")
+        self._active = key
+        self._by_header = OrderedDict()
+
+    def sign(self, claims: dict[str, Any]) -> str:
+        """활성 키로 서명하고 헤더에 kid를 기록합니다."""
+        key = self.active
+        return jwt.encode(claims, key.sign_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def verify(self, token: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """kid에 해당하는 키와 알고리즘으로 토큰을 검증합니다.
+
+        kid가 없는 토큰(키 링 도입 이전 발급)은 활성 키로 검증합니다.
+
+        Returns:
+            검증된 클레임
+
+        Raises:
+            jwt.ExpiredSignatureError: 토큰 만료
+            jwt.InvalidTokenError: 알 수 없는 kid 또는 유효하지 않은 토큰
+        """
+        header = token.partition(".")[0]
+        key = self._by_header.get(header)
+        if key is not None:
+            self._by_header.move_to_end(header)
+            return jwt.decode(token, key.verify_key, algorithms=[key.algorithm], options=options)
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._keys.get(kid) if kid is not None else self._active
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown key id")
+        claims = jwt.decode(token, key.verify_key, algorithms=[key.algorithm], options=options)
+        # 서명이 확인된 헤더만 캐시합니다 (위조 헤더로 캐시를 채울 수 없음).
+        self._by_header[header] = key
+        if len(self._by_header) > _HEADER_CACHE_SIZE:
+            self._by_header.popitem(last=False)
+        return claims
+
+    def jwks(self) -> dict[str, Any]:
+        """비대칭 키의 공개 키를 JWKS 문서로 반환합니다."""
+        return {"keys": [jwk for key in self._keys.values() if (jwk := key.to_jwk()) is not None]}
+
+    def jwks_json(self) -> bytes:
+        """JWKS 문서의 직렬화 결과 (키가 바뀔 때까지 캐시)."""
+        if self._jwks_json is None:
+            self._jwks_json = json.dumps(self.jwks(), separators=(",", ":")).encode()
+        return self._jwks_json
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "KeyRing":
+        """키 링 JSON 파일을 로드합니다 (형식은 모듈 docstring 참고).
+
+        Raises:
+            OSError: 파일을 읽을 수 없음
+            ValueError: 형식 오류 또는 지원하지 않는 키
+        """
+        document = json.loads(Path(path).read_text())
+        keys = []
+        for entry in document["keys"]:
+            if "secret" in entry:
+                keys.append(SigningKey.from_secret(entry["kid"], entry["secret"], entry["alg"]))
+            else:
+                keys.append(
+                    SigningKey.from_pem(
+                        entry["kid"],
+                        entry["alg"],
+                        private_key=entry.get("private_key"),
+                        public_key=entry.get("public_key"),
+                    )
+                )
+        return cls(keys, active_kid=document.get("active_kid"))
+
+    @classmethod
+    def from_jwks(cls, document: dict[str, Any]) -> "KeyRing":
+        """JWKS 문서로 검증 전용 키 링을 생성합니다 (다운스트림 서비스용)."""
+        return cls(SigningKey.from_jwk(jwk) for jwk in document.get("keys", []))
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "KeyRing":
+        """AuthSettings로 키 링을 생성합니다.
+
+        ``JWT_KEYS_FILE``이 있으면 파일을, 없으면 ``SECRET_KEY``와 ``ALGORITHM``으로
+        kid ``default``인 단일 키를 사용합니다.
+        """
+        if settings.JWT_KEYS_FILE:
+            return cls.from_file(settings.JWT_KEYS_FILE)
+        if settings.ALGORITHM.startswith("HS"):
+            key = SigningKey.from_secret("default", settings.SECRET_KEY, settings.ALGORITHM)
+        else:
+            key = SigningKey.from_pem(
+                "default", settings.ALGORITHM, private_key=settings.SECRET_KEY
+            )
+        return cls([key], active_kid="default")
+
+
+class JWKSCache:
+    """인증 서비스의 JWKS를 캐시하여 로컬에서 토큰을 검증합니다 (다운스트림용).
+
+    캐시가 ``max_age``보다 오래되었거나, 모르는 kid의 토큰이 들어오면 다시
+    가져옵니다. 모르는 kid로 인한 재조회는 ``min_refresh_interval``마다 한 번으로
+    제한됩니다.
+
+    Args:
+        fetch: JWKS 문서(dict)를 반환하는 async 함수
+        max_age: 캐시 유지 시간 (초)
+        min_refresh_interval: 모르는 kid로 인한 재조회 최소 간격 (초)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        max_age: float = 300.0,
+        min_refresh_interval: float = 30.0,
+    ) -> None:
+        self.fetch = fetch
+        self.max_age = max_age
+        self.min_refresh_interval = min_refresh_interval
+        self._ring: Optional[KeyRing] = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _needs_refresh(self, kid: Optional[str]) -> bool:
+        if self._ring is None:
+            return True
+        age = time.monotonic() - self._fetched_at
+        if age >= self.max_age:
+            return True
+        return kid is not None and kid not in self._ring and age >= self.min_refresh_interval
+
+    async def get_ring(self, kid: Optional[str] = None) -> KeyRing:
+        """캐시된 키 링을 반환하고, 필요하면 JWKS를 다시 가져옵니다."""
+        if self._needs_refresh(kid):
+            async with self._lock:
+                if self._needs_refresh(kid):
+                    self._ring = KeyRing.from_jwks(await self.fetch())
+                    self._fetched_at = time.monotonic()
+        return self._ring
+
+    async def verify(self, token: str, options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """캐시된 공개 키로 토큰을 검증합니다.
+
+        Raises:
+            jwt.ExpiredSignatureError: 토큰 만료
+            jwt.InvalidTokenError: 알 수 없는 kid 또는 유효하지 않은 토큰
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        ring = await self.get_ring(kid)
+        return ring.verify(token, options)
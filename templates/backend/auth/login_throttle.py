@@ -0,0 +1,289 @@
+"""로그인 시도 제한 (계정별 / IP별 토큰 버킷).
+
+실패한 로그인도 bcrypt ``verify_password`` 한 번의 CPU를 소모하므로, 잘못된
+비밀번호를 반복 전송하는 것만으로 서버 CPU를 점유할 수 있습니다. 이 모듈은
+해싱 전에 계정별, IP별 시도 횟수를 확인하여 초과 요청을 429로 즉시 거절합니다.
+
+- 토큰 버킷: ``capacity``번까지 연속 시도 가능, 이후 ``refill_per_second`` 속도로 회복
+- 샤딩: 버킷을 여러 dict로 나누어 유휴 버킷 정리를 샤드 하나씩 점진적으로 수행
+  (한 번의 정리가 전체 버킷을 순회하지 않음)
+- 유휴 제거: ``idle_seconds`` 동안 사용되지 않은 버킷은 제거 (가득 찬 버킷과 동일).
+  제거는 버킷을 가득 채우는 것과 같으므로 ``idle_seconds``는 빈 버킷이 가득 차는
+  시간(``capacity / refill``) 이상이어야 합니다
+- 크기 제한: 버킷 수가 ``max_entries``를 넘으면 가장 오래 사용되지 않은 버킷부터
+  제거 (무작위 IP/계정 스프레이로 메모리가 무한히 늘지 않음)
+- 백엔드: 여러 워커/인스턴스가 한도를 공유하려면 ``ThrottleBackend``를 구현
+  (Redis 등). 기본값과 테스트에는 ``LocalThrottleBackend``를 사용합니다
+
+사용 예시:
+    @router.post("/auth/login")
+    async def login(body: LoginRequest, request: Request):
+        await login_throttle.check(body.email, request.client.host)  # 해싱 전
+        if not await verify_password_async(body.password, user.password_hash):
+            ...
+        await login_throttle.reset_account(body.email)  # 로그인 성공
+"""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Protocol
+
+from fastapi import status
+
+from ..error_templates import ErrorTemplateException, PrerenderedError
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+
+class ShardedBuckets:
+    """샤드로 나뉜 토큰 버킷 저장소 (프로세스 로컬).
+
+    샤드마다 최근 사용 순서를 유지하므로 크기 제한에 걸리면 가장 오래 사용되지
+    않은(가장 많이 회복된) 버킷부터 제거됩니다.
+
+    Args:
+        shards: 샤드 수
+        idle_seconds: 이 시간 동안 사용되지 않은 버킷 제거
+        sweep_interval: 샤드 하나를 정리하는 간격 (초)
+        max_entries: 전체 버킷 수 상한 (샤드마다 ``max_entries / shards``)
+
+    Raises:
+        ValueError: 샤드 수가 1 미만이거나 ``max_entries``보다 큼
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        idle_seconds: float = 900.0,
+        sweep_interval: float = 1.0,
+        max_entries: int = 100_000,
+    ) -> None:
+        if not 1 <= shards <= max_entries:
+            raise ValueError("shards must be between 1 and max_entries")
+        self.idle_seconds = idle_seconds
+        self.sweep_interval = sweep_interval
+        self.max_entries = max_entries
+        self._shard_limit = max_entries // shards
+        self._shards: list[OrderedDict[str, _Bucket]] = [OrderedDict() for _ in range(shards)]
+        self._sweep_index = 0
+        self._next_sweep_at = 0.0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def check_rate(self, capacity: float, refill_per_second: float) -> None:
+        """버킷 설정이 유휴 제거 시간과 맞는지 확인합니다.
+
+        유휴 제거는 버킷을 가득 채우는 것과 같으므로, 빈 버킷이 가득 차기 전에
+        제거되면 회복 속도보다 빨리 시도 횟수가 돌아옵니다.
+
+        Raises:
+            ValueError: 회복 속도가 0 이하이거나 ``idle_seconds``가
+                ``capacity / refill_per_second``보다 짧음
+        """
+        if refill_per_second <= 0:
+            raise ValueError("refill rate must be positive")
+        if self.idle_seconds < capacity / refill_per_second:
+            raise ValueError(
+                f"idle_seconds ({self.idle_seconds}) must be at least "
+                f"capacity / refill rate ({capacity / refill_per_second:.0f}s)"
+            )
+
+    def consume(self, key: str, capacity: float, refill_per_second: float, now: float) -> float:
+        """토큰 하나를 사용합니다.
+
+        Returns:
+            0.0이면 허용, 양수면 다음 시도까지 기다려야 하는 시간 (초)
+        """
+        if now >= self._next_sweep_at:
+            self._sweep(now)
+
+        shard = self._shards[hash(key) % len(self._shards)]
+        bucket = shard.get(key)
+        if bucket is None:
+            if len(shard) >= self._shard_limit:
+                shard.popitem(last=False)
+                self.evictions += 1
+            bucket = shard[key] = _Bucket(capacity, now)
+        else:
+            shard.move_to_end(key)
+            elapsed = now - bucket.updated
+            bucket.tokens = min(capacity, bucket.tokens + elapsed * refill_per_second)
+            bucket.updated = now
+
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return 0.0
+        return (1.0 - bucket.tokens) / refill_per_second
+
+    def reset(self, key: str) -> None:
+        """버킷을 제거합니다 (가득 찬 상태로 돌아감)."""
+        self._shards[hash(key) % len(self._shards)].pop(key, None)
+
+    def _sweep(self, now: float) -> None:
+        shard = self._shards[self._sweep_index]
+        cutoff = now - self.idle_seconds
+        for key in [k for k, b in shard.items() if b.updated < cutoff]:
+            del shard[key]
+        self._sweep_index = (self._sweep_index + 1) % len(self._shards)
+        self._next_sweep_at = now + self.sweep_interval
+
+
+class ThrottleBackend(Protocol):
+    """토큰 버킷 저장소 (워커 간 공유 시 Redis 등으로 구현)."""
+
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """토큰 하나를 사용하고 대기 시간(초, 허용 시 0)을 반환합니다."""
+        ...
+
+    async def reset(self, key: str) -> None:
+        """버킷을 초기화합니다."""
+        ...
+
+
+class LocalThrottleBackend:
+    """프로세스 로컬 ThrottleBackend (단일 워커, 테스트용).
+
+    Args:
+        shards: 샤드 수
+        idle_seconds: 유휴 버킷 제거 시간 (초)
+        max_entries: 전체 버킷 수 상한
+        clock: 현재 시각 함수 (테스트에서 교체)
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        idle_seconds: float = 900.0,
+        max_entries: int = 100_000,
+        clock: Any = time.monotonic,
+    ) -> None:
+        self.buckets = ShardedBuckets(
+            shards=shards, idle_seconds=idle_seconds, max_entries=max_entries
+        )
+        self.clock = clock
+
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        return self.buckets.consume(key, capacity, refill_per_second, self.clock())
+
+    async def reset(self, key: str) -> None:
+        self.buckets.reset(key)
+
+
+@lru_cache(maxsize=128)
+def _throttled_error(retry_after: int) -> PrerenderedError:
+    """Retry-After 값별로 사전 렌더링된 429 응답 (값 범위가 작아 캐시)."""
+    return PrerenderedError(
+        "TOO_MANY_REQUESTS",
+        "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class LoginThrottledError(ErrorTemplateException):
+    """로그인 시도 한도를 초과했을 때 발생합니다 (429 응답)."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(_throttled_error(max(1, math.ceil(retry_after))))
+        self.retry_after = retry_after
+
+
+@dataclass
+class LoginThrottleStats:
+    """로그인 시도 제한 통계."""
+
+    allowed: int = 0
+    rejected_ip: int = 0
+    rejected_account: int = 0
+
+
+class LoginThrottle:
+    """계정별, IP별 로그인 시도 제한.
+
+    Args:
+        backend: 버킷 저장소 (None이면 LocalThrottleBackend)
+        account_capacity: 계정별 연속 시도 허용 횟수
+        account_refill_per_minute: 계정별 분당 회복 횟수
+        ip_capacity: IP별 연속 시도 허용 횟수
+        ip_refill_per_minute: IP별 분당 회복 횟수
+
+    Raises:
+        ValueError: LocalThrottleBackend의 ``idle_seconds``가 버킷이 가득 차는
+            시간보다 짧음
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ThrottleBackend] = None,
+        account_capacity: float = 5,
+        account_refill_per_minute: float = 5,
+        ip_capacity: float = 20,
+        ip_refill_per_minute: float = 30,
+    ) -> None:
+        self.backend = backend or LocalThrottleBackend()
+        self.account_capacity = account_capacity
+        self.account_refill = account_refill_per_minute / 60
+        self.ip_capacity = ip_capacity
+        self.ip_refill = ip_refill_per_minute / 60
+        self.stats = LoginThrottleStats()
+        if isinstance(self.backend, LocalThrottleBackend):
+            self.backend.buckets.check_rate(account_capacity, self.account_refill)
+            self.backend.buckets.check_rate(ip_capacity, self.ip_refill)
+
+    @staticmethod
+    def _account_key(account: str) -> str:
+        return "acct:" + account.strip().lower()
+
+    async def check(self, account: str, ip: Optional[str]) -> None:
+        """로그인 시도를 기록하고, 한도를 넘으면 거절합니다 (해싱 전에 호출).
+
+        Args:
+            account: 로그인 ID (이메일 등, 대소문자 무시)
+            ip: 클라이언트 IP (None이면 IP 제한 생략)
+
+        Raises:
+            LoginThrottledError: IP 또는 계정의 시도 한도 초과 (429)
+        """
+        if ip is not None:
+            wait = await self.backend.consume("ip:" + ip, self.ip_capacity, self.ip_refill)
+            if wait:
+                self.stats.rejected_ip += 1
+                raise LoginThrottledError(wait)
+
+        wait = await self.backend.consume(
+            self._account_key(account), self.account_capacity, self.account_refill
+        )
+        if wait:
+            self.stats.rejected_account += 1
+            raise LoginThrottledError(wait)
+        self.stats.allowed += 1
+
+    async def reset_account(self, account: str) -> None:
+        """로그인 성공 시 계정의 시도 기록을 초기화합니다."""
+        await self.backend.reset(self._account_key(account))
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        snapshot: dict[str, Any] = {
+            "allowed": self.stats.allowed,
+            "rejected_ip": self.stats.rejected_ip,
+            "rejected_account": self.stats.rejected_account,
+        }
+        if isinstance(self.backend, LocalThrottleBackend):
+            snapshot["buckets"] = len(self.backend.buckets)
+            snapshot["bucket_evictions"] = self.backend.buckets.evictions
+        return snapshot
+
+
+login_throttle = LoginThrottle()
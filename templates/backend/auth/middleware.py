@@ -0,0 +1,202 @@
+"""요청당 한 번 인증하는 ASGI 미들웨어 (opt-in).
+
+보호된 라우트(의존성 트리에 ``get_token_payload`` 또는
+``get_authenticated_payload``가 있는 라우트)의 요청만 Authorization 헤더를
+검증하고, 검증된 페이로드를 ``scope["state"]``에 저장합니다.
+
+라우트는 경량 의존성(``get_authenticated_user``,
+``require_role(..., source=get_authenticated_payload)`` 등)을 사용해야 합니다.
+이 의존성은 저장된 페이로드만 읽으므로 FastAPI가 ``bearer_scheme``,
+``get_auth_settings`` 하위 의존성을 해석하지 않습니다. ``get_token_payload``
+기반 의존성은 미들웨어와 무관하게 헤더를 다시 검증합니다.
+
+- 라우트 테이블: 첫 요청 시 앱의 라우트를 한 번 분석하여 정적 경로는 dict,
+  경로 파라미터가 있는 경로는 정규식 목록으로 보관 (이후 요청은 조회만)
+- 공개 라우트: 헤더를 읽지 않고 그대로 통과
+- 인증 실패: 라우팅/의존성 해석 전에 사전 렌더링된 401 응답을 바로 전송
+- 테이블에 없는 경로(Mount 하위 앱 등): 그대로 통과하며, 경량 의존성은
+  저장된 페이로드가 없으므로 401로 거부합니다 (보호가 약해지지 않음)
+
+사용 예시:
+    from app.core.auth.middleware import AuthenticationMiddleware
+
+    app.add_middleware(AuthenticationMiddleware)
+    app.add_middleware(RequestContextMiddleware)  # 바깥쪽 (request_id, 타이밍)
+
+    @router.get("/me")
+    async def get_me(user: AccessTokenPayload = Depends(get_authenticated_user)): ...
+"""
+
+import inspect
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..error_templates import ErrorTemplateException, PrerenderedError
+from . import dependencies
+from .dependencies import (
+    TOKEN_PAYLOAD_STATE_KEY,
+    TOKEN_REQUIRED_ERROR,
+    authenticate_token,
+    get_authenticated_payload,
+    get_token_payload,
+)
+
+# 라우트를 보호 대상으로 표시하는 의존성
+_TOKEN_DEPENDENCIES = (get_token_payload, get_authenticated_payload)
+
+
+def _requires_token(dependant: Dependant) -> bool:
+    """의존성 트리에 토큰 의존성이 있는지 확인합니다."""
+    for sub in dependant.dependencies:
+        if sub.call in _TOKEN_DEPENDENCIES or _requires_token(sub):
+            return True
+    return False
+
+
+class RouteTable:
+    """경로/메서드별 인증 필요 여부 (라우트 정의에서 한 번 계산).
+
+    Starlette와 같은 순서로 라우트를 매칭합니다. 정적 경로가 앞선 동적 경로에
+    가려지면 (예: ``/users/{id}`` 뒤의 ``/users/me``) 앞선 라우트의 값을 씁니다.
+
+    Args:
+        routes: 앱의 라우트 목록 (``app.routes``)
+    """
+
+    def __init__(self, routes: Iterable[Any]) -> None:
+        self.static: dict[tuple[str, str], bool] = {}
+        self.dynamic: list[tuple[Any, frozenset[str], bool]] = []
+        for route in routes:
+            if not isinstance(route, APIRoute):
+                continue
+            methods = frozenset(route.methods or ())
+            protected = _requires_token(route.dependant)
+            if route.param_convertors:
+                self.dynamic.append((route.path_regex, methods, protected))
+                continue
+            for method in methods:
+                key = (method, route.path)
+                if key not in self.static:
+                    self.static[key] = self._shadowed(route.path, method, protected)
+
+    def _shadowed(self, path: str, method: str, protected: bool) -> bool:
+        for regex, methods, dynamic_protected in self.dynamic:
+            if method in methods and regex.match(path):
+                return dynamic_protected
+        return protected
+
+    def __len__(self) -> int:
+        return len(self.static) + len(self.dynamic)
+
+    def is_protected(self, method: str, path: str) -> bool:
+        """요청이 인증이 필요한 라우트로 가는지 반환합니다 (모르면 False)."""
+        protected = self.static.get((method, path))
+        if protected is not None:
+            return protected
+        for regex, methods, dynamic_protected in self.dynamic:
+            if method in methods and regex.match(path):
+                return dynamic_protected
+        return False
+
+
+@dataclass
+class AuthenticationStats:
+    """인증 미들웨어 통계."""
+
+    authenticated: int = 0
+    rejected: int = 0
+    bypassed: int = 0
+
+
+def _route_path(scope: Scope) -> str:
+    """root_path를 제외한 라우팅 경로를 반환합니다."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path) :]
+    return path
+
+
+def _bearer_token(scope: Scope) -> Optional[str]:
+    """Authorization 헤더의 Bearer 토큰을 반환합니다 (HTTPBearer와 같은 규칙)."""
+    for key, value in scope["headers"]:
+        if key == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            return token
+    return None
+
+
+class AuthenticationMiddleware:
+    """보호된 라우트의 토큰을 요청당 한 번 검증하는 ASGI 미들웨어.
+
+    인증 설정은 ``get_auth_settings``를 사용하며, 앱의 ``dependency_overrides``에
+    교체 함수가 있으면 그것을 사용합니다 (테스트와 동일한 설정 공유).
+
+    Args:
+        app: ASGI 애플리케이션
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.route_table: Optional[RouteTable] = None
+        self.stats = AuthenticationStats()
+
+    async def _reject(
+        self, template: PrerenderedError, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        self.stats.rejected += 1
+        await template.render()(scope, receive, send)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        fastapi_app = scope["app"]
+        route_table = self.route_table
+        if route_table is None:
+            # 라우트는 첫 요청 전에 모두 등록되므로 한 번만 계산합니다.
+            route_table = self.route_table = RouteTable(fastapi_app.routes)
+
+        if not route_table.is_protected(scope["method"], _route_path(scope)):
+            self.stats.bypassed += 1
+            await self.app(scope, receive, send)
+            return
+
+        token = _bearer_token(scope)
+        if token is None:
+            await self._reject(TOKEN_REQUIRED_ERROR, scope, receive, send)
+            return
+
+        overrides = fastapi_app.dependency_overrides
+        settings_getter = overrides.get(
+            dependencies.get_auth_settings, dependencies.get_auth_settings
+        )
+        settings = settings_getter()
+        if inspect.isawaitable(settings):
+            settings = await settings
+        try:
+            payload = authenticate_token(settings, token)
+        except ErrorTemplateException as e:
+            await self._reject(e.template, scope, receive, send)
+            return
+
+        self.stats.authenticated += 1
+        scope.setdefault("state", {})[TOKEN_PAYLOAD_STATE_KEY] = payload
+        await self.app(scope, receive, send)
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        return {
+            "authenticated": self.stats.authenticated,
+            "rejected": self.stats.rejected,
+            "bypassed": self.stats.bypassed,
+            "routes": len(self.route_table) if self.route_table is not None else 0,
+        }
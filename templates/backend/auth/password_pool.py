@@ -0,0 +1,268 @@
+"""비밀번호 해싱 전용 프로세스 풀.
+
+bcrypt(cost 12) 해싱/검증은 호출당 수백 ms 동안 CPU를 점유합니다. ``async def``
+엔드포인트에서 ``hash_password``/``verify_password``를 직접 호출하면 그동안
+이벤트 루프가 멈춰 같은 워커의 다른 요청까지 모두 지연됩니다.
+
+이 모듈은 해싱을 크기가 제한된 별도 프로세스 풀에서 실행하는 async 함수를
+제공합니다.
+
+- 동시 실행: ``max_workers``개 프로세스 (기본: CPU 수, 최대 4)
+- 대기열 제한: 실행 중 + 대기 중 작업이 ``max_pending``에 도달하면 즉시 503 거절
+- 메트릭: 대기 시간(제출 → 워커 시작)과 실행 시간(워커 내 해싱)
+- bcrypt cost: 워커는 생성 시 부모의 현재 cost를 받으며, cost가 바뀌면
+  (``configure_bcrypt_cost``) 다음 작업부터 새 워커로 교체됩니다
+
+사용 예시:
+    # main.py lifespan
+    await password_pool.start()
+    yield
+    password_pool.shutdown()
+
+    # 로그인 라우터
+    if not await verify_password_async(body.password, user.password_hash):
+        raise ErrorTemplateException(get_error_template("UNAUTHORIZED"))
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
+
+from fastapi import status
+
+from ..error_templates import ErrorTemplateException, PrerenderedError
+from .bcrypt_cost import bcrypt_metrics
+from .jwt_handler import (
+    configure_password_hashing,
+    get_bcrypt_rounds,
+    hash_password,
+    verify_and_rehash_password,
+    verify_password,
+)
+
+T = TypeVar("T")
+
+PASSWORD_POOL_BUSY_ERROR = PrerenderedError(
+    "SERVICE_UNAVAILABLE",
+    "요청이 많아 잠시 후 다시 시도해주세요",
+    status.HTTP_503_SERVICE_UNAVAILABLE,
+    headers={"Retry-After": "1"},
+)
+
+
+class PasswordPoolBusyError(ErrorTemplateException):
+    """해싱 대기열이 가득 차 요청을 거절할 때 발생합니다 (503 응답)."""
+
+    def __init__(self) -> None:
+        super().__init__(PASSWORD_POOL_BUSY_ERROR)
+
+
+@dataclass
+class PasswordPoolMetrics:
+    """해싱 풀 통계 (시간 단위: 초)."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    pending: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    exec_seconds_total: float = 0.0
+    exec_seconds_max: float = 0.0
+
+    def record(self, wait_seconds: float, exec_seconds: float) -> None:
+        """완료된 작업 하나의 대기/실행 시간을 기록합니다."""
+        self.completed += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        self.exec_seconds_total += exec_seconds
+        self.exec_seconds_max = max(self.exec_seconds_max, exec_seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다 (시간은 ms)."""
+        completed = self.completed or 1
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "pending": self.pending,
+            "wait_ms_avg": self.wait_seconds_total / completed * 1000,
+            "wait_ms_max": self.wait_seconds_max * 1000,
+            "exec_ms_avg": self.exec_seconds_total / completed * 1000,
+            "exec_ms_max": self.exec_seconds_max * 1000,
+        }
+
+
+def _run_timed(fn: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+    """워커 프로세스에서 실행: (결과, 시작 시각, 실행 시간)을 반환합니다.
+
+    ``time.monotonic``은 시스템 전역 시계이므로 부모 프로세스의 제출 시각과
+    비교하여 대기 시간을 계산할 수 있습니다.
+    """
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic() - started
+
+
+def _warm_up() -> None:
+    """워커 프로세스 생성과 모듈 임포트를 시작 시점으로 앞당깁니다."""
+
+
+class PasswordHasherPool:
+    """크기와 대기열이 제한된 비밀번호 해싱 프로세스 풀.
+
+    Args:
+        max_workers: 워커 프로세스 수 (None이면 CPU 수, 최대 4)
+        max_pending: 실행 중 + 대기 중 작업 상한 (None이면 max_workers * 4)
+        mp_context: multiprocessing 시작 방식 (스레드가 있는 프로세스의 fork를
+            피하기 위해 기본 "spawn")
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending or self.max_workers * 4
+        if self.max_pending < self.max_workers:
+            raise ValueError("max_pending must be >= max_workers")
+        self.mp_context = mp_context
+        self.metrics = PasswordPoolMetrics()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._rounds: Optional[int] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        rounds = get_bcrypt_rounds()
+        if self._executor is not None and self._rounds != rounds:
+            # 실행 중인 작업은 이전 워커에서 끝까지 처리됩니다.
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context),
+                initializer=configure_password_hashing,
+                initargs=(rounds,),
+            )
+            self._rounds = rounds
+        return self._executor
+
+    async def start(self) -> None:
+        """워커 프로세스를 미리 띄웁니다 (첫 로그인 요청의 지연 방지)."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _warm_up) for _ in range(self.max_workers))
+        )
+
+    def shutdown(self) -> None:
+        """풀을 종료합니다 (대기 중인 작업은 취소)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """함수를 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            fn: 모듈 최상위 함수 (pickle 가능해야 함)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            PasswordPoolBusyError: 대기열이 가득 참 (작업을 제출하지 않음)
+        """
+        result, _ = await self.run_timed(fn, *args)
+        return result
+
+    async def run_timed(self, fn: Callable[..., T], *args: Any) -> tuple[T, float]:
+        """``run``과 같으며, 워커 내 실행 시간(초)을 함께 반환합니다."""
+        metrics = self.metrics
+        if metrics.pending >= self.max_pending:
+            metrics.rejected += 1
+            raise PasswordPoolBusyError()
+
+        metrics.submitted += 1
+        metrics.pending += 1
+        loop = asyncio.get_running_loop()
+        submitted_at = time.monotonic()
+        try:
+            result, started, exec_seconds = await loop.run_in_executor(
+                self._get_executor(), _run_timed, fn, *args
+            )
+        except BaseException:
+            metrics.failed += 1
+            raise
+        finally:
+            metrics.pending -= 1
+        metrics.record(max(0.0, started - submitted_at), exec_seconds)
+        return result, exec_seconds
+
+
+password_pool = PasswordHasherPool()
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호를 해싱 풀에서 bcrypt로 해싱합니다 (이벤트 루프 비차단).
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        해싱된 비밀번호 문자열
+
+    Raises:
+        PasswordPoolBusyError: 해싱 대기열이 가득 참
+    """
+    hashed, seconds = await password_pool.run_timed(hash_password, password)
+    bcrypt_metrics.record_hash(seconds)
+    return hashed
+
+
+async def verify_password_async(
+    plain_password: str,
+    hashed_password: str,
+    on_rehash: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> bool:
+    """평문 비밀번호와 해시를 해싱 풀에서 비교합니다 (이벤트 루프 비차단).
+
+    일치하고 해시의 cost가 현재 설정보다 낮으면, 같은 워커 작업에서 새 cost로
+    재해싱하여 ``on_rehash``로 전달합니다 (추가 왕복 없음).
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해싱된 비밀번호
+        on_rehash: 새 해시를 저장하는 코루틴 함수 (예: DB password_hash 갱신)
+
+    Returns:
+        일치 여부
+
+    Raises:
+        PasswordPoolBusyError: 해싱 대기열이 가득 참
+    """
+    if on_rehash is None:
+        verified, seconds = await password_pool.run_timed(
+            verify_password, plain_password, hashed_password
+        )
+        bcrypt_metrics.record_verify(seconds)
+        return verified
+
+    (verified, new_hash), seconds = await password_pool.run_timed(
+        verify_and_rehash_password, plain_password, hashed_password
+    )
+    bcrypt_metrics.record_verify(seconds)
+    if new_hash is not None:
+        await on_rehash(new_hash)
+        bcrypt_metrics.record_rehash()
+    return verified
@@ -0,0 +1,140 @@
+"""비트마스크로 컴파일된 역할 기반 접근 제어 (RBAC).
+
+역할/권한 매핑을 앱 시작 시 정수 비트마스크로 컴파일하여, 요청마다의 권한
+확인을 dict 조회 한 번과 AND 연산 한 번으로 처리합니다.
+
+- 권한마다 비트 하나를 할당 (권한 이름 정렬 순서)
+- 역할 상속: ``inherits={"admin": ["manager"]}``이면 admin은 manager의 권한을
+  모두 가지며 ``require_role("manager")``도 통과
+- 토큰 클레임: ``create_access_token(..., policy=rbac_policy)``로 발급하면
+  ``perm``(권한 마스크)과 ``pmv``(정책 버전)가 포함됩니다. 정책이 바뀌어
+  ``pmv``가 다르면 클레임을 무시하고 역할로 다시 계산합니다
+
+사용 예시:
+    policy = RBACPolicy(
+        {"admin": {"manage_users"}, "manager": {"delete"}, "user": {"read", "write"}},
+        inherits={"admin": ["manager"], "manager": ["user"]},
+    )
+    required = policy.mask_of("read", "delete")
+    allowed = policy.effective_mask(token) & required == required
+"""
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from enum import Enum
+from typing import Any, Optional
+
+
+def _name(role: Any) -> str:
+    """UserRole(str, Enum) 등 Enum 멤버는 값으로 변환합니다."""
+    return role.value if isinstance(role, Enum) else str(role)
+
+
+class RBACPolicy:
+    """컴파일된 역할/권한 정책.
+
+    Args:
+        role_permissions: 역할별 (직접 부여된) 권한 목록
+        inherits: 역할별 상속할 역할 목록
+
+    Raises:
+        ValueError: 정의되지 않은 역할을 상속하거나 상속 순환이 있음
+    """
+
+    def __init__(
+        self,
+        role_permissions: Mapping[str, Iterable[str]],
+        inherits: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> None:
+        role_permissions = {_name(role): set(perms) for role, perms in role_permissions.items()}
+        inherits = {
+            _name(role): [_name(parent) for parent in parents]
+            for role, parents in (inherits or {}).items()
+        }
+        for role, parents in inherits.items():
+            for name in (role, *parents):
+                if name not in role_permissions:
+                    raise ValueError(f"Unknown role in inherits: {name}")
+
+        permissions = sorted(set().union(*role_permissions.values()))
+        self.permission_bits: dict[str, int] = {perm: 1 << i for i, perm in enumerate(permissions)}
+        roles = sorted(role_permissions)
+        self.role_bits: dict[str, int] = {role: 1 << i for i, role in enumerate(roles)}
+
+        self.role_masks: dict[str, int] = {}
+        # 역할 자신 + 상속한 모든 역할의 비트 (require_role 검사용)
+        self.role_lineage: dict[str, int] = {}
+        for role in roles:
+            lineage = self._resolve(role, inherits, ())
+            self.role_lineage[role] = self._bits(lineage, self.role_bits)
+            self.role_masks[role] = self.mask_of(
+                *set().union(*(role_permissions[r] for r in lineage))
+            )
+
+        # 비트 할당이나 역할별 권한이 바뀌면 버전이 바뀌어 기존 perm 클레임이 무시됨
+        fingerprint = repr((sorted(self.permission_bits.items()), sorted(self.role_masks.items())))
+        self.version = hashlib.blake2b(fingerprint.encode(), digest_size=4).hexdigest()
+
+    @staticmethod
+    def _bits(names: Iterable[str], table: Mapping[str, int]) -> int:
+        mask = 0
+        for name in names:
+            mask |= table[name]
+        return mask
+
+    def _resolve(
+        self, role: str, inherits: Mapping[str, list[str]], path: tuple[str, ...]
+    ) -> set[str]:
+        if role in path:
+            raise ValueError(f"Role inheritance cycle: {' -> '.join((*path, role))}")
+        lineage = {role}
+        for parent in inherits.get(role, ()):
+            lineage |= self._resolve(parent, inherits, (*path, role))
+        return lineage
+
+    def mask_of(self, *permissions: str) -> int:
+        """권한 목록의 비트마스크를 반환합니다.
+
+        Raises:
+            ValueError: 정의되지 않은 권한 (라우터 정의 시점에 발견)
+        """
+        try:
+            return self._bits(permissions, self.permission_bits)
+        except KeyError as e:
+            raise ValueError(f"Unknown permission: {e.args[0]}") from None
+
+    def roles_mask(self, *roles: str) -> int:
+        """역할 목록의 비트마스크를 반환합니다.
+
+        Raises:
+            ValueError: 정의되지 않은 역할
+        """
+        try:
+            return self._bits((_name(role) for role in roles), self.role_bits)
+        except KeyError as e:
+            raise ValueError(f"Unknown role: {e.args[0]}") from None
+
+    def effective_mask(self, token: Any) -> Optional[int]:
+        """토큰의 권한 마스크를 반환합니다 (역할이 없거나 알 수 없으면 None).
+
+        현재 정책 버전으로 발급된 ``perm`` 클레임이 있으면 그대로 사용합니다.
+
+        Args:
+            token: ``role``, ``perm``, ``pmv`` 속성을 가진 TokenPayload 또는 LightTokenPayload
+        """
+        if token.perm is not None and token.pmv == self.version:
+            return token.perm
+        if token.role is None:
+            return None
+        return self.role_masks.get(token.role)
+
+    def permissions_of(self, mask: int) -> set[str]:
+        """비트마스크를 권한 이름 집합으로 되돌립니다 (디버깅, 관리 화면용)."""
+        return {perm for perm, bit in self.permission_bits.items() if mask & bit}
+
+    def claims_for(self, role: Optional[str]) -> dict[str, Any]:
+        """토큰에 넣을 권한 클레임을 반환합니다 (알 수 없는 역할이면 빈 dict)."""
+        mask = self.role_masks.get(_name(role)) if role is not None else None
+        if mask is None:
+            return {}
+        return {"perm": mask, "pmv": self.version}
@@ -0,0 +1,272 @@
+"""Access Token 폐기(jti) 목록.
+
+로그아웃, 비밀번호 변경, 계정 정지 시 아직 만료되지 않은 토큰을 거부하기 위해
+폐기된 ``jti``를 프로세스 메모리에 보관합니다. 요청마다 DB를 조회하지 않습니다.
+
+- 조회: Bloom 필터로 대부분의 (폐기되지 않은) 토큰을 먼저 걸러내고, 양성일 때만
+  정확한 집합을 확인합니다 (O(1), 오탐 없음)
+- 만료: 항목은 토큰 ``exp``에 맞춘 타이머 휠 슬롯에 들어가 만료 후 제거됩니다.
+  토큰이 만료되면 폐기 여부를 기억할 필요가 없으므로 메모리는
+  "폐기 빈도 x Access Token 수명"으로 제한됩니다
+- 동기화: 여러 워커/인스턴스는 ``RevocationSource``(Redis, DB 등)로 폐기 목록을
+  공유합니다. 테스트에는 ``InMemoryRevocationSource``를 사용합니다
+
+사용 예시:
+    # main.py lifespan
+    revocations = enable_revocation(source=RedisRevocationSource(redis))
+    sync_task = asyncio.create_task(revocations.run_sync(interval=1.0))
+
+    # 로그아웃 라우터
+    await revocations.revoke(token.jti, token.exp.timestamp())
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable
+from typing import Any, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# 두 번째 해시 값을 얻기 위한 상수
+_SALT = 0x9E3779B9
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (문자열 전용).
+
+    Args:
+        capacity: 예상 항목 수
+        error_rate: 목표 오탐률
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _hashes(self, item: str) -> tuple[int, int]:
+        # str의 hash()는 객체에 캐시되므로 다이제스트 계산보다 훨씬 저렴합니다.
+        # 값은 프로세스마다 다르지만 필터는 프로세스 안에서만 쓰입니다.
+        return hash(item), hash((item, _SALT)) | 1
+
+    def add(self, item: str) -> None:
+        """항목을 추가합니다."""
+        bits = self._bits
+        h1, h2 = self._hashes(item)
+        for i in range(self.hash_count):
+            pos = (h1 + i * h2) % self.size
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        size = self.size
+        h1, h2 = self._hashes(item)
+        for i in range(self.hash_count):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        """비트 배열 크기 (bytes)."""
+        return len(self._bits)
+
+
+class RevocationSource(Protocol):
+    """폐기 목록 공유 저장소 (Redis Stream, DB 테이블 등).
+
+    ``cursor``는 저장소가 정의하는 불투명한 위치 값입니다 (최초 None).
+    """
+
+    async def publish(self, jti: str, expires_at: float) -> None:
+        """폐기 항목을 저장소에 기록합니다."""
+        ...
+
+    async def fetch_since(
+        self, cursor: Optional[Any]
+    ) -> tuple[list[tuple[str, float]], Optional[Any]]:
+        """cursor 이후의 폐기 항목과 새 cursor를 반환합니다."""
+        ...
+
+
+class InMemoryRevocationSource:
+    """프로세스 내 RevocationSource 구현 (테스트, 단일 프로세스 개발용)."""
+
+    def __init__(self) -> None:
+        self._log: list[tuple[str, float]] = []
+
+    async def publish(self, jti: str, expires_at: float) -> None:
+        self._log.append((jti, expires_at))
+
+    async def fetch_since(self, cursor: Optional[int]) -> tuple[list[tuple[str, float]], int]:
+        start = cursor or 0
+        return self._log[start:], len(self._log)
+
+
+class RevocationList:
+    """Bloom 필터 + 정확한 집합 + 타이머 휠로 구성된 폐기 목록.
+
+    Args:
+        capacity: Bloom 필터 크기 기준 항목 수 (초과 시 두 배로 재구성)
+        error_rate: Bloom 필터 목표 오탐률
+        resolution: 타이머 휠 슬롯 간격 (초)
+        slots: 타이머 휠 슬롯 수 (``resolution * slots``가 토큰 수명 이상 권장)
+        max_ttl_seconds: 폐기 항목 최대 유지 시간 (exp가 더 멀어도 이 시간 후 제거,
+            Access Token 수명과 같게 설정)
+        source: 다른 워커와 폐기 목록을 공유할 저장소 (None이면 로컬 전용)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        *,
+        error_rate: float = 0.001,
+        resolution: float = 10.0,
+        slots: int = 256,
+        max_ttl_seconds: Optional[float] = None,
+        source: Optional[RevocationSource] = None,
+    ) -> None:
+        self.resolution = resolution
+        self.max_ttl_seconds = max_ttl_seconds
+        self.source = source
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked: dict[str, float] = {}
+        self._wheel: list[set[str]] = [set() for _ in range(slots)]
+        self._tick = self._tick_of(time.time())
+        self._next_tick_at = (self._tick + 1) * resolution
+        self._expired_since_rebuild = 0
+        self._cursor: Optional[Any] = None
+        self._listeners: list[Callable[[str], None]] = []
+
+    def _tick_of(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution)
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """jti가 추가될 때마다 호출할 함수를 등록합니다 (토큰 캐시 무효화 등).
+
+        로컬 ``revoke``와 저장소 ``sync``로 들어온 항목 모두에 호출됩니다.
+        """
+        self._listeners.append(listener)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """폐기 항목을 로컬에만 추가합니다 (저장소에는 기록하지 않음).
+
+        Args:
+            jti: 토큰 고유 ID
+            expires_at: 토큰 만료 시각 (UNIX timestamp)
+        """
+        now = time.time()
+        if self.max_ttl_seconds is not None:
+            expires_at = min(expires_at, now + self.max_ttl_seconds)
+        if expires_at <= now:
+            return
+        for listener in self._listeners:
+            listener(jti)
+        self._advance(now)
+        previous = self._revoked.get(jti)
+        if previous is not None:
+            if previous >= expires_at:
+                return
+            self._wheel[self._tick_of(previous) % len(self._wheel)].discard(jti)
+        self._revoked[jti] = expires_at
+        self._wheel[self._tick_of(expires_at) % len(self._wheel)].add(jti)
+        if len(self._revoked) > self._bloom.capacity:
+            self._rebuild(self._bloom.capacity * 2)
+        else:
+            self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        """토큰이 폐기되었는지 확인합니다 (요청 경로, O(1)).
+
+        Args:
+            jti: 토큰 고유 ID
+
+        Returns:
+            폐기 여부
+        """
+        if jti not in self._bloom:
+            return False
+        now = time.time()
+        if now >= self._next_tick_at:
+            self._advance(now)
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def _advance(self, now: float) -> None:
+        """현재 시각까지 지난 슬롯의 만료 항목을 제거합니다."""
+        target = self._tick_of(now)
+        if target <= self._tick:
+            return
+        wheel = self._wheel
+        # 휠 한 바퀴 이상 지났으면 모든 슬롯을 한 번씩만 확인
+        for tick in range(max(self._tick + 1, target - len(wheel) + 1), target + 1):
+            bucket = wheel[tick % len(wheel)]
+            expired = [jti for jti in bucket if self._revoked.get(jti, 0.0) <= now]
+            for jti in expired:
+                bucket.discard(jti)
+                self._revoked.pop(jti, None)
+            self._expired_since_rebuild += len(expired)
+        self._tick = target
+        self._next_tick_at = (target + 1) * self.resolution
+        # 만료된 항목이 많이 쌓이면 Bloom 필터를 다시 만들어 오탐률을 회복
+        if self._expired_since_rebuild > max(1024, len(self._revoked)):
+            self._rebuild(self._bloom.capacity)
+
+    def _rebuild(self, capacity: int) -> None:
+        bloom = BloomFilter(capacity, self._bloom.error_rate)
+        for jti in self._revoked:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._expired_since_rebuild = 0
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """토큰을 폐기합니다 (로컬 반영 후 저장소에 기록).
+
+        Args:
+            jti: 토큰 고유 ID
+            expires_at: 토큰 만료 시각 (UNIX timestamp)
+        """
+        self.add(jti, expires_at)
+        if self.source is not None:
+            await self.source.publish(jti, expires_at)
+
+    async def sync(self) -> int:
+        """저장소에서 새 폐기 항목을 가져와 반영합니다.
+
+        Returns:
+            반영한 항목 수
+        """
+        if self.source is None:
+            return 0
+        entries, self._cursor = await self.source.fetch_since(self._cursor)
+        for jti, expires_at in entries:
+            self.add(jti, expires_at)
+        return len(entries)
+
+    async def run_sync(self, interval: float = 1.0) -> None:
+        """저장소를 주기적으로 동기화합니다 (lifespan 백그라운드 태스크)."""
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Revocation sync failed")
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 상태를 딕셔너리로 반환합니다."""
+        return {
+            "revoked": len(self._revoked),
+            "bloom_capacity": self._bloom.capacity,
+            "bloom_bytes": self._bloom.nbytes,
+            "bloom_hashes": self._bloom.hash_count,
+        }
@@ -0,0 +1,138 @@
+"""프로세스 전역 AuthSettings 제공자.
+
+AuthSettings는 생성할 때마다 환경변수와 ``.env`` 파일을 다시 읽고 검증합니다.
+이 모듈은 앱 시작 시 한 번 로드한 설정을 프로세스 전체에서 공유하고,
+SIGHUP 또는 ``.env``/``JWT_KEYS_FILE`` 파일 변경 시 새 설정으로 원자적으로
+교체합니다 (시크릿/서명 키 교체 지원). 요청마다의 비용은 속성 조회 한 번입니다.
+
+``API_KEYS_FILE``은 설정이 아닌 ApiKeyStore가 소유하므로 이 모듈이 감시하지
+않습니다. API 키 파일 변경은 ``ApiKeyStore.watch()``로 반영하세요.
+
+사용 예시:
+    # main.py lifespan
+    auth_settings_provider.load()
+    auth_settings_provider.install_signal_handler()
+    watcher = asyncio.create_task(auth_settings_provider.watch())
+    yield
+    watcher.cancel()
+"""
+
+import asyncio
+import logging
+import signal
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from .jwt_handler import AuthSettings
+
+logger = logging.getLogger(__name__)
+
+
+class AuthSettingsProvider:
+    """AuthSettings를 한 번 로드하여 공유하고, 요청 시 원자적으로 재로드합니다.
+
+    Args:
+        env_file: 설정 파일 경로 (None이면 환경변수만 사용)
+    """
+
+    def __init__(self, env_file: Optional[Path] = Path(".env")) -> None:
+        self.env_file = env_file
+        # 요청 경로에서 읽는 현재 설정. 재로드 시 참조만 교체합니다.
+        self.current: Optional[AuthSettings] = None
+        # 마지막 로드 시점의 (.env, JWT_KEYS_FILE) 수정 시각
+        self._mtimes: tuple[Optional[float], Optional[float]] = (None, None)
+        self._listeners: list[Callable[[AuthSettings], None]] = []
+
+    @staticmethod
+    def _stat(path: Optional[str | Path]) -> Optional[float]:
+        if not path:
+            return None
+        try:
+            return Path(path).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _stat_watched(self) -> tuple[Optional[float], Optional[float]]:
+        keys_file = self.current.JWT_KEYS_FILE if self.current is not None else None
+        return self._stat(self.env_file), self._stat(keys_file)
+
+    def load(self) -> AuthSettings:
+        """설정을 로드하여 현재 설정으로 교체합니다.
+
+        Returns:
+            새로 로드된 AuthSettings
+
+        Raises:
+            ValidationError: 설정 값이 유효하지 않음
+            ValueError: 키 링을 파싱할 수 없음
+            OSError: 키 링 파일을 읽을 수 없음
+        """
+        env_mtime = self._stat(self.env_file)
+        settings = AuthSettings(_env_file=self.env_file)
+        keys_mtime = self._stat(settings.JWT_KEYS_FILE)
+        # 서명 키 파싱을 요청 경로가 아닌 로드 시점에 수행합니다.
+        _ = settings.key_ring
+        self.current = settings
+        self._mtimes = (env_mtime, keys_mtime)
+        for listener in self._listeners:
+            listener(settings)
+        return settings
+
+    def reload(self) -> bool:
+        """설정을 다시 로드합니다. 실패하면 기존 설정을 유지합니다.
+
+        Returns:
+            교체 성공 여부
+        """
+        try:
+            self.load()
+        except (ValidationError, ValueError, OSError):
+            logger.exception("AuthSettings reload failed; keeping previous settings")
+            return False
+        logger.info("AuthSettings reloaded")
+        return True
+
+    def add_listener(self, listener: Callable[[AuthSettings], None]) -> None:
+        """설정이 교체될 때 호출할 콜백을 등록합니다 (예: 토큰 캐시 비우기).
+
+        Args:
+            listener: 새 AuthSettings를 인자로 받는 콜백
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def install_signal_handler(self) -> bool:
+        """SIGHUP 수신 시 설정을 재로드하도록 이벤트 루프에 등록합니다.
+
+        Returns:
+            등록 여부 (Windows 등 SIGHUP 미지원 환경에서는 False)
+        """
+        if not hasattr(signal, "SIGHUP"):
+            return False
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload)
+        except (NotImplementedError, RuntimeError):
+            return False
+        return True
+
+    async def watch(self, interval: float = 2.0) -> None:
+        """``.env``와 ``JWT_KEYS_FILE``의 변경을 주기적으로 확인하여 재로드합니다.
+
+        lifespan에서 백그라운드 태스크로 실행하세요. 파일 확인은 이 태스크에서만
+        수행되며 요청 경로에서는 파일에 접근하지 않습니다.
+
+        Args:
+            interval: 확인 주기 (초)
+        """
+        while True:
+            await asyncio.sleep(interval)
+            mtimes = self._stat_watched()
+            if mtimes != self._mtimes:
+                self._mtimes = mtimes
+                self.reload()
+
+
+auth_settings_provider = AuthSettingsProvider()
@@ -0,0 +1,138 @@
+"""Tests for templates/backend/auth/api_keys.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_api_keys.py --import-mode=importlib
+"""
+
+import asyncio
+import json
+
+import pytest
+from backend.auth import dependencies
+from backend.auth.api_keys import ApiKeyIndex, digest_api_key, generate_api_key
+from backend.auth.dependencies import UserRole, get_api_key_payload, require_role
+from backend.error_templates import ErrorTemplateException
+
+
+def _write_keys(path, *entries) -> None:
+    path.write_text(json.dumps({"keys": list(entries)}))
+
+
+def _entry(api_key: str, key_id: str, role: str = "user", **extra) -> dict:
+    sha256 = digest_api_key(api_key).hex()
+    return {"id": key_id, "sha256": sha256, "role": role, **extra}
+
+
+@pytest.fixture
+def batch_key():
+    return generate_api_key("batch")
+
+
+@pytest.fixture
+def store(tmp_path, batch_key):
+    """batch 키 하나가 등록된 API 키 저장소를 활성화합니다."""
+    path = tmp_path / "api-keys.json"
+    _write_keys(path, _entry(batch_key, "batch"))
+    store = dependencies.enable_api_keys(str(path))
+    yield store
+    dependencies.disable_api_keys()
+
+
+def _authenticate(api_key):
+    try:
+        return asyncio.run(get_api_key_payload(api_key))
+    except ErrorTemplateException as e:
+        return e.template
+
+
+class TestApiKeyIndex:
+    """Test cases for ApiKeyIndex."""
+
+    def test_authenticate(self, batch_key):
+        """Test that only the exact key matches its entry."""
+        index = ApiKeyIndex.from_document({"keys": [_entry(batch_key, "batch")]})
+        assert index.authenticate(batch_key).key_id == "batch"
+        assert index.authenticate(batch_key + "x") is None
+        assert index.authenticate(generate_api_key("batch")) is None
+        assert index.authenticate("ak_batch") is None
+        assert index.authenticate("not-a-key") is None
+
+    def test_rejects_unknown_role_and_duplicates(self, batch_key):
+        """Test that invalid key files fail at load time."""
+        with pytest.raises(ValueError, match="Unknown role"):
+            ApiKeyIndex.from_document(
+                {"keys": [_entry(batch_key, "batch", role="root")]}, roles={"user"}
+            )
+        with pytest.raises(ValueError, match="Duplicate"):
+            ApiKeyIndex.from_document(
+                {"keys": [_entry(batch_key, "batch"), _entry(batch_key, "batch")]}
+            )
+
+    def test_disabled_entries_skipped(self, batch_key):
+        """Test that disabled keys are not loaded."""
+        document = {"keys": [_entry(batch_key, "batch", disabled=True)]}
+        assert len(ApiKeyIndex.from_document(document)) == 0
+
+
+class TestApiKeyStore:
+    """Test cases for ApiKeyStore reload and revocation."""
+
+    def test_hot_reload(self, store, batch_key):
+        """Test that a rewritten key file replaces the index on reload."""
+        other_key = generate_api_key("reports")
+        _write_keys(store.path, _entry(other_key, "reports", role="admin"))
+        assert store.reload()
+
+        assert _authenticate(batch_key) is dependencies.API_KEY_INVALID_ERROR
+        assert _authenticate(other_key).role == "admin"
+
+    def test_failed_reload_keeps_keys(self, store, batch_key):
+        """Test that a broken key file leaves the current keys in place."""
+        store.path.write_text("{not json")
+        assert not store.reload()
+        assert _authenticate(batch_key).sub == "api_key:batch"
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            [],
+            {"keys": {"id": "batch"}},
+            {"keys": ["batch"]},
+            {"keys": [{"id": 5, "role": "user", "sha256": "00" * 32}]},
+            {"keys": [{"id": "batch", "role": "user", "sha256": 5}]},
+            {"keys": [{"id": "batch", "role": "user"}]},
+        ],
+    )
+    def test_malformed_file_keeps_keys(self, store, batch_key, document):
+        """Test that a wrongly shaped key file fails reload without raising."""
+        store.path.write_text(json.dumps(document))
+        assert not store.reload()
+        assert store.current.authenticate(batch_key).key_id == "batch"
+
+    def test_revoke_survives_reload(self, store, batch_key):
+        """Test that a revoked key stays revoked after the file is reloaded."""
+        store.revoke("batch")
+        assert _authenticate(batch_key) is dependencies.API_KEY_INVALID_ERROR
+        assert store.reload()
+        assert _authenticate(batch_key) is dependencies.API_KEY_INVALID_ERROR
+
+
+@pytest.mark.usefixtures("store")
+class TestApiKeyDependency:
+    """Test cases for get_api_key_payload."""
+
+    def test_payload_reused(self, batch_key):
+        """Test that every request gets the payload built at load time."""
+        assert _authenticate(batch_key) is _authenticate(batch_key)
+
+    def test_missing_key(self):
+        """Test that a request without X-API-Key is rejected."""
+        assert _authenticate(None) is dependencies.API_KEY_REQUIRED_ERROR
+
+    def test_role_check(self, batch_key):
+        """Test that require_role works with the API key source."""
+        payload = _authenticate(batch_key)
+        asyncio.run(require_role(UserRole.USER, source=get_api_key_payload)(payload))
+        with pytest.raises(ErrorTemplateException):
+            asyncio.run(require_role(UserRole.ADMIN)(payload))
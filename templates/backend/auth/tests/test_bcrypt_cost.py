@@ -0,0 +1,143 @@
+"""Tests for templates/backend/auth/bcrypt_cost.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_bcrypt_cost.py --import-mode=importlib
+"""
+
+import pytest
+from backend.auth import bcrypt_cost, jwt_handler
+from backend.auth.bcrypt_cost import calibrate_bcrypt_rounds, configure_bcrypt_cost
+from backend.auth.jwt_handler import (
+    DEFAULT_BCRYPT_ROUNDS,
+    AuthSettings,
+    configure_password_hashing,
+    get_bcrypt_rounds,
+    hash_password,
+    verify_password,
+)
+
+SETTINGS = AuthSettings(
+    SECRET_KEY="test-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="test-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_rounds():
+    yield
+    configure_password_hashing(DEFAULT_BCRYPT_ROUNDS)
+
+
+@pytest.fixture
+def fake_timing(monkeypatch):
+    """cost 10에서 40ms, cost가 1 오를 때마다 두 배인 장비를 흉내 냅니다."""
+    measured = []
+
+    def measure(rounds: int, _samples: int = 3) -> float:
+        measured.append(rounds)
+        return 40.0 * 2 ** (rounds - 10)
+
+    monkeypatch.setattr(bcrypt_cost, "measure_bcrypt_ms", measure)
+    return measured
+
+
+class TestCalibrateBcryptRounds:
+    """Test cases for calibrate_bcrypt_rounds."""
+
+    def test_highest_cost_within_target(self, fake_timing):
+        """Test that the chosen cost is the highest one under the target."""
+        calibration = calibrate_bcrypt_rounds(target_ms=250)
+        assert calibration.rounds == 12
+        assert calibration.measured_ms == 160.0
+        assert fake_timing == [10, 12]
+
+    @pytest.mark.usefixtures("fake_timing")
+    def test_min_rounds_floor(self):
+        """Test that a slow host never goes below min_rounds."""
+        assert calibrate_bcrypt_rounds(target_ms=5, min_rounds=10).rounds == 10
+
+    @pytest.mark.usefixtures("fake_timing")
+    def test_max_rounds_ceiling(self):
+        """Test that a fast host stops at max_rounds."""
+        assert calibrate_bcrypt_rounds(target_ms=100_000, max_rounds=14).rounds == 14
+
+    def test_steps_down_when_extrapolation_misses(self, monkeypatch):
+        """Test that a measured cost above target falls back one step."""
+        timings = {10: 40.0, 12: 300.0, 11: 120.0}
+        monkeypatch.setattr(
+            bcrypt_cost, "measure_bcrypt_ms", lambda rounds, _samples=3: timings[rounds]
+        )
+        calibration = calibrate_bcrypt_rounds(target_ms=250)
+        assert calibration.rounds == 11
+        assert calibration.samples_ms == timings
+
+    def test_configure_from_settings(self, fake_timing):
+        """Test that BCRYPT_ROUNDS wins over BCRYPT_TARGET_MS."""
+        fixed = SETTINGS.model_copy(update={"BCRYPT_ROUNDS": 9, "BCRYPT_TARGET_MS": 1})
+        assert configure_bcrypt_cost(fixed) == 9
+        assert fake_timing == []
+
+        target = SETTINGS.model_copy(update={"BCRYPT_TARGET_MS": 250})
+        assert configure_bcrypt_cost(target) == 12
+        assert bcrypt_cost.bcrypt_metrics.snapshot()["target_ms"] == 250
+
+
+class TestRehash:
+    """Test cases for rehashing on successful verification."""
+
+    def test_stale_hash_rehashed(self):
+        """Test that a hash below the configured cost is replaced on login."""
+        configure_password_hashing(4)
+        stale = hash_password("secret")
+        configure_password_hashing(5)
+
+        before = bcrypt_cost.bcrypt_metrics.rehashed
+        rehashed = []
+        assert verify_password("secret", stale, on_rehash=rehashed.append)
+        assert rehashed[0].startswith("$2b$05$")
+        assert bcrypt_cost.bcrypt_metrics.rehashed == before + 1
+        assert verify_password("secret", rehashed[0])
+
+    def test_wrong_password_not_rehashed(self):
+        """Test that a failed verification never produces a new hash."""
+        configure_password_hashing(4)
+        stale = hash_password("secret")
+        configure_password_hashing(5)
+
+        before = bcrypt_cost.bcrypt_metrics.rehashed
+        rehashed = []
+        assert not verify_password("wrong", stale, on_rehash=rehashed.append)
+        assert rehashed == []
+        assert bcrypt_cost.bcrypt_metrics.rehashed == before
+
+    def test_lower_cost_keeps_stronger_hash(self):
+        """Test that lowering the cost does not downgrade existing hashes."""
+        configure_password_hashing(5)
+        strong = hash_password("secret")
+        configure_password_hashing(4)
+
+        rehashed = []
+        assert verify_password("secret", strong, on_rehash=rehashed.append)
+        assert rehashed == []
+        assert get_bcrypt_rounds() == 4
+        assert jwt_handler.pwd_context.needs_update(strong) is False
+
+
+class TestVerifyMetrics:
+    """Test cases for verify latency recorded from the sync path."""
+
+    @pytest.mark.parametrize("with_rehash", [False, True])
+    def test_sync_verify_recorded(self, with_rehash):
+        """Test that sync verify_password feeds bcrypt_metrics like the pool does."""
+        configure_password_hashing(4)
+        hashed = hash_password("secret")
+        metrics = bcrypt_cost.bcrypt_metrics
+        count, total = metrics.verify_count, metrics.verify_seconds_total
+
+        on_rehash = [].append if with_rehash else None
+        assert verify_password("secret", hashed, on_rehash=on_rehash)
+        assert not verify_password("wrong", hashed, on_rehash=on_rehash)
+
+        assert metrics.verify_count == count + 2
+        assert metrics.verify_seconds_total > total
@@ -0,0 +1,82 @@
+"""Tests for templates/backend/auth/jwt_handler.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_jwt_handler.py --import-mode=importlib
+"""
+
+import asyncio
+
+import jwt
+import pytest
+from backend.auth import dependencies
+from backend.auth.jwt_handler import (
+    AuthSettings,
+    LightTokenPayload,
+    TokenPayload,
+    create_access_token,
+    decode_access_token,
+)
+from backend.auth.token_cache import TokenCache, decode_access_token_cached
+from fastapi.encoders import jsonable_encoder
+from fastapi.security import HTTPAuthorizationCredentials
+
+SETTINGS = AuthSettings(
+    SECRET_KEY="test-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="test-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+LIGHT_SETTINGS = SETTINGS.model_copy(update={"TOKEN_PAYLOAD_LIGHTWEIGHT": True})
+
+
+class TestLightTokenPayload:
+    """Test cases for LightTokenPayload."""
+
+    def test_same_attributes_as_pydantic(self):
+        """Test that both payloads expose identical values."""
+        claims = dependencies.rbac_policy.claims_for("admin")
+        token = create_access_token(
+            SETTINGS, "user_1", role="admin", policy=dependencies.rbac_policy
+        )
+        light = decode_access_token(LIGHT_SETTINGS, token)
+        model = decode_access_token(SETTINGS, token)
+
+        assert isinstance(light, LightTokenPayload)
+        assert isinstance(model, TokenPayload)
+        assert light.model_dump() == model.model_dump()
+        assert light.exp_timestamp == model.exp_timestamp
+        assert light.perm == claims["perm"]
+        assert light.to_model() == model
+
+    def test_to_model_serializes_either_payload(self):
+        """Test that to_model() makes both payload types JSON-serializable."""
+        token = create_access_token(SETTINGS, "user_1", role="admin")
+        model = decode_access_token(SETTINGS, token)
+        light = decode_access_token(LIGHT_SETTINGS, token)
+
+        assert model.to_model() is model
+        assert jsonable_encoder(light.to_model()) == jsonable_encoder(model)
+
+    def test_datetimes_are_lazy(self):
+        """Test that exp/iat are converted only when first read."""
+        token = create_access_token(SETTINGS, "user_1")
+        payload = decode_access_token(LIGHT_SETTINGS, token)
+        assert payload._exp is None and payload._iat is None
+        assert payload.exp is payload.exp
+        assert payload._iat is None
+
+    def test_missing_claim_rejected(self):
+        """Test that a verified token without a required claim is invalid."""
+        with pytest.raises(jwt.InvalidTokenError):
+            LightTokenPayload({"sub": "user_1", "exp": 0, "iat": 0})
+
+    def test_dependencies_accept_light_payload(self):
+        """Test the cache and RBAC checks with the lightweight payload."""
+        token = create_access_token(SETTINGS, "user_1", role="manager")
+        cache = TokenCache()
+        payload = decode_access_token_cached(LIGHT_SETTINGS, token, cache)
+        assert cache.get(token) is payload
+
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        payload = asyncio.run(dependencies.get_token_payload(credentials, LIGHT_SETTINGS))
+        asyncio.run(dependencies.require_permission("delete")(payload))
+        asyncio.run(dependencies.require_role(dependencies.UserRole.MANAGER)(payload))
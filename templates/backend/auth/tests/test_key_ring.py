@@ -0,0 +1,199 @@
+"""Tests for templates/backend/auth/key_ring.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_key_ring.py --import-mode=importlib
+"""
+
+import asyncio
+import base64
+import json
+
+import jwt
+import pytest
+from backend.auth.key_ring import JWKSCache, KeyRing, SigningKey
+
+CLAIMS = {"sub": "user_1"}
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def _forge(header: dict, claims: dict = CLAIMS, signature: str = "") -> str:
+    return f"{_b64(header)}.{_b64(claims)}.{signature}"
+
+
+@pytest.fixture
+def ring():
+    """EdDSA(활성), ES256, HS256 키를 가진 키 링."""
+    keys = [
+        SigningKey.generate("ed", "EdDSA"),
+        SigningKey.generate("es", "ES256"),
+        SigningKey.from_secret("hs", "hs-secret-" + "x" * 32),
+    ]
+    return KeyRing(keys, active_kid="ed")
+
+
+def _sign_with(ring: KeyRing, kid: str) -> str:
+    key = ring.get(kid)
+    return jwt.encode(CLAIMS, key.sign_key, algorithm=key.algorithm, headers={"kid": kid})
+
+
+class TestKidRouting:
+    """Test cases for kid-based key selection."""
+
+    @pytest.mark.parametrize("kid", ["ed", "es", "hs"])
+    def test_verifies_with_key_named_by_kid(self, ring, kid):
+        """Test that each token is verified with the key its kid names."""
+        assert ring.verify(_sign_with(ring, kid)) == CLAIMS
+
+    def test_sign_records_active_kid(self, ring):
+        """Test that sign() uses the active key and writes its kid."""
+        token = ring.sign(CLAIMS)
+        assert jwt.get_unverified_header(token) == {"alg": "EdDSA", "kid": "ed", "typ": "JWT"}
+
+    def test_token_without_kid_uses_active_key(self, ring):
+        """Test that legacy tokens without kid are verified with the active key."""
+        key = ring.active
+        token = jwt.encode(CLAIMS, key.sign_key, algorithm=key.algorithm)
+        assert ring.verify(token) == CLAIMS
+
+    def test_unknown_kid_rejected(self, ring):
+        """Test that a kid outside the ring is rejected."""
+        other = SigningKey.generate("other", "EdDSA")
+        token = jwt.encode(CLAIMS, other.sign_key, algorithm="EdDSA", headers={"kid": "other"})
+        with pytest.raises(jwt.InvalidTokenError, match="Unknown key id"):
+            ring.verify(token)
+
+    def test_mismatched_alg_rejected(self, ring):
+        """Test that the alg header cannot override the algorithm bound to the kid."""
+        token = jwt.encode(CLAIMS, "attacker-" + "x" * 32, algorithm="HS256", headers={"kid": "ed"})
+        with pytest.raises(jwt.InvalidTokenError):
+            ring.verify(token)
+
+
+class TestAlgNone:
+    """Test cases for the stripped "none" algorithm."""
+
+    def test_none_key_cannot_be_built(self):
+        """Test that "none" is not available for ring keys."""
+        with pytest.raises(ValueError, match="Unsupported JWT algorithm"):
+            SigningKey.from_secret("n", "", "none")
+
+    @pytest.mark.parametrize("kid", [None, "ed", "hs"])
+    def test_unsigned_token_rejected(self, ring, kid):
+        """Test that an alg=none token is rejected whatever kid it claims."""
+        header = {"alg": "none", "typ": "JWT"}
+        if kid is not None:
+            header["kid"] = kid
+        with pytest.raises(jwt.InvalidTokenError):
+            ring.verify(_forge(header))
+
+
+class TestRotation:
+    """Test cases for key rotation and retirement."""
+
+    def test_old_tokens_valid_until_key_removed(self, ring):
+        """Test that rotating keeps old tokens valid and removal retires them."""
+        old_token = ring.sign(CLAIMS)
+        ring.add(SigningKey.generate("ed-2", "EdDSA"))
+        ring.activate("ed-2")
+        new_token = ring.sign(CLAIMS)
+
+        assert jwt.get_unverified_header(new_token)["kid"] == "ed-2"
+        assert ring.verify(old_token) == CLAIMS
+        assert ring.verify(new_token) == CLAIMS
+
+        ring.remove("ed")
+        with pytest.raises(jwt.InvalidTokenError, match="Unknown key id"):
+            ring.verify(old_token)
+        assert ring.verify(new_token) == CLAIMS
+
+    def test_active_key_cannot_be_removed(self, ring):
+        """Test that the signing key must be rotated before it is retired."""
+        with pytest.raises(ValueError, match="active key"):
+            ring.remove("ed")
+
+    def test_verify_only_key_cannot_be_activated(self, ring):
+        """Test that a public-key-only entry cannot become the signing key."""
+        public = SigningKey.from_jwk(ring.get("es").to_jwk())
+        ring.add(SigningKey("es-public", public.algorithm, public.verify_key))
+        with pytest.raises(ValueError, match="not a signing key"):
+            ring.activate("es-public")
+
+    def test_replaced_key_invalidates_cached_header(self, ring):
+        """Test that replacing a kid drops cached header lookups for it."""
+        token = _sign_with(ring, "es")
+        ring.verify(token)
+        ring.add(SigningKey.generate("es", "ES256"))
+        with pytest.raises(jwt.InvalidSignatureError):
+            ring.verify(token)
+
+
+class TestJWKS:
+    """Test cases for the JWKS round trip."""
+
+    def test_round_trip_verifies_asymmetric_tokens(self, ring):
+        """Test that a ring rebuilt from JWKS verifies EdDSA/ES256 and omits HS keys."""
+        document = json.loads(ring.jwks_json())
+        assert sorted(jwk["kid"] for jwk in document["keys"]) == ["ed", "es"]
+        assert all("d" not in jwk for jwk in document["keys"])
+
+        public = KeyRing.from_jwks(document)
+        assert public.verify(_sign_with(ring, "ed")) == CLAIMS
+        assert public.verify(_sign_with(ring, "es")) == CLAIMS
+        with pytest.raises(jwt.InvalidTokenError, match="Unknown key id"):
+            public.verify(_sign_with(ring, "hs"))
+
+    def test_jwks_json_refreshed_after_change(self, ring):
+        """Test that the serialized JWKS is rebuilt when keys change."""
+        before = ring.jwks_json()
+        ring.add(SigningKey.generate("ed-2", "EdDSA"))
+        assert ring.jwks_json() != before
+
+    def test_cache_refetches_for_new_kid(self, ring):
+        """Test that JWKSCache refetches once for a kid it has not seen."""
+        fetched = []
+
+        async def fetch() -> dict:
+            fetched.append(True)
+            return ring.jwks()
+
+        cache = JWKSCache(fetch, min_refresh_interval=0)
+
+        async def scenario() -> None:
+            assert await cache.verify(_sign_with(ring, "ed")) == CLAIMS
+            assert await cache.verify(_sign_with(ring, "ed")) == CLAIMS
+            ring.add(SigningKey.generate("ed-2", "EdDSA"))
+            assert await cache.verify(_sign_with(ring, "ed-2")) == CLAIMS
+
+        asyncio.run(scenario())
+        assert len(fetched) == 2
+
+
+class TestHeaderCache:
+    """Test cases for the verified-header cache."""
+
+    def test_forged_header_is_not_cached(self, ring):
+        """Test that a header whose signature fails never enters the cache."""
+        token = _sign_with(ring, "hs")
+        header, payload, _ = token.split(".")
+        forged = f"{header}.{payload}.{_b64({'bad': 'sig'})}"
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            ring.verify(forged)
+        assert header not in ring._by_header
+
+        assert ring.verify(token) == CLAIMS
+        assert header in ring._by_header
+
+    def test_cached_header_still_checks_signature(self, ring):
+        """Test that a cached header does not skip signature verification."""
+        token = _sign_with(ring, "hs")
+        ring.verify(token)
+        header, _, signature = token.split(".")
+        tampered = f"{header}.{_b64({'sub': 'admin'})}.{signature}"
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            ring.verify(tampered)
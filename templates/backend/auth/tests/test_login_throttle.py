@@ -0,0 +1,152 @@
+"""Tests for templates/backend/auth/login_throttle.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_login_throttle.py --import-mode=importlib
+"""
+
+import asyncio
+
+import pytest
+from backend.auth.login_throttle import (
+    LocalThrottleBackend,
+    LoginThrottle,
+    LoginThrottledError,
+    ShardedBuckets,
+)
+
+
+class FakeClock:
+    """수동으로 진행하는 시계."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def throttle(clock):
+    return LoginThrottle(
+        backend=LocalThrottleBackend(shards=4, idle_seconds=300, clock=clock),
+        account_capacity=3,
+        account_refill_per_minute=6,
+        ip_capacity=5,
+        ip_refill_per_minute=60,
+    )
+
+
+def _attempt(throttle: LoginThrottle, account: str, ip: str = "10.0.0.1") -> bool:
+    try:
+        asyncio.run(throttle.check(account, ip))
+    except LoginThrottledError:
+        return False
+    return True
+
+
+class TestLoginThrottle:
+    """Test cases for LoginThrottle."""
+
+    def test_account_limit(self, throttle):
+        """Test that an account is rejected after its burst capacity."""
+        assert [_attempt(throttle, "a@example.com") for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert throttle.stats.rejected_account == 1
+
+    def test_account_key_ignores_case(self, throttle):
+        """Test that the same account with different casing shares a bucket."""
+        for email in ("a@example.com", "A@Example.com", " a@example.com"):
+            assert _attempt(throttle, email)
+        assert not _attempt(throttle, "A@EXAMPLE.COM")
+
+    def test_ip_limit_across_accounts(self, throttle):
+        """Test that one IP spraying many accounts hits the IP bucket."""
+        results = [_attempt(throttle, f"user{i}@example.com") for i in range(6)]
+        assert results == [True] * 5 + [False]
+        assert throttle.stats.rejected_ip == 1
+
+    def test_refill_and_retry_after(self, throttle, clock):
+        """Test that tokens refill over time and Retry-After reflects the wait."""
+        for _ in range(3):
+            _attempt(throttle, "a@example.com")
+        with pytest.raises(LoginThrottledError) as exc_info:
+            asyncio.run(throttle.check("a@example.com", None))
+        assert exc_info.value.headers["Retry-After"] == "10"
+        assert exc_info.value.status_code == 429
+
+        clock.now += 10
+        assert _attempt(throttle, "a@example.com", ip="10.0.0.2")
+
+    def test_reset_account(self, throttle):
+        """Test that a successful login clears the account bucket."""
+        for _ in range(3):
+            _attempt(throttle, "a@example.com")
+        asyncio.run(throttle.reset_account("a@example.com"))
+        assert _attempt(throttle, "a@example.com", ip="10.0.0.2")
+
+
+class TestShardedBuckets:
+    """Test cases for ShardedBuckets eviction."""
+
+    def test_idle_buckets_evicted(self):
+        """Test that every shard is swept once idle_seconds have passed."""
+        buckets = ShardedBuckets(shards=4, idle_seconds=60, sweep_interval=1)
+        for i in range(100):
+            buckets.consume(f"key{i}", 5, 1, now=0.0)
+        assert len(buckets) == 100
+
+        for step in range(4):
+            buckets.consume("active", 5, 1, now=61.0 + step)
+        assert len(buckets) == 1
+
+    def test_entries_capped_by_least_recent_use(self):
+        """Test that new keys beyond max_entries evict the least recently used bucket."""
+        buckets = ShardedBuckets(shards=1, idle_seconds=60, max_entries=3)
+        for key in ("a", "b", "c"):
+            buckets.consume(key, 5, 1, now=0.0)
+        buckets.consume("a", 5, 1, now=0.0)
+        buckets.consume("d", 5, 1, now=0.0)
+
+        assert len(buckets) == 3
+        assert buckets.evictions == 1
+        # "b"가 제거되었으므로 다시 가득 찬 버킷으로 시작합니다.
+        for _ in range(5):
+            assert buckets.consume("b", 5, 1, now=0.0) == 0.0
+
+    @pytest.mark.parametrize("shards", [0, 4])
+    def test_shards_bounded_by_max_entries(self, shards):
+        """Test that the shard count must fit within max_entries."""
+        with pytest.raises(ValueError, match="shards"):
+            ShardedBuckets(shards=shards, max_entries=3)
+
+
+class TestThrottleValidation:
+    """Test cases for LoginThrottle configuration checks."""
+
+    @pytest.mark.parametrize(
+        ("options", "message"),
+        [
+            ({"account_capacity": 20, "account_refill_per_minute": 1}, "idle_seconds"),
+            ({"ip_capacity": 100, "ip_refill_per_minute": 10}, "idle_seconds"),
+            ({"account_refill_per_minute": 0}, "refill rate"),
+        ],
+    )
+    def test_idle_shorter_than_refill_rejected(self, options, message):
+        """Test that idle eviction cannot refill buckets faster than the refill rate."""
+        backend = LocalThrottleBackend(idle_seconds=300)
+        with pytest.raises(ValueError, match=message):
+            LoginThrottle(backend=backend, **options)
+
+    def test_defaults_are_consistent(self):
+        """Test that the default limits fit the default idle time."""
+        LoginThrottle()
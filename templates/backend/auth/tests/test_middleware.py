@@ -0,0 +1,201 @@
+"""Tests for templates/backend/auth/middleware.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_middleware.py --import-mode=importlib
+"""
+
+import asyncio
+from typing import Annotated, Any, Optional
+
+import httpx
+import pytest
+from backend.auth import dependencies
+from backend.auth.jwt_handler import AuthSettings, TokenPayload, create_access_token
+from backend.auth.middleware import AuthenticationMiddleware, RouteTable
+from backend.error_templates import ErrorTemplateException, error_template_handler
+from fastapi import Depends, FastAPI, Request
+
+SETTINGS = AuthSettings(
+    SECRET_KEY="test-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="test-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+# 헤더를 직접 검증하는 의존성과 미들웨어 결과만 읽는 경량 의존성
+HEADER_DEPENDENCIES = (dependencies.get_token_payload, dependencies.get_current_user)
+LIGHTWEIGHT_DEPENDENCIES = (
+    dependencies.get_authenticated_payload,
+    dependencies.get_authenticated_user,
+)
+
+
+def _build_app(with_middleware: bool = True, lightweight: Optional[bool] = None) -> FastAPI:
+    """보호된 라우트를 가진 앱 (경량 의존성은 기본적으로 미들웨어와 함께 사용)."""
+    app = FastAPI()
+    app.add_exception_handler(ErrorTemplateException, error_template_handler)
+    app.dependency_overrides[dependencies.get_auth_settings] = lambda: SETTINGS
+    if with_middleware:
+        app.add_middleware(AuthenticationMiddleware)
+    if lightweight is None:
+        lightweight = with_middleware
+    source, current_user = LIGHTWEIGHT_DEPENDENCIES if lightweight else HEADER_DEPENDENCIES
+    CurrentUser = Annotated[TokenPayload, Depends(current_user)]
+
+    @app.get("/public")
+    async def public() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: str, user: CurrentUser) -> dict[str, str]:
+        return {"id": user_id, "sub": user.sub}
+
+    @app.get("/users/me")
+    async def shadowed() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get(
+        "/admin",
+        dependencies=[
+            Depends(dependencies.require_role(dependencies.UserRole.ADMIN, source=source))
+        ],
+    )
+    async def admin(user: CurrentUser) -> dict[str, str]:
+        return {"sub": user.sub}
+
+    return app
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """dependencies의 디코딩 호출 횟수를 셉니다."""
+    calls = []
+    decode = dependencies.decode_access_token
+
+    def counting_decode(settings, token):
+        calls.append(token)
+        return decode(settings, token)
+
+    monkeypatch.setattr(dependencies, "decode_access_token", counting_decode)
+    return calls
+
+
+def _count_bearer_calls(app: FastAPI) -> list[str]:
+    """FastAPI가 app에서 bearer_scheme 의존성을 해석한 경로를 기록합니다."""
+    calls = []
+
+    async def counting_scheme(request: Request) -> Any:
+        calls.append(request.url.path)
+        return await dependencies.bearer_scheme(request)
+
+    app.dependency_overrides[dependencies.bearer_scheme] = counting_scheme
+    return calls
+
+
+def _dependency_calls(app: FastAPI, path: str) -> set[Any]:
+    """라우트의 의존성 트리에서 FastAPI가 해석하는 callable 집합을 반환합니다."""
+    route = next(r for r in app.routes if getattr(r, "path", None) == path)
+    calls, pending = set(), list(route.dependant.dependencies)
+    while pending:
+        sub = pending.pop()
+        calls.add(sub.call)
+        pending.extend(sub.dependencies)
+    return calls
+
+
+def _get(app: FastAPI, path: str, token: Optional[str] = None) -> httpx.Response:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def call() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get(path, headers=headers)
+
+    return asyncio.run(call())
+
+
+class TestRouteTable:
+    """Test cases for RouteTable."""
+
+    def test_protected_routes(self):
+        """Test that routes are classified from their dependency trees."""
+        table = RouteTable(_build_app(with_middleware=False).routes)
+        assert not table.is_protected("GET", "/public")
+        assert table.is_protected("GET", "/users/42")
+        assert table.is_protected("GET", "/admin")
+        assert not table.is_protected("POST", "/admin")
+        assert not table.is_protected("GET", "/unknown")
+
+    def test_lightweight_routes_protected(self):
+        """Test that routes using the middleware payload are classified as protected."""
+        table = RouteTable(_build_app(lightweight=True).routes)
+        assert not table.is_protected("GET", "/public")
+        assert table.is_protected("GET", "/users/42")
+        assert table.is_protected("GET", "/admin")
+
+    def test_static_route_shadowed_by_earlier_dynamic_route(self):
+        """Test that a static path follows the earlier route Starlette matches."""
+        table = RouteTable(_build_app(with_middleware=False).routes)
+        assert table.is_protected("GET", "/users/me")
+
+
+class TestAuthenticationMiddleware:
+    """Test cases for AuthenticationMiddleware."""
+
+    def test_lightweight_dependencies_skip_header_resolution(self):
+        """Test that lightweight routes resolve no header or settings dependency."""
+        header_app = _build_app(with_middleware=False)
+        lightweight_app = _build_app()
+        header_work = {dependencies.bearer_scheme, dependencies.get_auth_settings}
+
+        for path in ("/users/{user_id}", "/admin"):
+            assert header_work <= _dependency_calls(header_app, path)
+            assert not header_work & _dependency_calls(lightweight_app, path)
+
+    def test_no_header_dependency_work_per_request(self, decode_calls):
+        """Test that FastAPI never resolves bearer_scheme behind the middleware."""
+        token = create_access_token(SETTINGS, "user_1", role="admin")
+        lightweight_app = _build_app()
+        header_app = _build_app(with_middleware=False)
+        lightweight_calls = _count_bearer_calls(lightweight_app)
+        header_calls = _count_bearer_calls(header_app)
+
+        response = _get(lightweight_app, "/admin", token)
+        assert response.status_code == 200
+        assert response.json() == {"sub": "user_1"}
+        assert lightweight_calls == []
+        assert len(decode_calls) == 1
+
+        assert _get(header_app, "/admin", token).status_code == 200
+        assert header_calls == ["/admin"]
+
+    def test_lightweight_dependency_requires_middleware(self):
+        """Test that lightweight routes fail closed without the middleware."""
+        app = _build_app(with_middleware=False, lightweight=True)
+        token = create_access_token(SETTINGS, "user_1", role="admin")
+        response = _get(app, "/users/42", token)
+        assert response.status_code == 401
+        assert response.json()["error"]["message"] == dependencies.TOKEN_REQUIRED_ERROR.message
+
+    def test_public_route_bypassed(self, decode_calls):
+        """Test that unprotected routes skip header parsing and decoding."""
+        response = _get(_build_app(), "/public", "not-a-jwt")
+        assert response.status_code == 200
+        assert decode_calls == []
+
+    def test_rejects_before_routing(self):
+        """Test that a missing or invalid token gets the prerendered 401."""
+        app = _build_app()
+        missing = _get(app, "/users/42")
+        invalid = _get(app, "/users/42", "not-a-jwt")
+
+        assert missing.status_code == invalid.status_code == 401
+        assert missing.headers["WWW-Authenticate"] == "Bearer"
+        assert missing.json()["error"]["message"] == dependencies.TOKEN_REQUIRED_ERROR.message
+        assert invalid.json()["error"]["message"] == dependencies.TOKEN_INVALID_ERROR.message
+
+    def test_same_result_without_middleware(self):
+        """Test that both dependency sets answer protected routes the same way."""
+        token = create_access_token(SETTINGS, "user_1", role="user")
+        for app in (_build_app(), _build_app(with_middleware=False)):
+            assert _get(app, "/users/42", token).json() == {"id": "42", "sub": "user_1"}
+            assert _get(app, "/admin", token).status_code == 403
+            assert _get(app, "/users/42").status_code == 401
@@ -0,0 +1,101 @@
+"""Tests for templates/backend/auth/password_pool.py
+
+워커는 spawn으로 생성되므로 max_workers=1 풀 하나로 충분합니다.
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_password_pool.py --import-mode=importlib
+"""
+
+import asyncio
+import time
+
+import pytest
+from backend.auth.jwt_handler import (
+    DEFAULT_BCRYPT_ROUNDS,
+    configure_password_hashing,
+    hash_password,
+    verify_password,
+)
+from backend.auth.password_pool import PasswordHasherPool, PasswordPoolBusyError
+
+
+@pytest.fixture(autouse=True)
+def restore_rounds():
+    yield
+    configure_password_hashing(DEFAULT_BCRYPT_ROUNDS)
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHasherPool(max_workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestPasswordHasherPool:
+    """Test cases for PasswordHasherPool."""
+
+    def test_rejects_when_pending_is_full(self, pool):
+        """Test that a full queue rejects immediately with a 503 template."""
+
+        async def scenario() -> PasswordPoolBusyError:
+            await pool.start()
+            busy = asyncio.create_task(pool.run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+            try:
+                with pytest.raises(PasswordPoolBusyError) as excinfo:
+                    await pool.run(time.sleep, 0)
+            finally:
+                await busy
+            return excinfo.value
+
+        error = asyncio.run(scenario())
+        response = error.template.render(request_id="req_1")
+        assert error.status_code == 503
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert (pool.metrics.rejected, pool.metrics.submitted) == (1, 1)
+        assert pool.metrics.pending == 0
+
+    def test_executor_swapped_when_rounds_change(self, pool):
+        """Test that new work runs on workers started with the new bcrypt cost."""
+
+        async def scenario() -> tuple[str, str, bool]:
+            configure_password_hashing(4)
+            first = await pool.run(hash_password, "pw")
+            executor = pool._executor
+
+            configure_password_hashing(5)
+            second = await pool.run(hash_password, "pw")
+            return first, second, pool._executor is not executor
+
+        first, second, swapped = asyncio.run(scenario())
+        assert first.startswith("$2b$04$")
+        assert second.startswith("$2b$05$")
+        assert swapped
+        assert verify_password("pw", second)
+
+    def test_shutdown_cancels_queued_and_restarts_lazily(self):
+        """Test that shutdown cancels queued work and a later call starts a new pool."""
+        pool = PasswordHasherPool(max_workers=1, max_pending=8)
+
+        async def scenario() -> list[object]:
+            configure_password_hashing(4)
+            await pool.start()
+            tasks = [asyncio.create_task(pool.run(time.sleep, 0.2)) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            pool.shutdown()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            assert pool._executor is None
+            results.append(await pool.run(verify_password, "pw", hash_password("pw")))
+            return results
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            pool.shutdown()
+
+        assert any(isinstance(r, asyncio.CancelledError) for r in results[:-1])
+        assert results[-1] is True
+        assert pool.metrics.pending == 0
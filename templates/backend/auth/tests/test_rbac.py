@@ -0,0 +1,111 @@
+"""Tests for templates/backend/auth/rbac.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_rbac.py --import-mode=importlib
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from backend.auth import dependencies
+from backend.auth.dependencies import UserRole, require_permission, require_role
+from backend.auth.jwt_handler import TokenPayload
+from backend.auth.rbac import RBACPolicy
+from backend.error_templates import ErrorTemplateException
+
+HIERARCHY = RBACPolicy(
+    {"admin": {"manage_users"}, "manager": {"delete"}, "user": {"read", "write"}},
+    inherits={"admin": ["manager"], "manager": ["user"]},
+)
+
+
+def _token(**claims) -> TokenPayload:
+    now = datetime.now(UTC)
+    return TokenPayload(sub="user_1", exp=now, iat=now, jti="jti_1", **claims)
+
+
+def _check(dependency, token: TokenPayload) -> str:
+    """의존성을 실행하여 "ok" 또는 에러 메시지를 반환합니다."""
+    try:
+        asyncio.run(dependency(token))
+    except ErrorTemplateException as e:
+        return e.template.message
+    return "ok"
+
+
+class TestRBACPolicy:
+    """Test cases for RBACPolicy compilation."""
+
+    def test_inherited_permissions(self):
+        """Test that a role's mask includes permissions of inherited roles."""
+        assert HIERARCHY.permissions_of(HIERARCHY.role_masks["admin"]) == {
+            "manage_users",
+            "delete",
+            "read",
+            "write",
+        }
+        assert HIERARCHY.permissions_of(HIERARCHY.role_masks["user"]) == {
+            "read",
+            "write",
+        }
+
+    def test_inheritance_cycle_rejected(self):
+        """Test that cyclic inheritance fails at compile time."""
+        with pytest.raises(ValueError, match="cycle"):
+            RBACPolicy({"a": set(), "b": set()}, inherits={"a": ["b"], "b": ["a"]})
+
+    def test_unknown_permission_rejected(self):
+        """Test that an undefined permission fails when the route is declared."""
+        with pytest.raises(ValueError, match="Unknown permission"):
+            require_permission("nope")
+
+    def test_stale_permission_claim_ignored(self):
+        """Test that a perm claim from another policy version falls back to role."""
+        token = _token(role="user", perm=HIERARCHY.role_masks["admin"], pmv="old")
+        assert HIERARCHY.effective_mask(token) == HIERARCHY.role_masks["user"]
+
+
+class TestRequirePermission:
+    """Test cases for require_permission."""
+
+    def test_role_permissions(self):
+        """Test that checks follow ROLE_PERMISSIONS."""
+        assert _check(require_permission("delete"), _token(role="manager")) == "ok"
+        assert _check(require_permission("delete"), _token(role="user")) != "ok"
+
+    def test_all_permissions_required(self):
+        """Test that every listed permission must be present."""
+        check = require_permission("read", "manage_users")
+        assert _check(check, _token(role="admin")) == "ok"
+        assert _check(check, _token(role="manager")) != "ok"
+
+    def test_permission_claim_used(self):
+        """Test that a current perm claim is honoured without a known role."""
+        policy = dependencies.rbac_policy
+        token = _token(**policy.claims_for("admin"))
+        assert _check(require_permission("manage_users"), token) == "ok"
+
+    def test_missing_and_unknown_role(self):
+        """Test the error raised for tokens without a usable role."""
+        check = require_permission("read")
+        assert _check(check, _token()) == dependencies.ROLE_MISSING_ERROR.message
+        assert _check(check, _token(role="ghost")) == dependencies.ROLE_UNKNOWN_ERROR.message
+
+
+class TestRequireRole:
+    """Test cases for require_role."""
+
+    def test_exact_roles(self):
+        """Test that only listed roles pass when no inheritance is configured."""
+        check = require_role(UserRole.ADMIN, UserRole.MANAGER)
+        assert _check(check, _token(role="manager")) == "ok"
+        assert _check(check, _token(role="user")) != "ok"
+        assert _check(check, _token()) != "ok"
+
+    def test_inherited_role_passes(self, monkeypatch):
+        """Test that a role inheriting the required role is allowed."""
+        monkeypatch.setattr(dependencies, "rbac_policy", HIERARCHY)
+        assert _check(require_role(UserRole.MANAGER), _token(role="admin")) == "ok"
+        assert _check(require_role(UserRole.MANAGER), _token(role="user")) != "ok"
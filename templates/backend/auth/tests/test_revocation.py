@@ -0,0 +1,160 @@
+"""Tests for templates/backend/auth/revocation.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_revocation.py --import-mode=importlib
+"""
+
+import asyncio
+import time
+
+import pytest
+from backend.auth import dependencies, revocation
+from backend.auth.jwt_handler import AuthSettings, create_access_token
+from backend.auth.revocation import (
+    BloomFilter,
+    InMemoryRevocationSource,
+    RevocationList,
+)
+from backend.error_templates import ErrorTemplateException
+from fastapi.security import HTTPAuthorizationCredentials
+
+SETTINGS = AuthSettings(
+    SECRET_KEY="test-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="test-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """revocation 모듈의 time.time을 조작 가능한 시계로 교체합니다."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(revocation.time, "time", lambda: now[0])
+    return now
+
+
+class TestBloomFilter:
+    """Test cases for BloomFilter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present."""
+        bloom = BloomFilter(capacity=1_000)
+        items = [f"jti-{i}" for i in range(1_000)]
+        for item in items:
+            bloom.add(item)
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_within_target(self):
+        """Test that the false positive rate stays near the configured target."""
+        bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+        for i in range(1_000):
+            bloom.add(f"jti-{i}")
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives / 10_000 < 0.03
+
+
+class TestRevocationList:
+    """Test cases for RevocationList."""
+
+    def test_revoked_until_expiry(self, clock):
+        """Test that a jti is revoked until exp and then forgotten."""
+        revocations = RevocationList(resolution=1.0, slots=8)
+        revocations.add("a", clock[0] + 30)
+
+        assert revocations.is_revoked("a")
+        assert not revocations.is_revoked("b")
+
+        clock[0] += 31
+        assert not revocations.is_revoked("a")
+        assert len(revocations) == 0
+
+    def test_expiry_beyond_wheel_horizon(self, clock):
+        """Test that entries further out than one wheel turn survive rotations."""
+        revocations = RevocationList(resolution=1.0, slots=4)
+        revocations.add("a", clock[0] + 10)
+
+        clock[0] += 6
+        assert revocations.is_revoked("a")
+        clock[0] += 5
+        assert not revocations.is_revoked("a")
+
+    def test_max_ttl_bounds_retention(self, clock):
+        """Test that max_ttl_seconds caps how long an entry is kept."""
+        revocations = RevocationList(resolution=1.0, max_ttl_seconds=60)
+        revocations.add("a", clock[0] + 86_400)
+
+        clock[0] += 61
+        assert not revocations.is_revoked("a")
+        assert len(revocations) == 0
+
+    def test_already_expired_is_ignored(self, clock):
+        """Test that revoking an expired token stores nothing."""
+        revocations = RevocationList()
+        revocations.add("a", clock[0] - 1)
+        assert len(revocations) == 0
+
+    def test_grows_past_capacity(self, clock):
+        """Test that exceeding capacity rebuilds the filter without losing entries."""
+        revocations = RevocationList(capacity=10)
+        for i in range(50):
+            revocations.add(f"jti-{i}", clock[0] + 60)
+        assert all(revocations.is_revoked(f"jti-{i}") for i in range(50))
+        assert revocations.snapshot()["bloom_capacity"] >= 50
+
+    def test_sync_between_workers(self, clock):
+        """Test that a revocation published by one list reaches another via sync."""
+        source = InMemoryRevocationSource()
+        worker_a = RevocationList(source=source)
+        worker_b = RevocationList(source=source)
+
+        asyncio.run(worker_a.revoke("a", clock[0] + 60))
+        assert not worker_b.is_revoked("a")
+        assert asyncio.run(worker_b.sync()) == 1
+        assert worker_b.is_revoked("a")
+        assert asyncio.run(worker_b.sync()) == 0
+
+
+class TestGetTokenPayloadRevocation:
+    """Test cases for the revocation check in get_token_payload."""
+
+    def test_revoked_token_rejected(self):
+        """Test that get_token_payload rejects a revoked jti with 401."""
+        token = create_access_token(SETTINGS, "user_1", role="user")
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        revocations = dependencies.enable_revocation(max_ttl_seconds=60)
+        try:
+            payload = asyncio.run(dependencies.get_token_payload(credentials, SETTINGS))
+            revocations.add(payload.jti, time.time() + 60)
+
+            with pytest.raises(ErrorTemplateException) as exc_info:
+                asyncio.run(dependencies.get_token_payload(credentials, SETTINGS))
+            assert exc_info.value.template is dependencies.TOKEN_REVOKED_ERROR
+        finally:
+            dependencies.disable_revocation()
+
+    def test_revoke_invalidates_token_cache(self, clock):
+        """Test that revoking a jti removes its verified token cache entry."""
+        cache = dependencies.enable_token_cache(max_size=10)
+        source = InMemoryRevocationSource()
+        revocations = dependencies.enable_revocation(source=source, max_ttl_seconds=60)
+        try:
+            local = create_access_token(SETTINGS, "user_1")
+            remote = create_access_token(SETTINGS, "user_2")
+            local_jti = dependencies.authenticate_token(SETTINGS, local).jti
+            remote_jti = dependencies.authenticate_token(SETTINGS, remote).jti
+            assert len(cache) == 2
+
+            asyncio.run(revocations.revoke(local_jti, clock[0] + 60))
+            assert not cache.invalidate_jti(local_jti)
+            assert len(cache) == 1
+
+            asyncio.run(source.publish(remote_jti, clock[0] + 60))
+            asyncio.run(revocations.sync())
+            assert len(cache) == 0
+
+            with pytest.raises(ErrorTemplateException):
+                dependencies.authenticate_token(SETTINGS, local)
+            assert len(cache) == 0
+        finally:
+            dependencies.disable_revocation()
+            dependencies.disable_token_cache()
@@ -0,0 +1,182 @@
+"""Tests for templates/backend/auth/settings_provider.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_settings_provider.py --import-mode=importlib
+"""
+
+import asyncio
+import builtins
+import contextlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Annotated
+
+import httpx
+import pytest
+from backend.auth import dependencies
+from backend.auth.jwt_handler import AuthSettings, create_access_token, decode_access_token
+from backend.auth.settings_provider import AuthSettingsProvider
+from fastapi import Depends, FastAPI
+
+FIRST_KEY = "first-secret"
+SECOND_KEY = "second-secret"
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """시크릿 키를 담은 .env 파일 (환경변수 값은 제거)."""
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    monkeypatch.delenv("REFRESH_SECRET_KEY", raising=False)
+    path = tmp_path / ".env"
+    path.write_text(f"SECRET_KEY={FIRST_KEY}\nREFRESH_SECRET_KEY=first-refresh\n")
+    return path
+
+
+@pytest.fixture
+def forbid_file_io(monkeypatch):
+    """호출 이후 파일 열기/stat/설정 파싱을 실패시키는 함수를 반환합니다."""
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("file I/O on the request path")
+
+    def forbid() -> None:
+        monkeypatch.setattr(builtins, "open", fail)
+        monkeypatch.setattr(io, "open", fail)
+        monkeypatch.setattr(os, "stat", fail)
+        monkeypatch.setattr(Path, "stat", fail)
+        monkeypatch.setattr(AuthSettings, "__init__", fail)
+
+    return forbid
+
+
+@pytest.fixture
+def provider(env_file, monkeypatch):
+    """dependencies 모듈이 사용하는 전역 provider를 테스트용으로 교체합니다."""
+    provider = AuthSettingsProvider(env_file=env_file)
+    monkeypatch.setattr(dependencies, "auth_settings_provider", provider)
+    return provider
+
+
+class TestGetAuthSettings:
+    """Test cases for get_auth_settings with the shared provider."""
+
+    def test_loads_once_and_reuses_instance(self, provider):
+        """Test that the first call loads and later calls return the same object."""
+        first = dependencies.get_auth_settings()
+        assert first.SECRET_KEY == FIRST_KEY
+        assert dependencies.get_auth_settings() is first
+        assert provider.current is first
+
+    def test_no_file_io_per_request(self, provider, forbid_file_io):
+        """Test that repeated calls neither open, stat nor re-parse settings."""
+        provider.load()
+        forbid_file_io()
+
+        for _ in range(1_000):
+            dependencies.get_auth_settings()
+
+    def test_authenticated_request_without_file_io(self, provider, forbid_file_io):
+        """Test that a full request through get_token_payload touches no files."""
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(
+            user: Annotated[
+                dependencies.AccessTokenPayload, Depends(dependencies.get_current_user)
+            ],
+        ) -> dict[str, str]:
+            return {"sub": user.sub}
+
+        token = create_access_token(provider.load(), "user_1")
+
+        async def call() -> list[httpx.Response]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+                forbid_file_io()
+                headers = {"Authorization": f"Bearer {token}"}
+                return [await c.get("/me", headers=headers) for _ in range(3)]
+
+        for response in asyncio.run(call()):
+            assert response.status_code == 200
+            assert response.json() == {"sub": "user_1"}
+
+
+class TestReload:
+    """Test cases for AuthSettingsProvider.reload."""
+
+    def test_reload_swaps_settings(self, provider, env_file):
+        """Test that reload replaces the current settings with new values."""
+        old = provider.load()
+        env_file.write_text(f"SECRET_KEY={SECOND_KEY}\nREFRESH_SECRET_KEY=r\n")
+
+        assert provider.reload() is True
+        assert provider.current is not old
+        assert provider.current.SECRET_KEY == SECOND_KEY
+        assert old.SECRET_KEY == FIRST_KEY
+
+    def test_invalid_reload_keeps_previous(self, provider, env_file):
+        """Test that a failed reload keeps serving the previous settings."""
+        old = provider.load()
+        env_file.write_text("ACCESS_TOKEN_EXPIRE_MINUTES=30\n")
+
+        assert provider.reload() is False
+        assert provider.current is old
+
+    def test_listeners_receive_new_settings(self, provider):
+        """Test that registered listeners are called once per swap."""
+        received = []
+        provider.add_listener(received.append)
+        provider.add_listener(received.append)
+
+        settings = provider.load()
+
+        assert received == [settings]
+
+    def test_reload_clears_token_cache(self, provider):
+        """Test that enabling the token cache hooks it to settings reloads."""
+        cache = dependencies.enable_token_cache(max_size=10)
+        try:
+            settings = provider.load()
+            token = create_access_token(settings, "user_1")
+            cache.put(token, decode_access_token(settings, token))
+            assert len(cache) == 1
+
+            provider.reload()
+            assert len(cache) == 0
+        finally:
+            dependencies.disable_token_cache()
+
+
+class TestWatch:
+    """Test cases for AuthSettingsProvider.watch."""
+
+    @staticmethod
+    def _write_keys(path: Path, kid: str, mtime: float) -> None:
+        document = {
+            "active_kid": kid,
+            "keys": [{"kid": kid, "alg": "HS256", "secret": f"{kid}-" + "s" * 32}],
+        }
+        path.write_text(json.dumps(document))
+        os.utime(path, (mtime, mtime))
+
+    def test_key_file_change_triggers_reload(self, provider, env_file, tmp_path):
+        """Test that rewriting JWT_KEYS_FILE alone swaps the key ring."""
+        keys_file = tmp_path / "jwt-keys.json"
+        self._write_keys(keys_file, "2024-01", 1_000_000)
+        with env_file.open("a") as f:
+            f.write(f"JWT_KEYS_FILE={keys_file}\n")
+        old = provider.load()
+        assert old.key_ring.kids == ["2024-01"]
+
+        self._write_keys(keys_file, "2024-06", 2_000_000)
+
+        async def watch_briefly() -> None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(provider.watch(interval=0.01), timeout=0.2)
+
+        asyncio.run(watch_briefly())
+        assert provider.current is not old
+        assert provider.current.key_ring.kids == ["2024-06"]
@@ -0,0 +1,128 @@
+"""Tests for templates/backend/auth/token_cache.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/auth/tests/test_token_cache.py --import-mode=importlib
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from backend.auth import token_cache
+from backend.auth.jwt_handler import AuthSettings, create_access_token, decode_access_token
+from backend.auth.token_cache import TokenCache, decode_access_token_cached
+
+SETTINGS = AuthSettings(
+    SECRET_KEY="test-secret-key-0123456789abcdef0123456789abcdef",  # noqa: S106
+    REFRESH_SECRET_KEY="test-refresh-key-0123456789abcdef0123456789ab",  # noqa: S106
+)
+
+
+def _issue(subject: str = "user_1"):
+    token = create_access_token(SETTINGS, subject)
+    return token, decode_access_token(SETTINGS, token)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """token_cache가 읽는 현재 시각을 고정합니다."""
+    now = [0.0]
+    monkeypatch.setattr(token_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+class TestExpiry:
+    """Test cases for expiry at the token exp."""
+
+    def test_entry_expires_at_exp(self, clock):
+        """Test that an entry is served until exp and dropped exactly at exp."""
+        cache = TokenCache()
+        token, payload = _issue()
+        cache.put(token, payload)
+
+        clock[0] = payload.exp_timestamp - 1
+        assert cache.get(token) is payload
+
+        clock[0] = payload.exp_timestamp
+        assert cache.get(token) is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 1
+        assert cache.invalidate_jti(payload.jti) is False
+
+    def test_max_ttl_caps_lifetime(self, clock):
+        """Test that max_ttl_seconds expires entries before exp."""
+        cache = TokenCache(max_ttl_seconds=10)
+        token, payload = _issue()
+        clock[0] = payload.exp_timestamp - 60
+        cache.put(token, payload)
+
+        clock[0] += 9
+        assert cache.get(token) is payload
+        clock[0] += 1
+        assert cache.get(token) is None
+
+
+class TestEviction:
+    """Test cases for LRU eviction."""
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that a get refreshes recency and the oldest untouched entry goes first."""
+        cache = TokenCache(max_size=2)
+        first, first_payload = _issue("user_1")
+        second, second_payload = _issue("user_2")
+        third, third_payload = _issue("user_3")
+
+        cache.put(first, first_payload)
+        cache.put(second, second_payload)
+        assert cache.get(first) is first_payload
+        cache.put(third, third_payload)
+
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is first_payload
+        assert cache.stats.evictions == 1
+        # 제거된 항목은 jti 색인에서도 빠집니다.
+        assert cache.invalidate_jti(second_payload.jti) is False
+
+    def test_rejects_non_positive_size(self):
+        """Test that max_size must be positive."""
+        with pytest.raises(ValueError, match="max_size"):
+            TokenCache(max_size=0)
+
+
+class TestInvalidation:
+    """Test cases for jti-index invalidation."""
+
+    def test_invalidate_jti_removes_entry(self):
+        """Test that invalidating a jti drops the cached payload immediately."""
+        cache = TokenCache()
+        token, payload = _issue()
+        other, other_payload = _issue("user_2")
+        cache.put(token, payload)
+        cache.put(other, other_payload)
+
+        assert cache.invalidate_jti(payload.jti) is True
+        assert cache.invalidate_jti(payload.jti) is False
+        assert cache.get(token) is None
+        assert cache.get(other) is other_payload
+        assert cache.stats.invalidations == 1
+
+    def test_cached_decode_revalidates_after_invalidation(self, monkeypatch):
+        """Test that decode_access_token_cached verifies again after invalidation."""
+        cache = TokenCache()
+        token, _ = _issue()
+        calls = []
+
+        def counting_decode(settings, value):
+            calls.append(value)
+            return decode_access_token(settings, value)
+
+        monkeypatch.setattr(token_cache, "decode_access_token", counting_decode)
+
+        payload = decode_access_token_cached(SETTINGS, token, cache)
+        decode_access_token_cached(SETTINGS, token, cache)
+        assert len(calls) == 1
+
+        cache.invalidate_jti(payload.jti)
+        decode_access_token_cached(SETTINGS, token, cache)
+        assert len(calls) == 2
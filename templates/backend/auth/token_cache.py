@@ -0,0 +1,176 @@
+"""검증된 Access Token 캐시.
+
+같은 토큰이 반복해서 전달될 때 서명 검증, 클레임 파싱, TokenPayload 검증을
+다시 수행하지 않도록 검증 결과를 캐시합니다 (opt-in).
+
+- 키: 토큰 문자열의 BLAKE2b 다이제스트 (토큰 원문은 보관하지 않음)
+- 만료: 토큰의 ``exp`` 이전에 반드시 만료 (``max_ttl_seconds``로 추가 제한 가능)
+- 크기: ``max_size`` 초과 시 LRU 순서로 제거
+- 무효화: ``invalidate_jti``로 해당 jti의 항목 즉시 제거
+
+사용 예시:
+    # main.py (앱 시작 시)
+    from app.core.auth.dependencies import enable_token_cache
+
+    enable_token_cache(max_size=10_000)
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .jwt_handler import AccessTokenPayload, AuthSettings, decode_access_token
+
+
+@dataclass
+class TokenCacheStats:
+    """토큰 캐시 통계."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률 (0.0 ~ 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TokenCache:
+    """크기 제한이 있는 LRU 방식의 검증된 토큰 캐시.
+
+    Args:
+        max_size: 최대 항목 수
+        max_ttl_seconds: 항목 최대 유지 시간 (None이면 토큰 exp까지)
+    """
+
+    def __init__(self, max_size: int = 10_000, max_ttl_seconds: Optional[float] = None):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.max_ttl_seconds = max_ttl_seconds
+        self.stats = TokenCacheStats()
+        self._entries: OrderedDict[bytes, tuple[AccessTokenPayload, float]] = OrderedDict()
+        self._by_jti: dict[str, bytes] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[AccessTokenPayload]:
+        """캐시된 페이로드를 반환합니다 (없거나 만료되면 None).
+
+        Args:
+            token: JWT 문자열
+
+        Returns:
+            TokenPayload/LightTokenPayload 또는 None
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if time.time() >= expires_at:
+            self._remove(key, payload.jti)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return payload
+
+    def put(self, token: str, payload: AccessTokenPayload) -> None:
+        """검증된 페이로드를 저장합니다.
+
+        Args:
+            token: 검증에 성공한 JWT 문자열
+            payload: 검증 결과
+        """
+        expires_at = payload.exp_timestamp
+        if self.max_ttl_seconds is not None:
+            expires_at = min(expires_at, time.time() + self.max_ttl_seconds)
+
+        key = self._key(token)
+        self._entries[key] = (payload, expires_at)
+        self._entries.move_to_end(key)
+        self._by_jti[payload.jti] = key
+
+        while len(self._entries) > self.max_size:
+            _, (old_payload, _) = self._entries.popitem(last=False)
+            self._by_jti.pop(old_payload.jti, None)
+            self.stats.evictions += 1
+
+    def invalidate_jti(self, jti: str) -> bool:
+        """jti에 해당하는 항목을 제거합니다 (토큰 무효화 시 호출).
+
+        Args:
+            jti: 토큰 고유 ID
+
+        Returns:
+            제거 여부
+        """
+        key = self._by_jti.get(jti)
+        if key is None:
+            return False
+        self._remove(key, jti)
+        self.stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다 (키 교체 시 호출)."""
+        self._entries.clear()
+        self._by_jti.clear()
+
+    def _remove(self, key: bytes, jti: str) -> None:
+        self._entries.pop(key, None)
+        if self._by_jti.get(jti) == key:
+            del self._by_jti[jti]
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": self.stats.hit_rate,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "invalidations": self.stats.invalidations,
+        }
+
+
+def decode_access_token_cached(
+    settings: AuthSettings, token: str, cache: TokenCache
+) -> AccessTokenPayload:
+    """캐시를 먼저 조회하고, 없으면 검증 후 캐시에 저장합니다.
+
+    Args:
+        settings: 인증 설정
+        token: JWT 문자열
+        cache: 검증된 토큰 캐시
+
+    Returns:
+        TokenPayload (``TOKEN_PAYLOAD_LIGHTWEIGHT``이면 LightTokenPayload)
+
+    Raises:
+        jwt.ExpiredSignatureError: 토큰 만료
+        jwt.InvalidTokenError: 유효하지 않은 토큰
+    """
+    payload = cache.get(token)
+    if payload is None:
+        payload = decode_access_token(settings, token)
+        cache.put(token, payload)
+    return payload
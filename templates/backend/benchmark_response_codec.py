@@ -0,0 +1,104 @@
+"""응답 포맷별(JSON / MessagePack / CBOR) 크기 및 속도 벤치마크.
+
+표준 페이지네이션 응답과 동일한 구조의 데이터를 각 포맷으로 인코딩/디코딩하여
+본문 크기와 처리 시간을 비교합니다.
+
+사용법:
+    python templates/backend/benchmark_response_codec.py
+    python templates/backend/benchmark_response_codec.py --items 1000 --repeat 200
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from response_codec import (
+    BINARY_MEDIA_TYPES,
+    JSON_MEDIA_TYPE,
+    decode_body,
+    encode_body,
+)
+
+
+def build_envelope(items: int) -> dict[str, Any]:
+    """PaginatedData 응답과 같은 구조의 JSON 호환 dict를 생성합니다."""
+    base = datetime(2024, 1, 15, tzinfo=UTC)
+    return {
+        "success": True,
+        "data": {
+            "items": [
+                {
+                    "id": i,
+                    "email": f"user{i}@example.com",
+                    "name": f"User {i}",
+                    "role": "user",
+                    "is_active": i % 3 != 0,
+                    "score": i * 1.5,
+                    "created_at": (base + timedelta(minutes=i)).isoformat(),
+                    "tags": ["alpha", "beta"] if i % 2 else [],
+                }
+                for i in range(items)
+            ],
+            "pagination": {
+                "total": items * 10,
+                "page": 1,
+                "page_size": items,
+                "total_pages": 10,
+            },
+        },
+        "meta": {"timestamp": base.isoformat(), "request_id": "req_benchmark"},
+    }
+
+
+def run(items: int, repeat: int) -> list[dict[str, Any]]:
+    """포맷별 결과 목록을 반환합니다."""
+    envelope = build_envelope(items)
+    results = []
+    for media_type in (JSON_MEDIA_TYPE, *BINARY_MEDIA_TYPES):
+        body = encode_body(envelope, media_type)
+        if decode_body(body, media_type) != envelope:
+            raise RuntimeError(f"{media_type} round trip changed the envelope")
+        encode_s = timeit.timeit(
+            lambda media_type=media_type: encode_body(envelope, media_type), number=repeat
+        )
+        decode_s = timeit.timeit(
+            lambda body=body, media_type=media_type: decode_body(body, media_type),
+            number=repeat,
+        )
+        results.append(
+            {
+                "format": media_type,
+                "bytes": len(body),
+                "encode_us": encode_s / repeat * 1e6,
+                "decode_us": decode_s / repeat * 1e6,
+            }
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Response codec benchmark")
+    parser.add_argument("--items", type=int, default=100, help="Items per envelope")
+    parser.add_argument("--repeat", type=int, default=500, help="Iterations")
+    args = parser.parse_args()
+
+    if not BINARY_MEDIA_TYPES:
+        sys.stdout.write("msgpack/cbor2 not installed: only JSON will be measured\n")
+
+    results = run(args.items, args.repeat)
+    baseline = results[0]
+    sys.stdout.write(f"items={args.items} repeat={args.repeat}\n")
+    sys.stdout.write(f"{'format':<22}{'bytes':>10}{'size':>8}{'encode µs':>12}{'decode µs':>12}\n")
+    for r in results:
+        sys.stdout.write(
+            f"{r['format']:<22}{r['bytes']:>10}"
+            f"{r['bytes'] / baseline['bytes']:>7.0%} "
+            f"{r['encode_us']:>11.1f} {r['decode_us']:>11.1f}\n"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
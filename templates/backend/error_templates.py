@@ -0,0 +1,167 @@
+"""사전 직렬화된 에러 응답 템플릿.
+
+자주 발생하는 에러(401/403/404 등)는 ErrorResponse 모델 생성과 직렬화 비용이
+요청마다 반복됩니다. 이 모듈은 에러 응답을 시작 시점에 bytes로 미리 렌더링하고,
+요청마다 ``timestamp``와 ``request_id``만 끼워 넣어 응답을 만듭니다.
+
+자세한 내용: docs/api-response-format.md
+
+사용 예시:
+    from src.shared.response import ErrorTemplateException, get_error_template
+
+    # 라우터/의존성에서 (pydantic 작업 없음)
+    raise ErrorTemplateException(get_error_template("NOT_FOUND"))
+
+    # main.py
+    app.add_exception_handler(ErrorTemplateException, error_template_handler)
+"""
+
+import json
+from typing import Optional
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+
+from .request_context import get_request_id, utc_timestamp
+
+
+class PrerenderedError:
+    """미리 직렬화된 에러 응답 템플릿.
+
+    응답 본문은 ``prefix + timestamp + request_id + suffix`` 형태로
+    조립되며, 나머지 필드는 생성 시점에 한 번만 직렬화됩니다.
+    """
+
+    __slots__ = ("_prefix", "_suffix", "code", "headers", "message", "status_code")
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status_code: int,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        self.headers = headers or {}
+        error = json.dumps(
+            {"code": code, "message": message, "details": None},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        self._prefix = ('{"success":false,"error":' + error + ',"meta":{"timestamp":"').encode(
+            "utf-8"
+        )
+        self._suffix = b"}}"
+
+    def render_bytes(self, request_id: Optional[str] = None) -> bytes:
+        """요청별 값만 끼워 넣어 응답 본문을 생성합니다.
+
+        Args:
+            request_id: 요청 추적 ID (생략 시 현재 요청 컨텍스트의 ID)
+
+        Returns:
+            표준 에러 응답 포맷의 JSON bytes
+        """
+        if request_id is None:
+            request_id = get_request_id()
+        rid = b"null" if request_id is None else json.dumps(request_id).encode()
+        return b"".join(
+            (
+                self._prefix,
+                utc_timestamp().encode(),
+                b'","request_id":',
+                rid,
+                self._suffix,
+            )
+        )
+
+    def render(self, request_id: Optional[str] = None) -> Response:
+        """요청별 값만 끼워 넣어 Response를 생성합니다.
+
+        Args:
+            request_id: 요청 추적 ID (생략 시 현재 요청 컨텍스트의 ID)
+
+        Returns:
+            표준 에러 응답 포맷의 Response
+        """
+        return Response(
+            content=self.render_bytes(request_id),
+            status_code=self.status_code,
+            headers=self.headers,
+            media_type="application/json",
+        )
+
+
+class ErrorTemplateException(HTTPException):
+    """사전 렌더링된 에러 응답을 반환하기 위한 예외.
+
+    HTTPException을 상속하므로 핸들러가 등록되지 않은 경우에도
+    FastAPI 기본 처리(status_code + detail)로 동작합니다.
+    """
+
+    def __init__(self, template: PrerenderedError) -> None:
+        super().__init__(
+            status_code=template.status_code,
+            detail=template.message,
+            headers=template.headers or None,
+        )
+        self.template = template
+
+
+# 표준 에러 코드 (docs/api-response-format.md 3. 에러 코드 표준)
+ERROR_TEMPLATES: dict[str, PrerenderedError] = {
+    "VALIDATION_ERROR": PrerenderedError("VALIDATION_ERROR", "입력 검증 실패", 400),
+    "UNAUTHORIZED": PrerenderedError(
+        "UNAUTHORIZED", "인증 실패", 401, headers={"WWW-Authenticate": "Bearer"}
+    ),
+    "FORBIDDEN": PrerenderedError("FORBIDDEN", "권한 없음", 403),
+    "NOT_FOUND": PrerenderedError("NOT_FOUND", "리소스 없음", 404),
+    "CONFLICT": PrerenderedError("CONFLICT", "리소스 충돌", 409),
+    "INTERNAL_ERROR": PrerenderedError("INTERNAL_ERROR", "서버 내부 오류", 500),
+}
+
+
+def get_error_template(code: str) -> PrerenderedError:
+    """표준 에러 코드의 템플릿을 반환합니다.
+
+    Args:
+        code: 에러 코드 (예: "NOT_FOUND")
+
+    Returns:
+        PrerenderedError
+
+    Raises:
+        KeyError: 등록되지 않은 에러 코드
+    """
+    return ERROR_TEMPLATES[code]
+
+
+def register_error_template(
+    code: str,
+    message: str,
+    status_code: int,
+    headers: Optional[dict[str, str]] = None,
+) -> PrerenderedError:
+    """프로젝트 고유 에러 코드를 등록합니다.
+
+    앱 시작 시(모듈 로드 시점)에만 호출하세요.
+
+    Args:
+        code: 에러 코드
+        message: 에러 메시지
+        status_code: HTTP 상태 코드
+        headers: 응답 헤더
+
+    Returns:
+        등록된 PrerenderedError
+    """
+    template = PrerenderedError(code, message, status_code, headers)
+    ERROR_TEMPLATES[code] = template
+    return template
+
+
+async def error_template_handler(_request: Request, exc: ErrorTemplateException) -> Response:
+    """ErrorTemplateException을 사전 렌더링된 응답으로 변환하는 예외 핸들러."""
+    return exc.template.render()
@@ -0,0 +1,394 @@
+"""응답 압축 미들웨어.
+
+Accept-Encoding 협상으로 gzip(기본)과 brotli/zstd(설치된 경우)를 선택하고,
+최소 크기 이상인 응답만 압축합니다. StreamingResponse는 청크 단위로 압축하여
+스트리밍을 유지하며, ETag 또는 ``Cache-Control: immutable`` 응답은 압축 결과를
+캐시하여 재사용합니다.
+
+자세한 내용: docs/api-response-format.md
+
+선택 의존성:
+    pip install brotli zstandard
+    또는
+    uv pip install brotli zstandard
+
+사용 예시:
+    from src.shared.middleware import CompressionMiddleware
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+"""
+
+import hashlib
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+
+# 압축 대상 Content-Type (이미 압축된 이미지/바이너리는 제외)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+)
+
+
+@dataclass
+class CompressionMetrics:
+    """압축 통계.
+
+    ``bytes_saved``로 절감된 전송량을, ``cpu_time_ns``로 압축에 소요된
+    CPU 시간을 확인합니다.
+    """
+
+    responses_compressed: int = 0
+    responses_skipped: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_time_ns: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    by_codec: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def bytes_saved(self) -> int:
+        """압축으로 절감된 바이트 수."""
+        return self.bytes_in - self.bytes_out
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        return {
+            "responses_compressed": self.responses_compressed,
+            "responses_skipped": self.responses_skipped,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_saved,
+            "cpu_seconds": self.cpu_time_ns / 1e9,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "by_codec": dict(self.by_codec),
+        }
+
+
+compression_metrics = CompressionMetrics()
+
+# 압축 결과 캐시 키: (인코딩, 경로, 쿼리 문자열, Content-Type, ETag 또는 본문 해시)
+_CacheKey = tuple[str, str, bytes, str, bytes]
+
+
+class _StreamCompressor(Protocol):
+    def compress(self, chunk: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliStream:
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...]) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩을 선택합니다.
+
+    q 값이 가장 높은 인코딩을 선택하며, 동률이면 ``available`` 순서(서버 선호도)를
+    따릅니다.
+
+    Args:
+        accept_encoding: 요청의 Accept-Encoding 헤더 값
+        available: 서버가 지원하는 인코딩 (선호 순)
+
+    Returns:
+        선택된 인코딩, 없으면 None
+    """
+    prefs: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        prefs[token] = q
+
+    best: Optional[str] = None
+    best_q = 0.0
+    wildcard = prefs.get("*", 0.0)
+    for name in available:
+        q = prefs.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 기반 응답 압축 ASGI 미들웨어.
+
+    Args:
+        app: ASGI 애플리케이션
+        minimum_size: 압축을 적용할 최소 응답 크기 (bytes)
+        gzip_level: gzip 압축 레벨 (1-9)
+        brotli_quality: brotli 품질 (0-11, brotli 설치 시)
+        zstd_level: zstd 압축 레벨 (zstandard 설치 시)
+        cache_size: 압축 결과 캐시 최대 항목 수 (0이면 비활성화)
+        cache_max_body: 캐시할 응답 본문의 최대 크기 (bytes)
+        metrics: 통계 수집 대상 (기본: 모듈 전역 compression_metrics)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        cache_size: int = 256,
+        cache_max_body: int = 1024 * 1024,
+        metrics: CompressionMetrics = compression_metrics,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_size = cache_size
+        self.cache_max_body = cache_max_body
+        self.metrics = metrics
+
+        self._factories: dict[str, Any] = {}
+        if brotli is not None:
+            self._factories["br"] = lambda: _BrotliStream(brotli_quality)
+        if zstandard is not None:
+            self._factories["zstd"] = lambda: _ZstdStream(zstd_level)
+        self._factories["gzip"] = lambda: _GzipStream(gzip_level)
+        self._available = tuple(self._factories)
+
+        self._cache: OrderedDict[_CacheKey, bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self._available
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, scope, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def new_stream(self, encoding: str) -> _StreamCompressor:
+        """인코딩에 맞는 스트리밍 압축기를 생성합니다."""
+        return self._factories[encoding]()
+
+    def cache_get(self, key: _CacheKey) -> Optional[bytes]:
+        """캐시된 압축 결과를 조회합니다 (LRU 갱신)."""
+        body = self._cache.get(key)
+        if body is None:
+            self.metrics.cache_misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.metrics.cache_hits += 1
+        return body
+
+    def cache_put(self, key: _CacheKey, body: bytes) -> None:
+        """압축 결과를 캐시에 저장하고 초과 항목을 제거합니다."""
+        self._cache[key] = body
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+class _CompressionResponder:
+    """단일 요청의 응답 메시지를 가로채 압축합니다."""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: Scope,
+        encoding: str,
+        send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self.send_next = send
+        self.start_message: Optional[Message] = None
+        self.stream: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._flush_start()
+            await self.send_next(message)
+            return
+
+        if self.start_message is not None:
+            await self._first_body(message)
+        elif self.stream is not None:
+            await self._stream_body(message)
+        else:
+            await self.send_next(message)
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self.send_next(self.start_message)
+            self.start_message = None
+
+    def _is_compressible(self, headers: MutableHeaders, body: bytes, more: bool) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if self.start_message is None or self.start_message["status"] in (204, 304):
+            return False
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        if more:
+            length = headers.get("content-length")
+            return length is None or int(length) >= self.middleware.minimum_size
+        return len(body) >= self.middleware.minimum_size
+
+    async def _first_body(self, message: Message) -> None:
+        metrics = self.middleware.metrics
+        start = self.start_message
+        assert start is not None
+        headers = MutableHeaders(scope=start)
+        body: bytes = message.get("body", b"")
+        more: bool = message.get("more_body", False)
+
+        if not self._is_compressible(headers, body, more):
+            metrics.responses_skipped += 1
+            await self._flush_start()
+            await self.send_next(message)
+            return
+
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        metrics.responses_compressed += 1
+        metrics.by_codec[self.encoding] = metrics.by_codec.get(self.encoding, 0) + 1
+
+        if more:
+            del headers["content-length"]
+            self.stream = self.middleware.new_stream(self.encoding)
+            await self._flush_start()
+            await self._stream_body(message)
+            return
+
+        compressed = self._compress_whole(headers, etag, body)
+        headers["content-length"] = str(len(compressed))
+        await self._flush_start()
+        await self.send_next({"type": "http.response.body", "body": compressed})
+
+    def _compress_whole(self, headers: MutableHeaders, etag: Optional[str], body: bytes) -> bytes:
+        middleware = self.middleware
+        metrics = middleware.metrics
+        metrics.bytes_in += len(body)
+
+        key: Optional[_CacheKey] = None
+        if middleware.cache_size and len(body) <= middleware.cache_max_body:
+            # ETag는 표현(Accept 협상 결과)이나 페이지(?cursor=)마다 다르다는
+            # 보장이 없으므로 쿼리 문자열과 Content-Type도 키에 포함합니다.
+            content_type = headers.get("content-type", "")
+            if etag:
+                key = (
+                    self.encoding,
+                    self.scope["path"],
+                    self.scope.get("query_string", b""),
+                    content_type,
+                    etag.encode(),
+                )
+            elif "immutable" in headers.get("cache-control", ""):
+                key = (
+                    self.encoding,
+                    "",
+                    b"",
+                    content_type,
+                    hashlib.blake2b(body, digest_size=16).digest(),
+                )
+
+        if key is not None:
+            cached = middleware.cache_get(key)
+            if cached is not None:
+                metrics.bytes_out += len(cached)
+                return cached
+
+        started = time.thread_time_ns()
+        stream = middleware.new_stream(self.encoding)
+        compressed = stream.compress(body) + stream.finish()
+        metrics.cpu_time_ns += time.thread_time_ns() - started
+        metrics.bytes_out += len(compressed)
+
+        if key is not None:
+            middleware.cache_put(key, compressed)
+        return compressed
+
+    async def _stream_body(self, message: Message) -> None:
+        assert self.stream is not None
+        metrics = self.middleware.metrics
+        body: bytes = message.get("body", b"")
+        more: bool = message.get("more_body", False)
+
+        started = time.thread_time_ns()
+        chunk = self.stream.compress(body) if body else b""
+        if not more:
+            chunk += self.stream.finish()
+        metrics.cpu_time_ns += time.thread_time_ns() - started
+        metrics.bytes_in += len(body)
+        metrics.bytes_out += len(chunk)
+
+        await self.send_next({"type": "http.response.body", "body": chunk, "more_body": more})
@@ -0,0 +1,147 @@
+"""요청 컨텍스트 미들웨어.
+
+요청마다 request_id를 할당(또는 ``X-Request-ID`` 헤더에서 전파)하여 contextvar에
+설정하고, ``server_timing``으로 수집된 단계별 시간을 ``Server-Timing`` 응답 헤더와
+구조화된 로그 한 줄로 내보냅니다.
+
+자세한 내용: docs/api-response-format.md
+
+사용 예시:
+    from src.shared.middleware import RequestContextMiddleware
+
+    app.add_middleware(RequestContextMiddleware, enable_timing=True)
+"""
+
+import json
+import logging
+import re
+import secrets
+from time import perf_counter
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..request_context import accept_var, request_id_var, timings_var
+
+logger = logging.getLogger("app.request")
+
+# 외부에서 전달된 request_id 허용 형식 (헤더/로그 인젝션 방지)
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._:\-]{1,128}")
+
+
+def generate_request_id() -> str:
+    """새 request_id를 생성합니다 (예: "req_3f9a0c...")."""
+    return "req_" + secrets.token_hex(12)
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    """단계별 소요 시간을 Server-Timing 헤더 값으로 변환합니다.
+
+    Args:
+        timings: 단계 이름 → 소요 시간(ms)
+
+    Returns:
+        예: "auth;dur=0.42, query;dur=3.10"
+    """
+    return ", ".join(f"{name};dur={ms:.2f}" for name, ms in timings.items())
+
+
+class RequestContextMiddleware:
+    """request_id 전파 및 Server-Timing 계측 ASGI 미들웨어.
+
+    Args:
+        app: ASGI 애플리케이션
+        header_name: request_id를 주고받을 헤더 이름
+        enable_timing: 단계별 타이밍 수집 여부 (False면 request_id만 설정)
+        log_requests: 요청 완료 시 구조화 로그 출력 여부
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Request-ID",
+        enable_timing: bool = True,
+        log_requests: bool = True,
+    ) -> None:
+        self.app = app
+        self.header_name = header_name
+        self._header_key = header_name.lower().encode("latin-1")
+        self.enable_timing = enable_timing
+        self.log_requests = log_requests
+
+    def _read_headers(self, scope: Scope) -> tuple[Optional[str], Optional[str]]:
+        """요청 헤더에서 (request_id, accept)를 읽습니다."""
+        request_id = None
+        accept = None
+        for key, value in scope["headers"]:
+            if key == self._header_key:
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.fullmatch(candidate):
+                    request_id = candidate
+            elif key == b"accept":
+                accept = value.decode("latin-1")
+        return request_id, accept
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id, accept = self._read_headers(scope)
+        request_id = request_id or generate_request_id()
+        rid_token = request_id_var.set(request_id)
+        accept_token = accept_var.set(accept)
+
+        if not self.enable_timing:
+
+            async def send_with_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message)[self.header_name] = request_id
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_id)
+            finally:
+                accept_var.reset(accept_token)
+                request_id_var.reset(rid_token)
+            return
+
+        timings: dict[str, float] = {}
+        timings_token = timings_var.set(timings)
+        started = perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[self.header_name] = request_id
+                stages = dict(timings)
+                stages["total"] = (perf_counter() - started) * 1000
+                headers.append("Server-Timing", format_server_timing(stages))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            duration_ms = (perf_counter() - started) * 1000
+            timings_var.reset(timings_token)
+            accept_var.reset(accept_token)
+            request_id_var.reset(rid_token)
+            if self.log_requests:
+                logger.info(
+                    json.dumps(
+                        {
+                            "event": "request",
+                            "request_id": request_id,
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status": status_code,
+                            "duration_ms": round(duration_ms, 3),
+                            "timings": {k: round(v, 3) for k, v in timings.items()},
+                        },
+                        ensure_ascii=False,
+                    )
+                )
@@ -0,0 +1,92 @@
+"""요청 컨텍스트 (request_id, 단계별 소요 시간).
+
+RequestContextMiddleware가 요청마다 contextvar를 설정하면, 핸들러가 값을 직접
+전달하지 않아도 응답 헬퍼가 ``meta.request_id``를 채우고 ``server_timing``으로
+측정한 단계별 시간이 ``Server-Timing`` 헤더로 전달됩니다.
+
+자세한 내용: docs/api-response-format.md
+
+사용 예시:
+    with server_timing("query"):
+        rows = await conn.fetch(sql)
+"""
+
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any, Optional
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# 요청의 Accept 헤더 (응답 포맷 협상용, response_codec 참고)
+accept_var: ContextVar[Optional[str]] = ContextVar("accept", default=None)
+
+# 단계별 소요 시간 (ms). 타이밍이 비활성화된 요청에서는 None입니다.
+timings_var: ContextVar[Optional[dict[str, float]]] = ContextVar("server_timings", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    """현재 요청의 추적 ID를 반환합니다 (요청 컨텍스트 밖에서는 None)."""
+    return request_id_var.get()
+
+
+def utc_now() -> datetime:
+    """응답 ``meta.timestamp``에 사용하는 현재 시각 (timezone-aware UTC)."""
+    return datetime.now(UTC)
+
+
+def utc_timestamp() -> str:
+    """현재 UTC 시각을 ResponseMeta 직렬화와 같은 ISO 8601 문자열로 반환합니다.
+
+    사전 렌더링된 에러 응답이나 스트리밍 응답처럼 Pydantic을 거치지 않고
+    ``meta.timestamp``를 직접 쓰는 경로에서 사용합니다.
+    """
+    return utc_now().isoformat().replace("+00:00", "Z")
+
+
+def record_timing(name: str, duration_ms: float) -> None:
+    """단계별 소요 시간을 누적 기록합니다.
+
+    타이밍이 비활성화된 요청에서는 아무 작업도 하지 않습니다.
+
+    Args:
+        name: 단계 이름 (예: "auth", "db_acquire", "query", "serialize")
+        duration_ms: 소요 시간 (밀리초)
+    """
+    timings = timings_var.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + duration_ms
+
+
+class _StageTimer:
+    __slots__ = ("_start", "_timings", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "_StageTimer":
+        self._timings = timings_var.get()
+        if self._timings is not None:
+            self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        timings = self._timings
+        if timings is not None:
+            elapsed = (perf_counter() - self._start) * 1000
+            timings[self.name] = timings.get(self.name, 0.0) + elapsed
+
+
+def server_timing(name: str) -> _StageTimer:
+    """블록의 소요 시간을 ``name`` 단계로 기록하는 컨텍스트 매니저를 반환합니다.
+
+    같은 단계가 여러 번 실행되면 시간이 누적됩니다. 타이밍이 비활성화된
+    요청에서는 contextvar 조회 한 번만 수행합니다.
+
+    Args:
+        name: 단계 이름 (예: "auth", "db_acquire", "query", "serialize")
+
+    Returns:
+        컨텍스트 매니저
+    """
+    return _StageTimer(name)
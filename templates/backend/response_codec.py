@@ -0,0 +1,139 @@
+"""표준 응답 포맷의 바이너리 인코딩 (MessagePack / CBOR).
+
+서비스 간 호출에서 JSON 파싱 비용을 줄이기 위해, 클라이언트가 ``Accept`` 헤더로
+요청한 경우 동일한 응답 구조(success/data/meta)를 MessagePack 또는 CBOR로
+인코딩합니다. 요청하지 않았거나 라이브러리가 없으면 JSON을 사용합니다.
+
+이 모듈은 FastAPI에 의존하지 않으므로 Python 클라이언트에서 ``decode_body``를
+공용 디코더로 그대로 사용할 수 있습니다.
+
+자세한 내용: docs/api-response-format.md
+
+선택 의존성:
+    pip install msgpack cbor2
+    또는
+    uv pip install msgpack cbor2
+
+클라이언트 사용 예시:
+    from response_codec import BINARY_ACCEPT, decode_body
+
+    resp = httpx.get(url, headers={"Accept": BINARY_ACCEPT})
+    envelope = decode_body(resp.content, resp.headers["content-type"])
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - 선택 의존성
+    cbor2 = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+# 관례적으로 쓰이는 별칭
+_ALIASES = {
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    "application/vnd.msgpack": MSGPACK_MEDIA_TYPE,
+}
+
+# 서버가 인코딩할 수 있는 바이너리 포맷 (선호 순)
+BINARY_MEDIA_TYPES: tuple[str, ...] = tuple(
+    media_type
+    for media_type, module in (
+        (MSGPACK_MEDIA_TYPE, msgpack),
+        (CBOR_MEDIA_TYPE, cbor2),
+    )
+    if module is not None
+)
+
+# 서비스 간 클라이언트용 권장 Accept 헤더
+BINARY_ACCEPT = f"{MSGPACK_MEDIA_TYPE}, {CBOR_MEDIA_TYPE};q=0.9, {JSON_MEDIA_TYPE};q=0.5"
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """Accept 헤더에서 응답 포맷을 선택합니다.
+
+    바이너리 포맷은 Accept 헤더에 명시된 경우에만 선택되며(``*/*``로는 선택 안 함),
+    JSON보다 q 값이 낮으면 JSON을 사용합니다.
+
+    Args:
+        accept: 요청의 Accept 헤더 값
+
+    Returns:
+        응답 Content-Type (기본: application/json)
+    """
+    if not accept or not BINARY_MEDIA_TYPES:
+        return JSON_MEDIA_TYPE
+
+    best = JSON_MEDIA_TYPE
+    best_q = -1.0
+    json_q = 0.0
+    for part in accept.split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip().lower()
+        media_type = _ALIASES.get(media_type, media_type)
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_q = max(json_q, q)
+        elif media_type in BINARY_MEDIA_TYPES and q > best_q:
+            best, best_q = media_type, q
+
+    if best_q <= 0 or best_q < json_q:
+        return JSON_MEDIA_TYPE
+    return best
+
+
+def encode_body(content: Any, media_type: str) -> bytes:
+    """JSON 호환 값(``model_dump(mode="json")`` 결과)을 인코딩합니다.
+
+    Args:
+        content: 응답 본문 (dict/list/str/int/float/bool/None)
+        media_type: negotiate_media_type이 반환한 Content-Type
+
+    Returns:
+        인코딩된 bytes
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(content, use_bin_type=True)
+    if media_type == CBOR_MEDIA_TYPE:
+        return cbor2.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def decode_body(body: bytes, content_type: str) -> Any:
+    """응답 본문을 Content-Type에 맞게 디코딩합니다 (Python 클라이언트 공용).
+
+    Args:
+        body: 응답 본문
+        content_type: 응답의 Content-Type 헤더 값
+
+    Returns:
+        디코딩된 응답 (표준 응답 포맷 dict)
+
+    Raises:
+        ValueError: 지원하지 않는 Content-Type
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    media_type = _ALIASES.get(media_type, media_type)
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        return msgpack.unpackb(body, raw=False)
+    if media_type == CBOR_MEDIA_TYPE and cbor2 is not None:
+        return cbor2.loads(body)
+    if media_type == JSON_MEDIA_TYPE or media_type.endswith("+json"):
+        return json.loads(body)
+    raise ValueError(f"Unsupported content type: {content_type}")
@@ -9,14 +9,16 @@ from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
+from .request_context import get_request_id, utc_now
+
 T = TypeVar("T")
 
 
 class ResponseMeta(BaseModel):
     """응답 메타데이터."""
 
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    request_id: Optional[str] = None
+    timestamp: datetime = Field(default_factory=utc_now)
+    request_id: Optional[str] = Field(default_factory=get_request_id)
 
 
 class SuccessResponse(BaseModel, Generic[T]):
@@ -64,3 +66,25 @@ class PaginatedData(BaseModel, Generic[T]):
 
     items: list[T]
     pagination: PaginationInfo
+
+
+class CursorPaginationInfo(BaseModel):
+    """커서(키셋) 기반 페이지네이션 정보.
+
+    ``COUNT(*)`` 없이 ``limit + 1`` 조회 결과만으로 다음 페이지 존재 여부를
+    판단합니다. ``total``은 선택적 추정치이며, 제공된 경우 ``total_is_estimate``로
+    정확도를 구분합니다.
+    """
+
+    next_cursor: Optional[str] = None
+    has_more: bool
+    limit: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+class CursorPaginatedData(BaseModel, Generic[T]):
+    """커서 기반 페이지네이션이 포함된 목록 데이터."""
+
+    items: list[T]
+    pagination: CursorPaginationInfo
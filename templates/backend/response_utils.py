@@ -4,11 +4,27 @@
 자세한 내용: docs/api-response-format.md
 """
 
+import base64
+import binascii
+import json
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from typing import Any, Optional
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic_core import to_json, to_jsonable_python
+from starlette.types import Receive, Scope, Send
 
+from .request_context import accept_var, get_request_id, server_timing, utc_timestamp
+from .response_codec import (
+    BINARY_MEDIA_TYPES,
+    JSON_MEDIA_TYPE,
+    encode_body,
+    negotiate_media_type,
+)
 from .response_schemas import (
+    CursorPaginatedData,
+    CursorPaginationInfo,
     ErrorDetail,
     ErrorInfo,
     ErrorResponse,
@@ -16,30 +32,49 @@ from .response_schemas import (
     SuccessResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+_NO_ITEM = object()
+
+# 바이너리 포맷을 지원하면 Accept에 따라 응답이 달라지므로 캐시에 알립니다.
+_VARY_HEADERS = {"Vary": "Accept"} if BINARY_MEDIA_TYPES else None
+
+
+def _render(content: dict[str, Any], status_code: int) -> Response:
+    """Accept 헤더에 맞는 포맷(JSON/MessagePack/CBOR)으로 응답을 생성합니다."""
+    media_type = negotiate_media_type(accept_var.get())
+    if media_type == JSON_MEDIA_TYPE:
+        return JSONResponse(status_code=status_code, content=content, headers=_VARY_HEADERS)
+    return Response(
+        content=encode_body(content, media_type),
+        status_code=status_code,
+        headers=_VARY_HEADERS,
+        media_type=media_type,
+    )
+
 
 def success_response(
     data: Any,
     status_code: int = 200,
     request_id: Optional[str] = None,
-) -> JSONResponse:
+) -> Response:
     """성공 응답 생성.
 
     Args:
         data: 응답 데이터
         status_code: HTTP 상태 코드 (기본: 200)
-        request_id: 요청 추적 ID
+        request_id: 요청 추적 ID (생략 시 현재 요청 컨텍스트의 ID)
 
     Returns:
-        JSONResponse with standardized success format
+        Response with standardized success format
+        (Accept 헤더에 따라 JSON 또는 MessagePack/CBOR)
     """
-    response = SuccessResponse(
-        data=data,
-        meta=ResponseMeta(request_id=request_id),
-    )
-    return JSONResponse(
-        status_code=status_code,
-        content=response.model_dump(mode="json"),
-    )
+    with server_timing("serialize"):
+        response = SuccessResponse(
+            data=data,
+            meta=ResponseMeta(request_id=request_id or get_request_id()),
+        )
+        return _render(response.model_dump(mode="json"), status_code)
 
 
 def error_response(
@@ -48,7 +83,7 @@ def error_response(
     status_code: int = 400,
     details: Optional[list[ErrorDetail]] = None,
     request_id: Optional[str] = None,
-) -> JSONResponse:
+) -> Response:
     """에러 응답 생성.
 
     Args:
@@ -56,16 +91,251 @@ def error_response(
         message: 에러 메시지
         status_code: HTTP 상태 코드 (기본: 400)
         details: 필드별 검증 오류 목록
-        request_id: 요청 추적 ID
+        request_id: 요청 추적 ID (생략 시 현재 요청 컨텍스트의 ID)
 
     Returns:
-        JSONResponse with standardized error format
+        Response with standardized error format
+        (Accept 헤더에 따라 JSON 또는 MessagePack/CBOR)
     """
     response = ErrorResponse(
         error=ErrorInfo(code=code, message=message, details=details),
-        meta=ResponseMeta(request_id=request_id),
+        meta=ResponseMeta(request_id=request_id or get_request_id()),
+    )
+    return _render(response.model_dump(mode="json"), status_code)
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """키셋 커서 값을 URL-safe 문자열로 인코딩합니다.
+
+    Args:
+        values: 정렬 키 값 (예: {"created_at": ..., "id": 42})
+
+    Returns:
+        URL-safe base64 커서 문자열
+    """
+    raw = json.dumps(to_jsonable_python(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """커서 문자열을 정렬 키 값으로 디코딩합니다.
+
+    datetime 값은 ISO 8601 문자열로 반환되므로 쿼리 파라미터로 사용하기 전에
+    ``datetime.fromisoformat``으로 변환하세요.
+
+    Args:
+        cursor: encode_cursor로 생성된 커서 문자열
+
+    Returns:
+        정렬 키 값 딕셔너리
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않음
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _cursor_value(item: Any, field: str) -> Any:
+    """dict/asyncpg.Record는 키로, 모델 객체는 속성으로 값을 읽습니다."""
+    try:
+        return item[field]
+    except TypeError:
+        return getattr(item, field)
+
+
+def paginated_response(
+    rows: Sequence[Any],
+    *,
+    limit: int,
+    cursor_fields: Sequence[str],
+    total: Optional[int] = None,
+    total_is_estimate: bool = True,
+    status_code: int = 200,
+    request_id: Optional[str] = None,
+) -> Response:
+    """키셋 페이지네이션 응답 생성.
+
+    Repository는 ``LIMIT limit + 1``로 조회한 결과를 그대로 전달합니다.
+    초과 조회된 1건으로 다음 페이지 존재 여부를 판단하므로 ``COUNT(*)``가 필요 없습니다.
+
+    Args:
+        rows: ``limit + 1``건까지 조회한 결과
+        limit: 페이지 크기 (1 이상)
+        cursor_fields: 정렬 키 컬럼 (ORDER BY 순서와 동일, 예: ("created_at", "id"))
+        total: 전체 건수, 없으면 생략
+        total_is_estimate: ``total``이 추정치(예: pg_class.reltuples)인지 여부
+            (정확한 COUNT 결과면 False)
+        status_code: HTTP 상태 코드 (기본: 200)
+        request_id: 요청 추적 ID
+
+    Returns:
+        Response with standardized cursor pagination format
+
+    Raises:
+        ValueError: limit이 1보다 작음
+
+    사용 예시:
+        @router.get("/events")
+        async def list_events(cursor: str | None = None, limit: int = 20):
+            try:
+                after = decode_cursor(cursor) if cursor else None
+            except ValueError:
+                return error_response(
+                    "VALIDATION_ERROR", "잘못된 커서입니다", status_code=400
+                )
+            rows = await event_repository.find_page(after, limit + 1)
+            return paginated_response(
+                rows, limit=limit, cursor_fields=("created_at", "id")
+            )
+    """
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    has_more = len(rows) > limit
+    items = list(rows[:limit])
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor({field: _cursor_value(last, field) for field in cursor_fields})
+
+    return success_response(
+        CursorPaginatedData(
+            items=items,
+            pagination=CursorPaginationInfo(
+                next_cursor=next_cursor,
+                has_more=has_more,
+                limit=limit,
+                total=total,
+                total_is_estimate=total is not None and total_is_estimate,
+            ),
+        ),
+        status_code=status_code,
+        request_id=request_id,
     )
-    return JSONResponse(
+
+
+def _item_fallback(value: Any) -> Any:
+    """asyncpg.Record 등 매핑 형태 객체를 dict로 변환합니다."""
+    return dict(value)
+
+
+def _dump_item(item: Any) -> bytes:
+    return to_json(item, fallback=_item_fallback)
+
+
+async def _aclose(items: AsyncIterable[Any]) -> None:
+    """비동기 제너레이터 등 ``aclose()``를 지원하는 원본을 닫습니다."""
+    aclose = getattr(items, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _stream_envelope(
+    first: Any,
+    items: AsyncIterator[Any],
+    request_id: Optional[str],
+    buffer_size: int,
+) -> AsyncIterator[bytes]:
+    buffer = bytearray(b'{"data":[')
+    success = True
+    try:
+        if first is not _NO_ITEM:
+            buffer += _dump_item(first)
+            async for item in items:
+                if len(buffer) >= buffer_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+                buffer += b","
+                buffer += _dump_item(item)
+    except Exception:
+        logger.exception("Streaming response aborted (request_id=%s)", request_id)
+        success = False
+    finally:
+        # 원본(예: 커서를 연 DB 커넥션)을 마지막 청크 전송 전에 반환합니다.
+        await _aclose(items)
+
+    tail: dict[str, Any] = {"success": success}
+    if not success:
+        tail["error"] = {
+            "code": "INTERNAL_ERROR",
+            "message": "응답 생성 중 오류가 발생했습니다",
+            "details": None,
+        }
+    tail["meta"] = {
+        "timestamp": utc_timestamp(),
+        "request_id": request_id,
+    }
+    buffer += b"],"
+    buffer += json.dumps(tail, ensure_ascii=False, separators=(",", ":"))[1:].encode()
+    yield bytes(buffer)
+
+
+class _EnvelopeStreamingResponse(StreamingResponse):
+    """전송이 중단되어도 항목 원본을 닫는 StreamingResponse.
+
+    클라이언트 연결이 끊기면 Starlette는 본문 이터레이터를 닫지 않고 버리므로,
+    원본 제너레이터가 잡고 있는 DB 커넥션이 GC 시점까지 반환되지 않습니다.
+    """
+
+    def __init__(
+        self, content: AsyncIterator[bytes], source: AsyncIterator[Any], **kwargs: Any
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self._source = source
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await _aclose(self.body_iterator)
+            await _aclose(self._source)
+
+
+async def streaming_success_response(
+    items: AsyncIterable[Any],
+    status_code: int = 200,
+    request_id: Optional[str] = None,
+    buffer_size: int = 64 * 1024,
+) -> StreamingResponse:
+    """대용량 목록을 표준 성공 응답 포맷으로 스트리밍합니다.
+
+    항목을 하나씩 직렬화하여 ``buffer_size`` 단위로 전송하므로 메모리 사용량이
+    결과 건수와 무관하게 일정합니다. ``success``는 모든 항목을 전송한 뒤에
+    기록되므로, 전송 도중 오류가 발생하면 배열을 닫고 ``"success": false``와
+    ``error``를 포함한 유효한 JSON으로 응답을 마무리합니다.
+    첫 항목을 가져오는 중 발생한 오류는 응답 시작 전이므로 그대로 전파됩니다.
+    전송이 끝나거나 클라이언트 연결이 끊기면 ``items``의 ``aclose()``를 호출하여
+    원본이 잡고 있는 리소스를 즉시 반환합니다.
+
+    Args:
+        items: 응답 항목 비동기 이터레이터 (dict, Pydantic 모델, asyncpg.Record 등)
+        status_code: HTTP 상태 코드 (기본: 200)
+        request_id: 요청 추적 ID (생략 시 현재 요청 컨텍스트의 ID)
+        buffer_size: 전송 단위 버퍼 크기 (bytes)
+
+    Returns:
+        StreamingResponse with standardized success format
+
+    사용 예시:
+        @router.get("/events/export")
+        async def export_events():
+            return await streaming_success_response(event_repository.iter_all())
+    """
+    iterator = aiter(items)
+    try:
+        first = await anext(iterator)
+    except StopAsyncIteration:
+        first = _NO_ITEM
+
+    return _EnvelopeStreamingResponse(
+        _stream_envelope(first, iterator, request_id or get_request_id(), buffer_size),
+        iterator,
         status_code=status_code,
-        content=response.model_dump(mode="json"),
+        media_type="application/json",
     )
@@ -0,0 +1,75 @@
+"""Tests for templates/backend/middleware/compression.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/tests/test_compression.py --import-mode=importlib
+"""
+
+import asyncio
+
+import httpx
+from backend.middleware.compression import CompressionMetrics, CompressionMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+ETAG = '"v1"'
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    """같은 ETag로 Accept와 쿼리 문자열에 따라 다른 본문을 반환합니다."""
+    request = Request(scope, receive)
+    media_type = request.headers.get("accept", "application/json")
+    marker = f"{media_type}|{request.url.query}|".encode()
+    response = Response(
+        content=marker * 200,
+        media_type=media_type,
+        headers={"ETag": ETAG, "Vary": "Accept"},
+    )
+    await response(scope, receive, send)
+
+
+def _get_all(requests: list[tuple[str, str]]) -> tuple[list[httpx.Response], CompressionMetrics]:
+    metrics = CompressionMetrics()
+    app = CompressionMiddleware(_app, minimum_size=0, metrics=metrics)
+
+    async def call() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return [
+                await c.get(url, headers={"Accept": accept, "Accept-Encoding": "gzip"})
+                for url, accept in requests
+            ]
+
+    return asyncio.run(call()), metrics
+
+
+class TestCompressionCache:
+    """Test cases for the compressed body cache."""
+
+    def test_representations_sharing_etag(self):
+        """Test that two representations sharing an ETag are cached separately."""
+        responses, metrics = _get_all(
+            [
+                ("/items", "application/json"),
+                ("/items", "text/plain"),
+                ("/items", "application/json"),
+            ]
+        )
+        assert all(r.headers["content-encoding"] == "gzip" for r in responses)
+        assert responses[0].content.startswith(b"application/json||")
+        assert responses[1].content.startswith(b"text/plain||")
+        assert responses[2].content == responses[0].content
+        assert (metrics.cache_hits, metrics.cache_misses) == (1, 2)
+
+    def test_pages_sharing_etag(self):
+        """Test that pages that differ only by query string are cached separately."""
+        responses, metrics = _get_all(
+            [
+                ("/items?cursor=a", "application/json"),
+                ("/items?cursor=b", "application/json"),
+            ]
+        )
+        assert responses[0].content.startswith(b"application/json|cursor=a|")
+        assert responses[1].content.startswith(b"application/json|cursor=b|")
+        assert metrics.cache_hits == 0
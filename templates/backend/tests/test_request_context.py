@@ -0,0 +1,122 @@
+"""Tests for templates/backend/middleware/request_context.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/tests/test_request_context.py --import-mode=importlib
+"""
+
+import asyncio
+import contextlib
+from typing import Optional
+
+import httpx
+import pytest
+from backend.middleware.request_context import RequestContextMiddleware
+from backend.request_context import (
+    accept_var,
+    get_request_id,
+    request_id_var,
+    server_timing,
+    timings_var,
+)
+from backend.response_utils import success_response
+from fastapi import FastAPI
+from starlette.types import Message, Receive, Scope, Send
+
+
+def _build_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, log_requests=False, **options)
+
+    @app.get("/items")
+    async def items():
+        with server_timing("query"):
+            await asyncio.sleep(0)
+        return success_response({"accept": accept_var.get()})
+
+    return app
+
+
+def _get(app: FastAPI, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+    async def call() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get("/items", headers=headers)
+
+    return asyncio.run(call())
+
+
+class TestRequestIdPropagation:
+    """Test cases for request_id propagation."""
+
+    def test_valid_header_is_echoed(self):
+        """Test that a well-formed incoming request id is reused everywhere."""
+        response = _get(_build_app(), {"X-Request-ID": "upstream-123"})
+        assert response.headers["X-Request-ID"] == "upstream-123"
+        assert response.json()["meta"]["request_id"] == "upstream-123"
+
+    @pytest.mark.parametrize("incoming", ["has space", "x" * 129, 'quote"d'])
+    def test_invalid_header_is_replaced(self, incoming):
+        """Test that a malformed request id is replaced with a generated one."""
+        response = _get(_build_app(), {"X-Request-ID": incoming})
+        request_id = response.headers["X-Request-ID"]
+        assert request_id.startswith("req_")
+        assert response.json()["meta"]["request_id"] == request_id
+
+    def test_generated_without_header(self):
+        """Test that a request id is generated when the client sends none."""
+        response = _get(_build_app(enable_timing=False))
+        assert response.headers["X-Request-ID"].startswith("req_")
+        assert "Server-Timing" not in response.headers
+
+
+class TestServerTiming:
+    """Test cases for the Server-Timing header."""
+
+    def test_stages_and_total(self):
+        """Test that recorded stages and the total are reported."""
+        header = _get(_build_app()).headers["Server-Timing"]
+        names = [part.split(";")[0].strip() for part in header.split(",")]
+        assert names == ["query", "serialize", "total"]
+        assert all(";dur=" in part for part in header.split(","))
+
+
+class TestContextReset:
+    """Test cases for contextvar cleanup."""
+
+    @pytest.mark.parametrize("enable_timing", [True, False])
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_vars_reset_after_request(self, enable_timing, fail):
+        """Test that request_id, accept and timings are reset even when the app raises."""
+        seen: dict[str, Optional[str]] = {}
+
+        async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+            seen["request_id"] = get_request_id()
+            seen["accept"] = accept_var.get()
+            if fail:
+                raise RuntimeError("boom")
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = RequestContextMiddleware(app, enable_timing=enable_timing, log_requests=False)
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"accept", b"application/msgpack")],
+        }
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b""}
+
+        async def send(message: Message) -> None:
+            pass
+
+        async def run() -> tuple[Optional[str], Optional[str], Optional[dict]]:
+            with contextlib.suppress(RuntimeError):
+                await middleware(scope, receive, send)
+            return request_id_var.get(), accept_var.get(), timings_var.get()
+
+        assert asyncio.run(run()) == (None, None, None)
+        assert seen["accept"] == "application/msgpack"
+        assert seen["request_id"].startswith("req_")
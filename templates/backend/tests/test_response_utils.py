@@ -0,0 +1,160 @@
+"""Tests for templates/backend/response_utils.py
+
+사용법 (templates 디렉토리에서 실행):
+    cd templates
+    python -m pytest backend/tests/test_response_utils.py --import-mode=importlib
+"""
+
+import asyncio
+import contextlib
+import json
+from datetime import UTC, datetime
+
+import pytest
+from backend.error_templates import get_error_template
+from backend.response_utils import (
+    decode_cursor,
+    paginated_response,
+    streaming_success_response,
+    success_response,
+)
+from starlette.requests import ClientDisconnect
+
+ROWS = [{"id": i, "name": f"item-{i}"} for i in range(1, 4)]
+
+
+def _pagination(response) -> dict:
+    return json.loads(response.body)["data"]["pagination"]
+
+
+async def _items(values):
+    for value in values:
+        yield value
+
+
+def _stream_body(items) -> bytes:
+    async def collect() -> bytes:
+        response = await streaming_success_response(items)
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+class TestPaginatedResponse:
+    """Test cases for paginated_response."""
+
+    def test_has_more_from_extra_row(self):
+        """Test that the extra row sets has_more and the cursor of the last item."""
+        pagination = _pagination(paginated_response(ROWS, limit=2, cursor_fields=("id",)))
+        assert pagination["has_more"] is True
+        assert decode_cursor(pagination["next_cursor"]) == {"id": 2}
+
+        pagination = _pagination(paginated_response(ROWS, limit=3, cursor_fields=("id",)))
+        assert pagination["has_more"] is False
+        assert pagination["next_cursor"] is None
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_rejects_non_positive_limit(self, limit):
+        """Test that a limit below 1 is rejected instead of paging nonsense."""
+        with pytest.raises(ValueError, match="limit"):
+            paginated_response(ROWS, limit=limit, cursor_fields=("id",))
+
+    def test_total_estimate_flag(self):
+        """Test that an exact total can be reported as exact."""
+        estimated = _pagination(
+            paginated_response(ROWS, limit=2, cursor_fields=("id",), total=1_000)
+        )
+        exact = _pagination(
+            paginated_response(
+                ROWS, limit=2, cursor_fields=("id",), total=3, total_is_estimate=False
+            )
+        )
+        omitted = _pagination(paginated_response(ROWS, limit=2, cursor_fields=("id",)))
+
+        assert (estimated["total"], estimated["total_is_estimate"]) == (1_000, True)
+        assert (exact["total"], exact["total_is_estimate"]) == (3, False)
+        assert (omitted["total"], omitted["total_is_estimate"]) == (None, False)
+
+    def test_options_are_keyword_only(self):
+        """Test that everything after rows must be passed by keyword."""
+        with pytest.raises(TypeError):
+            paginated_response(ROWS, 2, ("id",))  # type: ignore[misc]
+
+    def test_tampered_cursor_raises_value_error(self):
+        """Test that decode_cursor signals a bad cursor with ValueError (mapped to 400)."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor!")
+
+
+class TestTimestamps:
+    """Test cases for meta.timestamp across response paths."""
+
+    def test_all_paths_share_utc_format(self):
+        """Test that model, prerendered and streamed responses emit the same UTC format."""
+        bodies = [
+            json.loads(success_response({"ok": True}).body),
+            json.loads(get_error_template("NOT_FOUND").render_bytes()),
+            json.loads(_stream_body(_items([1, 2]))),
+        ]
+        for body in bodies:
+            timestamp = body["meta"]["timestamp"]
+            assert timestamp.endswith("Z")
+            parsed = datetime.fromisoformat(timestamp)
+            assert parsed.tzinfo is not None
+            assert abs((datetime.now(UTC) - parsed).total_seconds()) < 60
+
+
+class TestStreamingSuccessResponse:
+    """Test cases for streaming_success_response."""
+
+    @staticmethod
+    def _source(closed: list[bool]):
+        async def rows():
+            try:
+                for i in range(100):
+                    yield {"id": i}
+            finally:
+                closed.append(True)
+
+        return rows()
+
+    def test_completed_stream_closes_source(self):
+        """Test that the source is closed once every item is sent."""
+        closed: list[bool] = []
+
+        async def run() -> tuple[bytes, list[bool]]:
+            response = await streaming_success_response(self._source(closed))
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            return body, list(closed)
+
+        body, closed_before_exit = asyncio.run(run())
+        assert len(json.loads(body)["data"]) == 100
+        assert closed_before_exit == [True]
+
+    @pytest.mark.parametrize("spec_version", ["2.0", "2.4"])
+    def test_client_disconnect_closes_source(self, spec_version):
+        """Test that a client disconnect mid-stream closes the source."""
+        closed: list[bool] = []
+        scope = {"type": "http", "asgi": {"spec_version": spec_version}}
+        sent: list[dict] = []
+
+        async def receive():
+            await asyncio.sleep(0.01)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body":
+                if spec_version == "2.4":
+                    raise OSError("connection reset")
+                await asyncio.sleep(1)
+
+        async def run() -> list[bool]:
+            response = await streaming_success_response(self._source(closed), buffer_size=1)
+            with contextlib.suppress(ClientDisconnect):
+                await response(scope, receive, send)
+            # asyncio.run 종료 시의 제너레이터 정리 전에 확인합니다.
+            return list(closed)
+
+        assert asyncio.run(run()) == [True]
+        assert not any(m.get("more_body") is False for m in sent)